@@ -0,0 +1,7 @@
+"""
+Verifly SDK benchmarks
+
+Run ``python -m benchmarks`` from the repository root. Results are
+written as JSON so runs can be compared across versions with
+``python -m benchmarks.compare baseline.json current.json``.
+"""
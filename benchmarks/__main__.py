@@ -0,0 +1,42 @@
+"""
+Run the benchmark suite
+
+Usage:
+    python -m benchmarks [--quick] [--only micro|e2e] [--output results.json]
+"""
+
+import argparse
+import sys
+
+from . import e2e, micro
+from .common import key, write_report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--quick', action='store_true', help='shorter runs for a smoke check')
+    parser.add_argument('--only', choices=('micro', 'e2e'), help='run one group of benchmarks')
+    parser.add_argument('--output', '-o', help='write JSON results to this file')
+    args = parser.parse_args()
+
+    results = []
+    if args.only in (None, 'micro'):
+        results += micro.run(min_time=0.05 if args.quick else 0.5)
+    if args.only in (None, 'e2e'):
+        results += e2e.run(requests=200 if args.quick else 2000)
+
+    text = write_report(results, args.output)
+    if args.output:
+        for record in results:
+            metrics = record['metrics']
+            headline = (
+                f"{metrics['ops_per_sec']:,.0f} ops/s" if 'ops_per_sec' in metrics
+                else f"{metrics['throughput_rps']:,.0f} req/s, p99 {metrics['p99_ms']:.2f}ms"
+            )
+            print(f'{key(record):60} {headline}', file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
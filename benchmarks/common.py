@@ -0,0 +1,99 @@
+"""
+Timing helpers and result schema shared by the benchmarks
+"""
+
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import verifly
+
+# Payload sizes in bytes, up to the 100KB custom data limit
+PAYLOAD_SIZES = (0, 1024, 10 * 1024, 100 * 1024)
+
+
+def make_payload(size: int) -> Dict[str, Any]:
+    """Build a create() payload whose custom data is about ``size`` bytes"""
+    payload = {'phone': '5551234567', 'methods': ['sms', 'whatsapp']}
+    if size:
+        payload['data'] = {'blob': 'x' * size}
+    return payload
+
+
+def measure(fn: Callable[[], Any], min_time: float = 0.5, repeat: int = 3) -> Dict[str, float]:
+    """
+    Time a callable, timeit-style
+
+    The loop count is calibrated so each of ``repeat`` runs lasts at
+    least ``min_time`` seconds; the fastest run is reported.
+
+    Returns:
+        Dict with ops_per_sec and mean_us
+    """
+    def run(number: int) -> float:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        return time.perf_counter() - started
+
+    number = 1
+    elapsed = run(number)
+    while elapsed < min_time / 5:
+        number *= 10
+        elapsed = run(number)
+    number = max(1, int(number * min_time / elapsed))
+
+    best = min(run(number) for _ in range(repeat)) / number
+    return {'ops_per_sec': 1.0 / best, 'mean_us': best * 1e6}
+
+
+def percentiles(samples: Sequence[float], points: Sequence[float] = (50, 90, 99)) -> Dict[str, float]:
+    """Latency percentiles in milliseconds, e.g. {'p50_ms': ...}"""
+    ordered = sorted(samples)
+    if not ordered:
+        return {f'p{p:g}_ms': 0.0 for p in points}
+    result = {}
+    for point in points:
+        index = min(len(ordered) - 1, int(round(point / 100.0 * (len(ordered) - 1))))
+        result[f'p{point:g}_ms'] = ordered[index] * 1000
+    return result
+
+
+def result(group: str, name: str, params: Optional[Dict[str, Any]] = None, **metrics: Any) -> Dict[str, Any]:
+    """Build one result record"""
+    return {'group': group, 'name': name, 'params': params or {}, 'metrics': metrics}
+
+
+def metadata() -> Dict[str, Any]:
+    """Environment details recorded with every run"""
+    try:
+        import orjson  # noqa: F401
+        has_orjson = True
+    except ImportError:
+        has_orjson = False
+    return {
+        'sdk_version': verifly.__version__,
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'orjson': has_orjson,
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def write_report(results: List[Dict[str, Any]], path: Optional[str]) -> str:
+    """Serialize results with metadata; write to ``path`` if given"""
+    text = json.dumps({'meta': metadata(), 'results': results}, indent=2)
+    if path:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    return text
+
+
+def key(record: Dict[str, Any]) -> str:
+    """Stable identifier of a result, used to match records across runs"""
+    params = ','.join(f'{k}={v}' for k, v in sorted(record['params'].items()))
+    return f"{record['group']}.{record['name']}[{params}]"
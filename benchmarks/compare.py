@@ -0,0 +1,61 @@
+"""
+Compare two benchmark result files
+
+Usage:
+    python -m benchmarks.compare baseline.json current.json [--threshold 0.1]
+
+Exits with status 1 if any benchmark regressed by more than the
+threshold (default 10%).
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, Optional, Tuple
+
+from .common import key
+
+
+def _headline(record: Dict[str, Any]) -> Optional[Tuple[str, float]]:
+    """Higher-is-better metric of a record"""
+    metrics = record['metrics']
+    for name in ('ops_per_sec', 'throughput_rps'):
+        if name in metrics:
+            return name, metrics[name]
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.compare')
+    parser.add_argument('baseline')
+    parser.add_argument('current')
+    parser.add_argument('--threshold', type=float, default=0.1, help='allowed slowdown (default: 0.1)')
+    args = parser.parse_args()
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = {key(r): r for r in json.load(f)['results']}
+    with open(args.current, encoding='utf-8') as f:
+        current = json.load(f)['results']
+
+    regressed = False
+    for record in current:
+        before = baseline.get(key(record))
+        after = _headline(record)
+        if before is None or after is None:
+            continue
+        metric, value = after
+        previous = before['metrics'].get(metric)
+        if not previous:
+            continue
+        change = value / previous - 1
+        flag = ''
+        if change < -args.threshold:
+            flag = '  REGRESSION'
+            regressed = True
+        print(f'{key(record):60} {previous:>14,.0f} -> {value:>14,.0f} {metric:15} {change:+7.1%}{flag}')
+
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == '__main__':
+    main()
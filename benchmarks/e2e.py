@@ -0,0 +1,105 @@
+"""
+End-to-end benchmarks against a local MockVerifly server
+
+Measures latency percentiles and throughput of ``create`` and ``get``
+for the sync client (thread pool) and the async client (tasks) at
+several concurrency levels. The mock server adds no latency, so the
+numbers reflect SDK and loopback overhead.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Sequence
+
+from verifly import RetryPolicy
+from verifly.testing import MockVerifly
+
+from .common import percentiles, result
+
+SYNC_CONCURRENCY = (1, 8, 32)
+ASYNC_CONCURRENCY = (1, 32, 128)
+
+
+def _summary(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    stats = percentiles(latencies)
+    stats['requests'] = len(latencies)
+    stats['throughput_rps'] = len(latencies) / elapsed if elapsed else 0.0
+    return stats
+
+
+def _timed(fn: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def bench_sync(mock: MockVerifly, requests: int, levels: Sequence[int]) -> List[Dict[str, Any]]:
+    """Sync client driven by a thread pool"""
+    results = []
+    for concurrency in levels:
+        with mock.client(pool_size=concurrency, retry=RetryPolicy.disabled()) as client:
+            verification = client.verification
+            session_id = verification.create(phone='5551234567', methods=['sms'])['sessionId']
+            operations = {
+                'create': lambda: verification.create(phone='5551234567', methods=['sms']),
+                'get': lambda: verification.get(session_id),
+            }
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                for name, operation in operations.items():
+                    started = time.perf_counter()
+                    latencies = list(executor.map(lambda _: _timed(operation), range(requests)))
+                    elapsed = time.perf_counter() - started
+                    results.append(result(
+                        'e2e_sync', name, {'concurrency': concurrency}, **_summary(latencies, elapsed)
+                    ))
+    return results
+
+
+async def _bench_async(mock: MockVerifly, requests: int, levels: Sequence[int]) -> List[Dict[str, Any]]:
+    results = []
+    for concurrency in levels:
+        client = mock.async_client(max_connections=concurrency, retry=RetryPolicy.disabled())
+        verification = client.verification
+        session_id = (await verification.create(phone='5551234567', methods=['sms']))['sessionId']
+        operations = {
+            'create': lambda: verification.create(phone='5551234567', methods=['sms']),
+            'get': lambda: verification.get(session_id),
+        }
+        semaphore = asyncio.Semaphore(concurrency)
+
+        for name, operation in operations.items():
+            async def timed() -> float:
+                async with semaphore:
+                    started = time.perf_counter()
+                    await operation()
+                    return time.perf_counter() - started
+
+            started = time.perf_counter()
+            latencies = await asyncio.gather(*(timed() for _ in range(requests)))
+            elapsed = time.perf_counter() - started
+            results.append(result(
+                'e2e_async', name, {'concurrency': concurrency}, **_summary(list(latencies), elapsed)
+            ))
+        await client.close()
+    return results
+
+
+def bench_async(mock: MockVerifly, requests: int, levels: Sequence[int]) -> List[Dict[str, Any]]:
+    """Async client driven by semaphore-bounded tasks (requires aiohttp)"""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(_bench_async(mock, requests, levels))
+    finally:
+        loop.close()
+
+
+def run(requests: int = 2000) -> List[Dict[str, Any]]:
+    """Run all end-to-end benchmarks against a fresh mock server"""
+    with MockVerifly(balance=float('inf')) as mock:
+        results = bench_sync(mock, requests, SYNC_CONCURRENCY)
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            return results
+        return results + bench_async(mock, requests, ASYNC_CONCURRENCY)
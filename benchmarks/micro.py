@@ -0,0 +1,71 @@
+"""
+Micro-benchmarks: signing, webhook verification and serialization
+"""
+
+import json
+import time
+from typing import Any, Dict, List
+
+from verifly.resources.webhook import Webhook
+from verifly.utils.request import RequestHandler
+from verifly.utils.serializer import json_serializer, orjson_serializer
+
+from .common import PAYLOAD_SIZES, make_payload, measure, result
+
+SECRET_KEY = 'benchmark-secret-key'
+
+
+def bench_signing(min_time: float) -> List[Dict[str, Any]]:
+    """RequestHandler._generate_signature across payload sizes"""
+    handler = RequestHandler('benchmark-api-key', SECRET_KEY)
+    timestamp = str(int(time.time()))
+    results = []
+    for size in PAYLOAD_SIZES:
+        body = json_serializer(make_payload(size))
+        stats = measure(lambda: handler._generate_signature(body, timestamp), min_time)
+        results.append(result('signing', 'generate_signature', {'size': size, 'bytes': len(body)}, **stats))
+    handler.close()
+    return results
+
+
+def bench_webhooks(min_time: float) -> List[Dict[str, Any]]:
+    """Webhook.verify (parsed dict) and verify_raw (raw bytes) across payload sizes"""
+    webhook = Webhook(SECRET_KEY, tolerance=None)
+    timestamp = str(int(time.time()))
+    results = []
+    for size in PAYLOAD_SIZES:
+        event = {'event': 'verification.completed', 'data': make_payload(size)}
+        body = json.dumps(event, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        signature = webhook.signer.sign(body, timestamp)
+        params = {'size': size, 'bytes': len(body)}
+
+        stats = measure(lambda: webhook.verify(event, signature, timestamp), min_time)
+        results.append(result('webhook', 'verify', params, **stats))
+        stats = measure(lambda: webhook.verify_raw(body, signature, timestamp), min_time)
+        results.append(result('webhook', 'verify_raw', params, **stats))
+        stats = measure(lambda: webhook.construct_event_from_bytes(body, signature, timestamp), min_time)
+        results.append(result('webhook', 'construct_event_from_bytes', params, **stats))
+    return results
+
+
+def bench_serialization(min_time: float) -> List[Dict[str, Any]]:
+    """JSON encoding of request bodies with each available serializer"""
+    serializers = [('json', json_serializer)]
+    try:
+        import orjson  # noqa: F401
+        serializers.append(('orjson', orjson_serializer))
+    except ImportError:
+        pass
+
+    results = []
+    for size in PAYLOAD_SIZES:
+        payload = make_payload(size)
+        for name, serializer in serializers:
+            stats = measure(lambda: serializer(payload), min_time)
+            results.append(result('serialize', name, {'size': size}, **stats))
+    return results
+
+
+def run(min_time: float = 0.5) -> List[Dict[str, Any]]:
+    """Run all micro-benchmarks"""
+    return bench_signing(min_time) + bench_webhooks(min_time) + bench_serialization(min_time)
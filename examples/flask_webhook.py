@@ -3,7 +3,7 @@ Flask Webhook Example
 """
 
 from flask import Flask, request, jsonify
-from verifly import Verifly
+from verifly import Verifly, WebhookDispatcher
 
 app = Flask(__name__)
 
@@ -13,6 +13,27 @@ verifly = Verifly(
     secret_key='your-secret-key'
 )
 
+# Handlers run on a worker pool after the delivery has been acknowledged
+dispatcher = WebhookDispatcher(verifly.webhook, workers=4, queue_size=1000)
+
+@dispatcher.on('verification.completed')
+def verification_completed(event):
+    data = event.get('data', {})
+    print(f"  Session {data.get('sessionId')} verified via {data.get('method')}")
+    
+    # Your business logic here
+    # e.g., update user record, grant access, etc.
+
+@dispatcher.on('verification.failed')
+def verification_failed(event):
+    data = event.get('data', {})
+    print(f"  Session {data.get('sessionId')} failed: {data.get('reason')}")
+
+@dispatcher.on('verification.expired')
+def verification_expired(event):
+    data = event.get('data', {})
+    print(f"  Session {data.get('sessionId')} expired")
+
 @app.route('/webhook/verifly', methods=['POST'])
 def verifly_webhook():
     """Handle Verifly webhook"""
@@ -24,40 +45,10 @@ def verifly_webhook():
     if not signature or not timestamp:
         return jsonify({'error': 'Missing signature headers'}), 400
     
-    # Get payload
-    payload = request.get_json()
-    
-    # Verify signature
-    try:
-        event = verifly.webhook.construct_event(payload, signature, timestamp)
-    except ValueError as e:
-        print(f"❌ Invalid webhook signature: {e}")
-        return jsonify({'error': 'Invalid signature'}), 401
-    
-    # Process webhook event
-    event_type = event.get('event')
-    data = event.get('data', {})
-    
-    print(f"✅ Webhook received: {event_type}")
-    
-    if event_type == 'verification.completed':
-        session_id = data.get('sessionId')
-        method = data.get('method')
-        print(f"  Session {session_id} verified via {method}")
-        
-        # Your business logic here
-        # e.g., update user record, grant access, etc.
-        
-    elif event_type == 'verification.failed':
-        session_id = data.get('sessionId')
-        reason = data.get('reason')
-        print(f"  Session {session_id} failed: {reason}")
-        
-    elif event_type == 'verification.expired':
-        session_id = data.get('sessionId')
-        print(f"  Session {session_id} expired")
-    
-    return jsonify({'success': True})
+    # Verify the raw body and queue the event; returns 401 on a bad
+    # signature and 503 when the workers are saturated
+    status, body = dispatcher.handle(request.get_data(), signature, timestamp)
+    return jsonify(body), status
 
 @app.route('/verify/create', methods=['POST'])
 def create_verification():
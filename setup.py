@@ -24,10 +24,14 @@ setup(
         'Source': 'https://github.com/tlgsn/verifly-python-sdk',
         'Bug Reports': 'https://github.com/tlgsn/verifly-python-sdk/issues',
     },
-    packages=find_packages(exclude=['tests', 'tests.*']),
+    packages=find_packages(exclude=['tests', 'tests.*', 'benchmarks', 'benchmarks.*']),
     install_requires=[
         'requests>=2.25.0',
     ],
+    extras_require={
+        'async': ['aiohttp>=3.7.0'],
+        'speedups': ['orjson>=3.0.0'],
+    },
     python_requires='>=3.6',
     classifiers=[
         'Development Status :: 5 - Production/Stable',
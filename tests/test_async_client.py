@@ -0,0 +1,40 @@
+"""
+AsyncVerifly transport
+"""
+
+import asyncio
+
+import aiohttp
+
+from verifly.testing import MockVerifly
+from verifly.utils.request import USER_AGENT
+
+
+def test_shared_session_sends_sdk_headers():
+    sent = []
+
+    async def on_request_start(session, context, params):
+        sent.append(params.headers)
+
+    async def main(mock):
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(on_request_start)
+        async with aiohttp.ClientSession(trace_configs=[trace]) as session:
+            verifly = mock.async_client(session=session)
+            created = await verifly.verification.create(phone='5551234567')
+            await verifly.verification.get(created['sessionId'])
+            await verifly.close()
+            # The caller's session stays open for its other users
+            assert not session.closed
+
+    loop = asyncio.new_event_loop()
+    try:
+        with MockVerifly() as mock:
+            loop.run_until_complete(main(mock))
+    finally:
+        loop.close()
+
+    assert len(sent) == 2
+    for headers in sent:
+        assert headers['Content-Type'] == 'application/json'
+        assert headers['User-Agent'] == USER_AGENT
@@ -0,0 +1,64 @@
+"""
+Circuit breaker state transitions
+"""
+
+import time
+
+import pytest
+
+from verifly import CircuitBreaker, CircuitOpenError, RetryPolicy, ServerError
+from verifly.testing import MockVerifly
+
+
+def test_open_half_open_closed_cycle():
+    transitions = []
+    breaker = CircuitBreaker(failure_rate=0.5, min_requests=2, window=10, reset_timeout=0.2)
+    breaker.add_listener(lambda endpoint, old, new: transitions.append((endpoint, old, new)))
+
+    with MockVerifly() as mock:
+        verifly = mock.client(retry=RetryPolicy.disabled(), circuit_breaker=breaker)
+        session_id = verifly.verification.create(phone='5551234567')['sessionId']
+
+        mock.fail_next(503, count=2)
+        for _ in range(2):
+            with pytest.raises(ServerError):
+                verifly.verification.get(session_id)
+        assert breaker.state('status') == 'open'
+
+        # Open: fail fast without reaching the server
+        requests = mock.request_count
+        with pytest.raises(CircuitOpenError):
+            verifly.verification.get(session_id)
+        assert mock.request_count == requests
+
+        # Other endpoint classes are unaffected
+        verifly.verification.get_balance()
+
+        time.sleep(0.25)
+        assert verifly.verification.get(session_id)['sessionId'] == session_id
+        assert breaker.state('status') == 'closed'
+
+    assert transitions == [
+        ('status', 'closed', 'open'),
+        ('status', 'open', 'half_open'),
+        ('status', 'half_open', 'closed'),
+    ]
+
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker(failure_rate=0.5, min_requests=1, window=10, reset_timeout=0.2)
+
+    with MockVerifly() as mock:
+        verifly = mock.client(retry=RetryPolicy.disabled(), circuit_breaker=breaker)
+        session_id = verifly.verification.create(phone='5551234567')['sessionId']
+
+        mock.fail_next(503)
+        with pytest.raises(ServerError):
+            verifly.verification.get(session_id)
+        assert breaker.state('status') == 'open'
+
+        time.sleep(0.25)
+        mock.fail_next(503)
+        with pytest.raises(ServerError):
+            verifly.verification.get(session_id)
+        assert breaker.state('status') == 'open'
@@ -0,0 +1,60 @@
+"""
+Client transport reuse
+"""
+
+import asyncio
+
+from verifly.testing import MockVerifly
+from verifly.utils.signer import Signer
+
+
+def _rotate(mock, api_key, secret_key):
+    mock.api_key = api_key
+    mock.signer = Signer(secret_key)
+
+
+def test_credentials_rotate_on_the_same_pool():
+    with MockVerifly() as mock:
+        verifly = mock.client(pool_size=4)
+        handler = verifly._request_handler
+        session = handler.session
+        adapter = session.get_adapter(mock.url)
+        verifly.verification.get_balance()
+
+        _rotate(mock, 'new-api-key', 'new-secret-key')
+        verifly.set_credentials('new-api-key', 'new-secret-key')
+        verifly.verification.get_balance()
+        verifly.set_secret_key('new-secret-key')
+        verifly.set_debug(True)
+        verifly.set_debug(False)
+        verifly.verification.get_balance()
+
+        assert handler.session is session
+        assert session.get_adapter(mock.url) is adapter
+        assert adapter._pool_maxsize == 4
+        # One keep-alive connection served every request
+        pools = adapter.poolmanager.pools
+        assert len(pools) == 1
+        assert pools[next(iter(pools.keys()))].num_connections == 1
+        assert verifly.webhook.signer is handler.signer
+        verifly.close()
+
+
+def test_async_credentials_rotate_on_the_same_session():
+    async def main(mock):
+        async with mock.async_client() as verifly:
+            await verifly.verification.get_balance()
+            session = verifly._request_handler.session
+
+            _rotate(mock, 'new-api-key', 'new-secret-key')
+            verifly.set_credentials('new-api-key', 'new-secret-key')
+            await verifly.verification.get_balance()
+            assert verifly._request_handler.session is session
+            assert verifly.webhook.signer is verifly._request_handler.signer
+
+    loop = asyncio.new_event_loop()
+    try:
+        with MockVerifly() as mock:
+            loop.run_until_complete(main(mock))
+    finally:
+        loop.close()
@@ -0,0 +1,82 @@
+"""
+Bulk session creation with create_many
+"""
+
+import asyncio
+
+from verifly import InsufficientBalanceError, RetryPolicy, ServerError
+from verifly.testing import MockVerifly
+
+
+def _specs(count, pulled=None):
+    for i in range(count):
+        if pulled is not None:
+            pulled.append(i)
+        yield {'phone': f'555200{i:04d}'}
+
+
+def test_stops_submitting_after_insufficient_balance():
+    with MockVerifly(balance=5, cost=1) as mock:
+        verifly = mock.client()
+        pulled = []
+        batch = verifly.verification.create_many(_specs(50, pulled), concurrency=1)
+        results = list(batch)
+
+    summary = batch.summary
+    assert summary.succeeded == 5
+    assert summary.balance_exhausted_at == 5
+    assert summary.submitted == 6
+    assert len(pulled) == 6
+    assert isinstance(results[-1][2], InsufficientBalanceError)
+
+
+def test_concurrent_run_drains_in_flight_and_halts():
+    with MockVerifly(balance=5, cost=1, latency=0.02) as mock:
+        verifly = mock.client()
+        pulled = []
+        summary = verifly.verification.create_many(_specs(50, pulled), concurrency=4).run()
+
+    assert summary.succeeded == 5
+    assert summary.balance_exhausted
+    # Nothing is started after the 402 beyond what was already in flight
+    assert summary.submitted == len(pulled) <= 5 + 4
+
+
+def test_errors_are_returned_per_item():
+    with MockVerifly() as mock:
+        verifly = mock.client(retry=RetryPolicy.disabled())
+        mock.fail_next(503)
+        batch = verifly.verification.create_many(_specs(4), concurrency=1)
+        results = list(batch)
+
+    assert isinstance(results[0][2], ServerError)
+    assert all(result['sessionId'] for _, _, result in results[1:])
+    assert batch.summary.failed == 1
+    assert [index for index, _, _ in batch.summary.retryable] == [0]
+
+
+def test_ordered_results():
+    with MockVerifly(latency=(0.0, 0.05), seed=1) as mock:
+        verifly = mock.client()
+        results = list(verifly.verification.create_many(_specs(12), concurrency=4, ordered=True))
+
+    assert [index for index, _, _ in results] == list(range(12))
+    assert [spec['phone'] for _, spec, _ in results] == [f'555200{i:04d}' for i in range(12)]
+
+
+def test_async_create_many():
+    async def main(mock):
+        async with mock.async_client() as verifly:
+            batch = verifly.verification.create_many(_specs(20), concurrency=3, ordered=True)
+            results = [item async for item in batch]
+        assert batch.summary.succeeded == 3
+        # Requests in flight together may be charged in any order
+        assert batch.summary.balance_exhausted_at <= 3
+        assert [index for index, _, _ in results] == list(range(len(results)))
+
+    loop = asyncio.new_event_loop()
+    try:
+        with MockVerifly(balance=3, cost=1) as mock:
+            loop.run_until_complete(main(mock))
+    finally:
+        loop.close()
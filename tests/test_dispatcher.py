@@ -0,0 +1,113 @@
+"""
+WebhookDispatcher and AsyncWebhookDispatcher
+"""
+
+import asyncio
+import threading
+
+from verifly import AsyncWebhookDispatcher, InMemoryReplayStore, WebhookDispatcher
+from verifly.testing import MockVerifly
+
+
+def _deliver(dispatcher, body, headers):
+    return dispatcher.handle(body, headers['X-Signature'], headers['X-Timestamp'])
+
+
+def test_redelivery_after_busy_is_processed():
+    started = threading.Event()
+    release = threading.Event()
+    processed = []
+
+    with MockVerifly() as mock:
+        verifly = mock.client(webhook_replay_store=InMemoryReplayStore())
+        dispatcher = WebhookDispatcher(verifly.webhook, workers=1, queue_size=1)
+
+        @dispatcher.on('*')
+        def handler(event):
+            started.set()
+            release.wait(5)
+            processed.append(event['data']['sessionId'])
+
+        deliveries = [mock.sign_webhook('verification.completed', {'sessionId': f's{i}'})
+                      for i in range(3)]
+        assert _deliver(dispatcher, *deliveries[0])[0] == 200
+        assert started.wait(5)
+        assert _deliver(dispatcher, *deliveries[1])[0] == 200
+
+        status, body = _deliver(dispatcher, *deliveries[2])
+        assert status == 503
+        assert '_status' not in body
+
+        release.set()
+        dispatcher.close()
+
+        dispatcher = WebhookDispatcher(verifly.webhook, workers=1, queue_size=1)
+        dispatcher.register('*', lambda event: processed.append(event['data']['sessionId']))
+        status, body = _deliver(dispatcher, *deliveries[2])
+        assert (status, body['message']) == (200, 'OK')
+        dispatcher.close()
+
+        # A redelivery of an accepted event is still a duplicate
+        status, body = _deliver(dispatcher, *deliveries[0])
+        assert (status, body['message']) == (200, 'Duplicate delivery')
+
+    assert processed == ['s0', 's1', 's2']
+
+
+def test_failing_error_handler_keeps_worker_alive():
+    processed = []
+
+    def on_error(event, error):
+        raise RuntimeError('error handler failed')
+
+    with MockVerifly() as mock:
+        verifly = mock.client()
+        dispatcher = WebhookDispatcher(verifly.webhook, workers=1, on_error=on_error)
+
+        @dispatcher.on('*')
+        def handler(event):
+            if event['data']['fail']:
+                raise ValueError('handler failed')
+            processed.append(event)
+
+        for fail in (True, True, False):
+            body, headers = mock.sign_webhook('verification.completed', {'fail': fail})
+            assert _deliver(dispatcher, body, headers)[0] == 200
+        dispatcher.close()
+
+    assert len(processed) == 1
+
+
+def test_async_redelivery_after_busy_is_processed():
+    async def main(mock):
+        verifly = mock.client(webhook_replay_store=InMemoryReplayStore())
+        dispatcher = AsyncWebhookDispatcher(verifly.webhook, workers=1, queue_size=1)
+        release = asyncio.Event()
+        processed = []
+
+        @dispatcher.on('*')
+        async def handler(event):
+            await release.wait()
+            processed.append(event['data']['sessionId'])
+
+        deliveries = [mock.sign_webhook('verification.completed', {'sessionId': f's{i}'})
+                      for i in range(3)]
+        assert (await _deliver(dispatcher, *deliveries[0]))[0] == 200
+        await asyncio.sleep(0)
+        assert (await _deliver(dispatcher, *deliveries[1]))[0] == 200
+        assert (await _deliver(dispatcher, *deliveries[2]))[0] == 503
+
+        release.set()
+        await dispatcher.close()
+        assert (await _deliver(dispatcher, *deliveries[2]))[0] == 200
+        await dispatcher.close()
+        return processed
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        with MockVerifly() as mock:
+            processed = loop.run_until_complete(main(mock))
+    finally:
+        loop.close()
+    assert processed == ['s0', 's1', 's2']
@@ -0,0 +1,116 @@
+"""
+Endpoint failover ordering and hedge delay derivation
+"""
+
+import socket
+import threading
+import time
+
+from verifly import EndpointPool, HedgePolicy, RetryPolicy, ServerError, ValidationError
+from verifly.testing import MockVerifly
+
+A, B, C = 'https://a.example', 'https://b.example', 'https://c.example'
+
+
+def _error():
+    return ServerError('Service unavailable', 503)
+
+
+def test_pick_prefers_first_healthy_url():
+    pool = EndpointPool([A + '/', B, C], failure_threshold=2, cooldown=60)
+    assert pool.urls == (A, B, C)
+    assert pool.pick() == A
+    assert pool.pick(avoid=A) == B
+
+    pool.record(A, _error())
+    assert pool.pick() == A
+    pool.record(A, _error())
+    assert pool.pick() == B
+    assert pool.healthy() == {A: False, B: True, C: True}
+    # A down URL is only used again when it is the one due back first
+    pool.record(B, _error())
+    pool.record(B, _error())
+    pool.record(C, _error())
+    pool.record(C, _error())
+    assert pool.pick() == A
+
+
+def test_success_and_client_errors_reset_or_skip_failures():
+    pool = EndpointPool([A, B], failure_threshold=2)
+    pool.record(A, _error())
+    pool.record(A)
+    pool.record(A, _error())
+    assert pool.pick() == A
+    pool.record(A, ValidationError('Bad phone', 400))
+    assert pool.pick() == A
+
+
+def test_down_url_returns_after_cooldown():
+    pool = EndpointPool([A, B], failure_threshold=1, cooldown=0.05)
+    pool.record(A, _error())
+    assert pool.pick() == B
+    time.sleep(0.06)
+    assert pool.pick() == A
+
+
+def _closed_url():
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return f'http://127.0.0.1:{port}'
+
+
+def test_requests_fail_over_to_the_next_url():
+    with MockVerifly() as mock:
+        session_id = mock.client().verification.create(phone='5551234567')['sessionId']
+        pool = EndpointPool([_closed_url(), mock.url], failure_threshold=1)
+        verifly = mock.client(
+            base_urls=pool, retry=RetryPolicy(max_attempts=2, backoff_base=0.01)
+        )
+        assert verifly.verification.get(session_id)['sessionId'] == session_id
+        assert list(pool.healthy().values()) == [False, True]
+        requests = mock.request_count
+        verifly.verification.get(session_id)
+        assert mock.request_count == requests + 1
+
+
+def test_hedge_delay_uses_initial_delay_until_enough_samples():
+    policy = HedgePolicy(percentile=0.9, initial_delay=0.25, window=20, min_samples=10)
+    for _ in range(9):
+        policy.observe('status', 0.05)
+    assert policy.delay('status') == 0.25
+    policy.observe('status', 0.05)
+    assert policy.delay('status') == 0.05
+    assert policy.delay('create') == 0.25
+
+
+def test_hedge_delay_is_the_percentile_clamped_to_bounds():
+    policy = HedgePolicy(percentile=0.9, min_delay=0.01, max_delay=1.0, window=64, min_samples=10)
+    # 0.001 .. 0.064; the 90th percentile of 64 samples is the 58th
+    for i in range(1, 65):
+        policy.observe('status', i / 1000)
+    assert abs(policy.delay('status') - 0.058) < 1e-9
+
+    # Old samples leave the window
+    for _ in range(64):
+        policy.observe('status', 5.0)
+    assert policy.delay('status') == 1.0
+    for _ in range(64):
+        policy.observe('status', 0.0001)
+    assert policy.delay('status') == 0.01
+
+
+def test_hedge_observe_is_thread_safe():
+    policy = HedgePolicy(window=64, min_samples=20)
+    threads = [
+        threading.Thread(target=lambda: [policy.observe('status', 0.05) for _ in range(2000)])
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert policy._positions['status'] == 16000
+    assert len(policy._samples['status']) == 64
+    assert policy.delay('status') == 0.05
@@ -0,0 +1,79 @@
+"""
+Concurrent status lookups with get_many
+"""
+
+import asyncio
+import threading
+
+from verifly import NotFoundError
+from verifly.testing import MockVerifly
+
+
+def _sessions(verifly, count):
+    return [verifly.verification.create(phone=f'555000{i:04d}')['sessionId'] for i in range(count)]
+
+
+def test_get_many_is_bounded_and_reports_errors_per_item():
+    with MockVerifly(latency=0.02) as mock:
+        verifly = mock.client()
+        ids = _sessions(verifly, 12) + ['missing-1', 'missing-2']
+
+        lock = threading.Lock()
+        in_flight = [0, 0]
+        get = verifly.verification.get
+
+        def tracked_get(session_id):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+            try:
+                return get(session_id)
+            finally:
+                with lock:
+                    in_flight[0] -= 1
+
+        verifly.verification.get = tracked_get
+        results = dict(verifly.verification.get_many(iter(ids), concurrency=3))
+
+    assert set(results) == set(ids)
+    assert 1 < in_flight[1] <= 3
+    assert isinstance(results['missing-1'], NotFoundError)
+    assert isinstance(results['missing-2'], NotFoundError)
+    assert all(results[i]['sessionId'] == i for i in ids[:12])
+
+
+def test_get_many_consumes_input_lazily():
+    with MockVerifly() as mock:
+        verifly = mock.client()
+        ids = _sessions(verifly, 10)
+        pulled = []
+
+        def source():
+            for session_id in ids:
+                pulled.append(session_id)
+                yield session_id
+
+        results = verifly.verification.get_many(source(), concurrency=2)
+        next(results)
+        assert len(pulled) <= 3
+        assert len(list(results)) == 9
+
+
+def test_async_get_many():
+    async def main(mock):
+        async with mock.async_client() as verifly:
+            ids = []
+            for i in range(6):
+                ids.append((await verifly.verification.create(phone=f'555100{i:04d}'))['sessionId'])
+            results = {}
+            async for session_id, result in verifly.verification.get_many(ids + ['missing'], concurrency=2):
+                results[session_id] = result
+        assert isinstance(results.pop('missing'), NotFoundError)
+        assert all(results[i]['sessionId'] == i for i in ids)
+
+    loop = asyncio.new_event_loop()
+    try:
+        with MockVerifly(latency=0.01) as mock:
+            loop.run_until_complete(main(mock))
+    finally:
+        loop.close()
@@ -0,0 +1,69 @@
+"""
+Request hooks: one event per attempt, with phase timings
+"""
+
+import asyncio
+
+from verifly import RequestHooks, RetryPolicy
+from verifly.testing import MockVerifly
+
+
+class _Recorder(RequestHooks):
+    def __init__(self):
+        self.ended = []
+        self.retried = []
+
+    def on_request_end(self, event):
+        self.ended.append(event)
+
+    def on_retry(self, event):
+        self.retried.append(event)
+
+
+def _check_attempts(hooks):
+    failed, succeeded = hooks.ended
+    assert failed.request_id == succeeded.request_id
+    assert (failed.attempt, succeeded.attempt) == (1, 2)
+    assert (failed.status, succeeded.status) == (503, 200)
+    assert hooks.retried == [failed] and failed.retry_delay is not None
+    for event in hooks.ended:
+        for phase in ('serialize', 'sign', 'ttfb', 'total'):
+            assert event.timings[phase] is not None and event.timings[phase] >= 0
+    assert succeeded.timings['decode'] is not None
+    assert succeeded.timings['total'] >= succeeded.timings['ttfb']
+    assert succeeded.response_size > 0
+
+
+def test_sync_timings_per_attempt():
+    hooks = _Recorder()
+    with MockVerifly() as mock:
+        verifly = mock.client(hooks=[hooks], retry=RetryPolicy(max_attempts=2))
+        session_id = verifly.verification.create(phone='5551234567')['sessionId']
+        hooks.ended.clear()
+        mock.fail_next(503)
+        verifly.verification.get(session_id)
+    _check_attempts(hooks)
+
+
+def test_async_timings_per_attempt():
+    hooks = _Recorder()
+    loop = asyncio.new_event_loop()
+
+    async def run(mock):
+        verifly = mock.async_client(hooks=[hooks], retry=RetryPolicy(max_attempts=2))
+        try:
+            created = await verifly.verification.create(phone='5551234567')
+            hooks.ended.clear()
+            mock.fail_next(503)
+            await verifly.verification.get(created['sessionId'])
+        finally:
+            await verifly.close()
+
+    try:
+        with MockVerifly() as mock:
+            loop.run_until_complete(run(mock))
+    finally:
+        loop.close()
+    _check_attempts(hooks)
+    # Only the async client measures connection setup
+    assert all(e.timings['connect'] is not None for e in hooks.ended)
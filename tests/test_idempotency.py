@@ -0,0 +1,116 @@
+"""
+Client-side idempotency store and concurrent creates
+"""
+
+import asyncio
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from verifly import InMemoryIdempotencyStore, ValidationError
+from verifly.testing import MockVerifly
+
+
+def _wait_for_request(mock):
+    deadline = time.monotonic() + 5
+    while mock.request_count == 0 and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def _create_in_thread(verifly, results, **kwargs):
+    def run():
+        try:
+            results.append(verifly.verification.create(**kwargs))
+        except Exception as e:
+            results.append(e)
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_concurrent_creates_with_one_key_share_a_request():
+    with MockVerifly(latency=0.2) as mock:
+        verifly = mock.client(idempotency_store=InMemoryIdempotencyStore())
+        results = []
+        threads = [_create_in_thread(verifly, results, phone='5551234567', idempotency_key='k1')
+                   for _ in range(5)]
+        for thread in threads:
+            thread.join(5)
+        assert mock.request_count == 1
+        assert len({r['sessionId'] for r in results}) == 1
+
+        # Later calls are answered from the store
+        again = verifly.verification.create(phone='5551234567', idempotency_key='k1')
+        assert again['sessionId'] == results[0]['sessionId']
+        assert mock.request_count == 1
+
+
+def test_concurrent_create_with_different_parameters_is_rejected():
+    with MockVerifly(latency=0.2) as mock:
+        verifly = mock.client(idempotency_store=InMemoryIdempotencyStore())
+        first, second = [], []
+        leader = _create_in_thread(verifly, first, phone='5551234567', idempotency_key='k1')
+        _wait_for_request(mock)
+        follower = _create_in_thread(verifly, second, phone='5559999999', idempotency_key='k1')
+        leader.join(5)
+        follower.join(5)
+
+        assert first[0]['sessionId']
+        assert isinstance(second[0], ValidationError)
+        assert mock.request_count == 1
+
+        with pytest.raises(ValidationError):
+            verifly.verification.create(phone='5559999999', idempotency_key='k1')
+
+
+def test_async_concurrent_creates_check_parameters():
+    async def main(mock):
+        async with mock.async_client(idempotency_store=InMemoryIdempotencyStore()) as verifly:
+            create = verifly.verification.create
+            results = await asyncio.gather(
+                create(phone='5551234567', idempotency_key='k1'),
+                create(phone='5551234567', idempotency_key='k1'),
+                create(phone='5559999999', idempotency_key='k1'),
+                return_exceptions=True
+            )
+        assert results[0]['sessionId'] == results[1]['sessionId']
+        assert isinstance(results[2], ValidationError)
+        assert mock.request_count == 1
+
+    loop = asyncio.new_event_loop()
+    try:
+        with MockVerifly(latency=0.2) as mock:
+            loop.run_until_complete(main(mock))
+    finally:
+        loop.close()
+
+
+def test_idempotency_key_is_signed():
+    with MockVerifly() as mock:
+        body = json.dumps({'phone': '5551234567'}).encode('utf-8')
+        timestamp = str(int(time.time()))
+        signature = mock.signer.sign(body, timestamp, 'k1')
+
+        def post(key):
+            request = urllib.request.Request(
+                mock.url + '/api/verify/create', data=body, method='POST',
+                headers={
+                    'Content-Type': 'application/json',
+                    'X-API-Key': mock.api_key,
+                    'X-Signature': signature,
+                    'X-Timestamp': timestamp,
+                    'Idempotency-Key': key,
+                }
+            )
+            try:
+                with urllib.request.urlopen(request) as response:
+                    return response.status
+            except urllib.error.HTTPError as e:
+                return e.code
+
+        assert post('k2') == 401
+        assert post('k1') == 200
@@ -0,0 +1,93 @@
+"""
+Per-client debug logging
+"""
+
+import logging
+
+from verifly.testing import MockVerifly
+
+
+def test_debug_mode_leaves_verifly_logger_level_alone():
+    root = logging.getLogger('verifly')
+    root.setLevel(logging.WARNING)
+    try:
+        with MockVerifly() as mock:
+            noisy = mock.client(debug=True)
+            quiet = mock.client()
+            assert root.level == logging.WARNING
+            assert noisy._request_handler.logger.isEnabledFor(logging.DEBUG)
+            assert not quiet._request_handler.logger.isEnabledFor(logging.DEBUG)
+
+            noisy.set_debug(False)
+            assert root.level == logging.WARNING
+            assert not noisy._request_handler.logger.isEnabledFor(logging.DEBUG)
+    finally:
+        root.setLevel(logging.NOTSET)
+
+
+class _Records(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_debug_client_logs_requests_despite_app_level():
+    root = logging.getLogger('verifly')
+    records = _Records()
+    # Debug records stop at the SDK's own logger while it is attached
+    logging.getLogger('verifly.debug').addHandler(records)
+    root.setLevel(logging.WARNING)
+    try:
+        with MockVerifly() as mock:
+            verifly = mock.client(debug=True)
+            verifly.verification.create(phone='+15550100')
+            verifly.set_debug(False)
+            verifly.verification.create(phone='+15550101')
+    finally:
+        logging.getLogger('verifly.debug').removeHandler(records)
+        root.setLevel(logging.NOTSET)
+    debug = [r for r in records.records if r.levelno == logging.DEBUG]
+    assert debug and all(r.name == 'verifly.debug' for r in debug)
+    # Only the first request, sent in debug mode, was logged
+    assert len({r.getMessage().split()[0] for r in debug}) == 1
+
+
+def _stderr_handlers():
+    return [h for h in logging.getLogger('verifly.debug').handlers
+            if type(h) is logging.StreamHandler]
+
+
+def test_closed_and_discarded_clients_leave_debug_mode():
+    import gc
+
+    assert _stderr_handlers() == []
+    with MockVerifly() as mock:
+        closed = mock.client(debug=True)
+        discarded = mock.client(debug=True)
+        assert len(_stderr_handlers()) == 1
+        assert not logging.getLogger('verifly.debug').propagate
+
+        closed.close()
+        assert len(_stderr_handlers()) == 1
+        del discarded
+        gc.collect()
+
+    assert _stderr_handlers() == []
+    assert logging.getLogger('verifly.debug').propagate
+
+
+def test_debug_dumps_do_not_reach_application_handlers():
+    root = logging.getLogger()
+    records = _Records()
+    root.addHandler(records)
+    try:
+        with MockVerifly() as mock:
+            verifly = mock.client(debug=True)
+            verifly.verification.get_balance()
+            verifly.close()
+    finally:
+        root.removeHandler(records)
+    assert not [r for r in records.records if r.name == 'verifly.debug']
@@ -0,0 +1,119 @@
+"""
+MetricsCollector: OpenMetrics exposition and per-thread shards
+"""
+
+import re
+import threading
+
+from verifly import RequestEvent
+from verifly.metrics import MetricsCollector
+from verifly.testing import MockVerifly
+
+_SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})? (\S+)$')
+_LABEL = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+
+# Sample name suffixes each OpenMetrics family type may use
+_SUFFIXES = {
+    'counter': ('_total',),
+    'gauge': ('',),
+    'stateset': ('',),
+    'histogram': ('_bucket', '_count', '_sum'),
+}
+
+
+def _parse(text):
+    """Parse exposition text into {family: (type, [(name, labels, value)])}"""
+    assert text.endswith('# EOF\n')
+    families = {}
+    current = None
+    for line in text[:-len('# EOF\n')].splitlines():
+        if line.startswith('# TYPE '):
+            _, _, current, kind = line.split(' ')
+            assert current not in families
+            families[current] = (kind, [])
+        elif line.startswith('# HELP '):
+            assert line.split(' ')[2] == current
+        else:
+            match = _SAMPLE.match(line)
+            assert match, line
+            name, labels, value = match.groups()
+            kind, samples = families[current]
+            assert name in [current + s for s in _SUFFIXES[kind]], name
+            samples.append((name, dict(_LABEL.findall(labels or '')), float(value)))
+    return families
+
+
+def _record(metrics, endpoint_path, status, elapsed):
+    event = RequestEvent(1, 'GET', endpoint_path, 'status', 1, 0, 0.0)
+    metrics.on_request_start(event)
+    event.status = status
+    event.timings['total'] = elapsed
+    metrics.on_request_end(event)
+
+
+def test_render_is_valid_openmetrics():
+    metrics = MetricsCollector(buckets=(0.1, 1.0), pool_size=4)
+    with MockVerifly() as mock:
+        verifly = mock.client(hooks=[metrics])
+        verifly.verification.create(phone='5551234567')
+        metrics.on_webhook_verify('ok', 0.001)
+
+    families = _parse(metrics.render())
+    assert families['verifly_requests'][0] == 'counter'
+    requests = families['verifly_requests'][1]
+    assert [(labels['method'], labels['status'], value) for _, labels, value in requests] == [
+        ('POST', '200', 1.0)
+    ]
+    assert families['verifly_webhook_verifications'][1] == [
+        ('verifly_webhook_verifications_total', {'result': 'ok'}, 1.0)
+    ]
+    assert families['verifly_inflight_requests'][1][0][2] == 0.0
+    assert families['verifly_pool_size'][1][0][2] == 4.0
+
+
+def test_histogram_buckets_are_cumulative():
+    metrics = MetricsCollector(buckets=(0.1, 1.0))
+    for elapsed in (0.05, 0.5, 0.5, 3.0):
+        _record(metrics, '/api/verify/abc', 200, elapsed)
+
+    kind, samples = _parse(metrics.render())['verifly_request_duration_seconds']
+    assert kind == 'histogram'
+    buckets = [(labels['le'], value) for name, labels, value in samples
+               if name.endswith('_bucket')]
+    assert buckets == [('0.1', 1.0), ('1.0', 3.0), ('+Inf', 4.0)]
+    by_name = {name: value for name, _, value in samples}
+    assert by_name['verifly_request_duration_seconds_count'] == 4.0
+    assert abs(by_name['verifly_request_duration_seconds_sum'] - 4.05) < 1e-9
+    assert all(labels['endpoint'] == '/api/verify/{session_id}' for _, labels, _ in samples)
+
+
+def test_thread_shards_are_merged():
+    metrics = MetricsCollector()
+    recorded = threading.Event()
+    release = threading.Event()
+
+    def worker(status, count, wait):
+        for _ in range(count):
+            _record(metrics, '/api/verify/abc', status, 0.01)
+        if wait:
+            recorded.set()
+            release.wait()
+
+    # One thread finishes (its shard is retired), one is still alive
+    finished = threading.Thread(target=worker, args=(200, 3, False))
+    alive = threading.Thread(target=worker, args=(200, 2, True))
+    finished.start()
+    finished.join()
+    alive.start()
+    try:
+        _record(metrics, '/api/verify/abc', 503, 0.01)
+        recorded.wait()
+        for _ in range(2):
+            # Rendering twice must not count retired shards again
+            requests = _parse(metrics.render())['verifly_requests'][1]
+            assert {labels['status']: value for _, labels, value in requests} == {
+                '200': 5.0, '503': 1.0
+            }
+    finally:
+        release.set()
+        alive.join()
@@ -0,0 +1,108 @@
+"""
+WSGI and ASGI webhook apps
+"""
+
+import asyncio
+import io
+
+from verifly import InMemoryReplayStore
+from verifly.middleware import ASGIWebhookApp, WSGIWebhookApp
+from verifly.testing import MockVerifly
+
+
+def _call_wsgi(app, body, signature, timestamp):
+    captured = {}
+
+    def start_response(status, headers):
+        captured['status'] = int(status.split()[0])
+
+    environ = {
+        'REQUEST_METHOD': 'POST',
+        'CONTENT_LENGTH': str(len(body)),
+        'HTTP_X_SIGNATURE': signature,
+        'HTTP_X_TIMESTAMP': timestamp,
+        'wsgi.input': io.BytesIO(body),
+    }
+    payload = b''.join(app(environ, start_response))
+    return captured['status'], payload
+
+
+def test_wsgi_redelivery_after_refusal_is_processed():
+    accept = [False]
+    processed = []
+
+    def callback(event):
+        if not accept[0]:
+            return False
+        processed.append(event)
+
+    with MockVerifly() as mock:
+        verifly = mock.client(webhook_replay_store=InMemoryReplayStore())
+        app = WSGIWebhookApp(verifly.webhook, callback)
+        body, headers = mock.sign_webhook('verification.completed', {'sessionId': 's1'})
+        args = (body, headers['X-Signature'], headers['X-Timestamp'])
+
+        status, payload = _call_wsgi(app, *args)
+        assert status == 503
+        assert b'_status' not in payload
+
+        accept[0] = True
+        assert _call_wsgi(app, *args)[0] == 200
+        assert len(processed) == 1
+
+        # Now that it was accepted, a further redelivery is a duplicate
+        status, payload = _call_wsgi(app, *args)
+        assert status == 200 and b'Duplicate' in payload
+        assert len(processed) == 1
+
+
+def test_wsgi_non_ascii_signature_is_unauthorized():
+    with MockVerifly() as mock:
+        verifly = mock.client()
+        app = WSGIWebhookApp(verifly.webhook, lambda event: None)
+        body, headers = mock.sign_webhook('verification.completed', {'sessionId': 's1'})
+        assert _call_wsgi(app, body, 'é' * 64, headers['X-Timestamp'])[0] == 401
+
+
+def test_asgi_redelivery_after_refusal_is_processed():
+    accept = [False]
+
+    async def callback(event):
+        return None if accept[0] else False
+
+    async def call(app, body, headers):
+        sent = []
+
+        async def receive():
+            return {'type': 'http.request', 'body': body, 'more_body': False}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            'type': 'http',
+            'method': 'POST',
+            'headers': [
+                (b'x-signature', headers['X-Signature'].encode('latin-1')),
+                (b'x-timestamp', headers['X-Timestamp'].encode('latin-1')),
+                (b'content-length', str(len(body)).encode('ascii')),
+            ],
+        }
+        await app(scope, receive, send)
+        return sent[0]['status']
+
+    async def main(mock):
+        verifly = mock.client(webhook_replay_store=InMemoryReplayStore())
+        app = ASGIWebhookApp(verifly.webhook, callback)
+        body, headers = mock.sign_webhook('verification.completed', {'sessionId': 's1'})
+        assert await call(app, body, headers) == 503
+        accept[0] = True
+        assert await call(app, body, headers) == 200
+        assert await call(app, body, dict(headers, **{'X-Signature': 'ÿ' * 64})) == 401
+
+    loop = asyncio.new_event_loop()
+    try:
+        with MockVerifly() as mock:
+            loop.run_until_complete(main(mock))
+    finally:
+        loop.close()
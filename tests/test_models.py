@@ -0,0 +1,82 @@
+"""
+Typed response models: slots, read-only mapping access, lazy parsing
+"""
+
+import pickle
+from collections.abc import Mapping
+from datetime import datetime, timezone
+
+import pytest
+
+from verifly import Balance, Session, SessionStatus, Status, Transaction
+from verifly.models import _UNSET
+from verifly.testing import MockVerifly
+
+DATA = {
+    'sessionId': 's1',
+    'status': 'verified',
+    'method': 'sms',
+    'verifiedAt': '2024-01-02T03:04:05.000Z',
+    'newField': 1,
+}
+
+
+def test_models_use_slots_and_are_read_only():
+    status = SessionStatus(DATA)
+    assert not hasattr(status, '__dict__')
+    assert isinstance(status, Mapping)
+    with pytest.raises(TypeError):
+        status['status'] = 'failed'
+    with pytest.raises(AttributeError):
+        status.status = 'failed'
+    with pytest.raises(AttributeError):
+        status.unknown = 1
+
+
+def test_mapping_access_keeps_raw_values():
+    status = SessionStatus(DATA)
+    assert dict(status) == DATA
+    assert status == DATA
+    assert len(status) == len(DATA)
+    assert status['verifiedAt'] == DATA['verifiedAt']
+    assert status['newField'] == 1
+    assert status.get('verificationCode') is None and 'verificationCode' not in status
+    with pytest.raises(KeyError):
+        status['verificationCode']
+
+
+def test_attributes_parse_lazily():
+    status = SessionStatus(DATA)
+    assert status._verified_at_parsed is _UNSET
+    assert status.verified_at == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert status.verified_at is status.verified_at
+    assert status.status is Status.VERIFIED and status.status == 'verified'
+    assert status.is_terminal
+    # Statuses the SDK does not know yet stay plain strings
+    assert SessionStatus({'status': 'paused'}).status == 'paused'
+    assert not SessionStatus({}).is_terminal
+
+
+def test_nested_transactions_and_round_trips():
+    balance = Balance({
+        'balance': 10.0,
+        'currency': 'TRY',
+        'recentTransactions': [{'type': 'debit', 'amount': 1.0, 'sessionId': 's1'}],
+    })
+    transaction = balance.recent_transactions[0]
+    assert isinstance(transaction, Transaction) and transaction.session_id == 's1'
+    plain = balance.to_dict()
+    assert type(plain['recentTransactions'][0]) is dict
+    assert pickle.loads(pickle.dumps(balance)).to_dict() == plain
+
+
+def test_typed_responses_from_the_client():
+    with MockVerifly() as mock:
+        verifly = mock.client(typed_responses=True)
+        session = verifly.verification.create(phone='5551234567')
+        assert isinstance(session, Session) and session.status is Status.PENDING
+        status = verifly.verification.get(session.session_id)
+        assert isinstance(status, SessionStatus) and status.session_id == session['sessionId']
+        balance = verifly.verification.get_balance()
+        assert isinstance(balance, Balance)
+        assert all(isinstance(t, Transaction) for t in balance.recent_transactions)
@@ -0,0 +1,121 @@
+"""
+StatusPoller and AsyncStatusPoller: completion, errors and timeouts
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from verifly import NotFoundError, WaitTimeoutError
+from verifly.testing import MockVerifly
+from verifly.utils.poller import AsyncStatusPoller, StatusPoller
+
+
+def _pending(session_id):
+    return {'sessionId': session_id, 'status': 'pending'}
+
+
+def test_wait_returns_when_session_completes():
+    with MockVerifly() as mock:
+        verifly = mock.client()
+        session_id = verifly.verification.create(phone='5551234567')['sessionId']
+        timer = threading.Timer(0.2, mock.complete, (session_id,))
+        timer.start()
+        try:
+            status = verifly.verification.wait(session_id, timeout=10)
+        finally:
+            timer.cancel()
+            verifly.close()
+        assert status['status'] == 'verified'
+
+
+def test_wait_times_out():
+    poller = StatusPoller(_pending, min_interval=0.01, max_interval=0.05)
+    try:
+        with pytest.raises(WaitTimeoutError):
+            poller.wait('s1', timeout=0.2)
+    finally:
+        poller.close()
+
+
+@pytest.mark.parametrize('error', [NotFoundError('Session not found'), RuntimeError('bad response')])
+def test_fetch_error_ends_wait(error):
+    def fetch(session_id):
+        raise error
+
+    poller = StatusPoller(fetch, min_interval=0.01)
+    try:
+        with pytest.raises(type(error)):
+            poller.wait('s1', timeout=5)
+    finally:
+        poller.close()
+
+
+def test_malformed_response_ends_wait():
+    poller = StatusPoller(lambda session_id: None, min_interval=0.01)
+    try:
+        with pytest.raises(AttributeError):
+            poller.wait('s1', timeout=5)
+    finally:
+        poller.close()
+
+
+def test_async_wait_errors_and_timeouts():
+    async def missing(session_id):
+        raise RuntimeError('bad response')
+
+    async def pending(session_id):
+        return _pending(session_id)
+
+    async def main():
+        poller = AsyncStatusPoller(missing, min_interval=0.01)
+        try:
+            with pytest.raises(RuntimeError):
+                await poller.wait('s1', timeout=5)
+        finally:
+            await poller.close()
+
+        poller = AsyncStatusPoller(pending, min_interval=0.01, max_interval=0.05)
+        try:
+            with pytest.raises(WaitTimeoutError):
+                await poller.wait('s1', timeout=0.2)
+        finally:
+            await poller.close()
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
+
+
+def test_async_close_cancels_polls_in_flight():
+    started = []
+    cancelled = []
+
+    async def slow(session_id):
+        started.append(session_id)
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(session_id)
+            raise
+
+    async def main():
+        poller = AsyncStatusPoller(slow, min_interval=0.01)
+        waiter = asyncio.ensure_future(poller.wait('s1', timeout=30))
+        while not started:
+            await asyncio.sleep(0.01)
+        await poller.close()
+        assert cancelled == ['s1']
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        assert pending == []
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
@@ -0,0 +1,108 @@
+"""
+Client-side token-bucket rate limiting
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+import verifly
+from verifly import ClientRateLimitError, FileLockBucketBackend, RateLimiter
+
+
+def test_burst_then_fail_fast():
+    limiter = RateLimiter({'create': (1, 3)}, block=False)
+    for _ in range(3):
+        limiter.acquire('create')
+    with pytest.raises(ClientRateLimitError) as info:
+        limiter.acquire('create')
+    assert 0 < info.value.retry_after <= 1.0
+    # Classes without a limit are never throttled
+    for _ in range(10):
+        limiter.acquire('status')
+
+
+def test_refill():
+    limiter = RateLimiter({'status': (20, 2)}, block=False)
+    limiter.acquire('status')
+    limiter.acquire('status')
+    with pytest.raises(ClientRateLimitError):
+        limiter.acquire('status')
+    time.sleep(0.06)
+    limiter.acquire('status')
+
+
+def test_blocking_waits_for_a_token():
+    limiter = RateLimiter({'status': (10, 1)})
+    limiter.acquire('status')
+    started = time.monotonic()
+    limiter.acquire('status')
+    assert 0.07 <= time.monotonic() - started < 0.5
+    with pytest.raises(ClientRateLimitError):
+        limiter.acquire('status', block=False)
+
+
+def test_max_wait():
+    limiter = RateLimiter({'create': (1, 1)}, max_wait=0.1)
+    limiter.acquire('create')
+    with pytest.raises(ClientRateLimitError):
+        limiter.acquire('create')
+
+
+_WORKER = '''
+import sys
+from verifly import ClientRateLimitError, FileLockBucketBackend, RateLimiter
+limiter = RateLimiter({'create': (0.001, 10)}, backend=FileLockBucketBackend(sys.argv[1]), block=False)
+taken = 0
+for _ in range(5):
+    try:
+        limiter.acquire('create')
+        taken += 1
+    except ClientRateLimitError:
+        pass
+print(taken)
+'''
+
+
+def test_file_backend_is_shared_between_processes(tmp_path):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(verifly.__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    workers = [
+        subprocess.Popen([sys.executable, '-c', _WORKER, str(tmp_path)],
+                         stdout=subprocess.PIPE, universal_newlines=True, env=env)
+        for _ in range(4)
+    ]
+    taken = [int(worker.communicate(timeout=30)[0]) for worker in workers]
+    # 4 processes x 5 attempts share one burst of 10
+    assert sum(taken) == 10
+
+
+def test_async_file_backend_runs_off_the_event_loop(tmp_path):
+    backend = FileLockBucketBackend(str(tmp_path))
+    threads = []
+    acquire = backend.acquire
+
+    def recording_acquire(*args):
+        threads.append(threading.current_thread())
+        return acquire(*args)
+
+    backend.acquire = recording_acquire
+    limiter = RateLimiter({'create': (10, 1)}, backend=backend)
+
+    async def main():
+        await limiter.acquire_async('create')
+        await limiter.acquire_async('create')
+        with pytest.raises(ClientRateLimitError):
+            await limiter.acquire_async('create', block=False)
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
+    assert threads and threading.main_thread() not in threads
@@ -0,0 +1,64 @@
+"""
+Retry policy: Retry-After handling and deadlines
+"""
+
+import time
+
+import pytest
+
+from verifly import RetryPolicy, ServerError
+from verifly.testing import MockVerifly
+from verifly.utils.retry import parse_retry_after
+
+
+def _session(mock):
+    verifly = mock.client(retry=RetryPolicy.disabled())
+    return verifly.verification.create(phone='5551234567')['sessionId']
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('2') == 2.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('soon') is None
+
+
+def test_retry_after_is_honored():
+    with MockVerifly() as mock:
+        session_id = _session(mock)
+        verifly = mock.client(retry=RetryPolicy(max_attempts=2))
+        mock.fail_next(503)
+        requests = mock.request_count
+        started = time.monotonic()
+        status = verifly.verification.get(session_id)
+        # MockVerifly answers 503 with Retry-After: 1
+        assert time.monotonic() - started >= 0.9
+        assert status['sessionId'] == session_id
+        assert mock.request_count == requests + 2
+
+
+def test_retry_after_over_limit_raises_at_once():
+    with MockVerifly() as mock:
+        session_id = _session(mock)
+        verifly = mock.client(retry=RetryPolicy(max_attempts=3, max_retry_after=0.5))
+        mock.fail_next(503)
+        requests = mock.request_count
+        started = time.monotonic()
+        with pytest.raises(ServerError):
+            verifly.verification.get(session_id)
+        assert time.monotonic() - started < 0.9
+        assert mock.request_count == requests + 1
+
+
+def test_deadline_stops_retrying():
+    with MockVerifly() as mock:
+        session_id = _session(mock)
+        policy = RetryPolicy(max_attempts=10, backoff_base=0.2, backoff_max=0.2,
+                             respect_retry_after=False, deadline=0.5)
+        verifly = mock.client(retry=policy)
+        mock.fail_next(503, count=10)
+        requests = mock.request_count
+        started = time.monotonic()
+        with pytest.raises(ServerError):
+            verifly.verification.get(session_id)
+        assert time.monotonic() - started < 1.0
+        assert 2 <= mock.request_count - requests <= 3
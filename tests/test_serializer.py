@@ -0,0 +1,51 @@
+"""
+Request body serializers: the signed bytes are the sent bytes
+"""
+
+import json
+
+import pytest
+
+from verifly.testing import MockVerifly
+from verifly.utils import serializer as serializers
+
+
+def _capture(verifly):
+    sent = []
+    verifly._request_handler.session.hooks['response'].append(
+        lambda response, *args, **kwargs: sent.append(response.request)
+    )
+    return sent
+
+
+@pytest.mark.parametrize('name', ['json_serializer', 'orjson_serializer'])
+def test_signed_bytes_are_sent_bytes(name):
+    if name == 'orjson_serializer':
+        pytest.importorskip('orjson')
+    serializer = getattr(serializers, name)
+
+    with MockVerifly() as mock:
+        verifly = mock.client(serializer=serializer)
+        sent = _capture(verifly)
+        data = {'userId': 'u1', 'name': 'Çağrı Işık', 'amount': 1.5}
+        verifly.verification.create(phone='5551234567', data=data)
+
+    request = sent[0]
+    assert request.body == serializer({'phone': '5551234567', 'data': data})
+    expected = mock.signer.sign(request.body, request.headers['X-Timestamp'])
+    assert request.headers['X-Signature'] == expected
+    assert json.loads(request.body)['data'] == data
+
+
+def test_serializers_are_compact():
+    data = {'a': [1, 2], 'b': 'x'}
+    assert serializers.json_serializer(data) == b'{"a":[1,2],"b":"x"}'
+    if serializers.orjson is not None:
+        assert serializers.orjson_serializer(data) == serializers.json_serializer(data)
+
+
+def test_default_prefers_orjson():
+    if serializers.orjson is not None:
+        assert serializers.get_default_serializer() is serializers.orjson_serializer
+    else:
+        assert serializers.get_default_serializer() is serializers.json_serializer
@@ -0,0 +1,38 @@
+"""
+MockVerifly: request authentication and webhook signing
+"""
+
+import http.client
+import json
+import time
+
+from verifly.testing import MockVerifly
+
+
+def test_signed_webhook_matches_dict_verification():
+    with MockVerifly() as mock:
+        verifly = mock.client()
+        data = {'sessionId': 's1', 'customData': {'name': 'Çağrı Işık'}}
+        body, headers = mock.sign_webhook('verification.completed', data)
+        # Compact UTF-8, as the API sends it
+        assert 'Çağrı'.encode('utf-8') in body
+        payload = json.loads(body)
+        assert verifly.webhook.verify(payload, headers['X-Signature'], headers['X-Timestamp'])
+        assert verifly.webhook.verify_raw(body, headers['X-Signature'], headers['X-Timestamp'])
+
+
+def test_non_ascii_signature_is_rejected_with_401():
+    with MockVerifly() as mock:
+        host, port = mock.url.split('//')[1].split(':')
+        conn = http.client.HTTPConnection(host, int(port.rstrip('/')), timeout=5)
+        try:
+            conn.request('GET', '/api/verify/balance', headers={
+                'X-API-Key': mock.api_key,
+                'X-Timestamp': str(int(time.time())),
+                'X-Signature': 'é' * 64,
+            })
+            response = conn.getresponse()
+            response.read()
+        finally:
+            conn.close()
+        assert response.status == 401
@@ -0,0 +1,68 @@
+"""
+Pre-keyed HMAC signer
+"""
+
+import hashlib
+import hmac
+
+from verifly.utils.signer import Signer
+
+SECRET = 'test-secret-key'
+BODY = b'{"phone":"5551234567"}'
+TIMESTAMP = '1700000000'
+
+
+def _reference(payload, timestamp):
+    return hmac.new(SECRET.encode('utf-8'), payload + timestamp.encode('ascii'),
+                    hashlib.sha256).hexdigest()
+
+
+def test_sign_matches_plain_hmac():
+    signer = Signer(SECRET)
+    assert signer.sign(BODY, TIMESTAMP) == _reference(BODY, TIMESTAMP)
+    # str payloads are UTF-8 encoded; the pre-keyed state is reused
+    assert signer.sign(BODY.decode('utf-8'), TIMESTAMP.encode('ascii')) == _reference(BODY, TIMESTAMP)
+    assert signer.sign('ş', TIMESTAMP) == _reference('ş'.encode('utf-8'), TIMESTAMP)
+
+
+def test_idempotency_key_changes_the_signature():
+    signer = Signer(SECRET)
+    keyed = signer.sign(BODY, TIMESTAMP, 'k1')
+    assert keyed == _reference(BODY + TIMESTAMP.encode('ascii') + b'\n', 'k1')
+    assert keyed != signer.sign(BODY, TIMESTAMP, 'k2')
+    assert signer.sign(BODY, TIMESTAMP, None) == signer.sign(BODY, TIMESTAMP)
+    assert signer.verify(BODY, TIMESTAMP, keyed, 'k1')
+    assert not signer.verify(BODY, TIMESTAMP, keyed, 'k2')
+    assert not signer.verify(BODY, TIMESTAMP, keyed)
+
+
+def test_verify():
+    signer = Signer(SECRET)
+    signature = signer.sign(BODY, TIMESTAMP)
+    assert signer.verify(BODY, TIMESTAMP, signature)
+    assert signer.verify(BODY, TIMESTAMP, signature.encode('ascii'))
+    assert not signer.verify(BODY + b' ', TIMESTAMP, signature)
+    assert not signer.verify(BODY, '1700000001', signature)
+    assert not signer.verify(BODY, TIMESTAMP, Signer('other').sign(BODY, TIMESTAMP))
+    assert not signer.verify(BODY, TIMESTAMP, '')
+    assert not signer.verify(BODY, TIMESTAMP, None)
+
+
+def test_verify_rejects_non_ascii_signatures():
+    signer = Signer(SECRET)
+    for signature in ('é' * 64, 'ÿ' * 64, '\ud800' * 64, signer.sign(BODY, TIMESTAMP)[:-1] + 'ş'):
+        assert signer.verify(BODY, TIMESTAMP, signature) is False
+    assert signer.verify_many([(BODY, TIMESTAMP, 'é' * 64)]) == [False]
+
+
+def test_sign_many_and_verify_many():
+    signer = Signer(SECRET)
+    items = [(BODY, TIMESTAMP), (b'{}', '1700000001'), ('ş', '1700000002')]
+    signatures = signer.sign_many(items)
+    assert signatures == [signer.sign(payload, timestamp) for payload, timestamp in items]
+
+    checks = [(payload, timestamp, signature)
+              for (payload, timestamp), signature in zip(items, signatures)]
+    checks.append((BODY, TIMESTAMP, signatures[1]))
+    checks.append((BODY, TIMESTAMP, ''))
+    assert signer.verify_many(checks) == [True, True, True, False, False]
@@ -0,0 +1,91 @@
+"""
+Request coalescing: concurrent identical GETs share one HTTP request
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from verifly import RetryPolicy, ServerError
+from verifly.testing import MockVerifly
+
+CALLERS = 8
+
+
+def _session(mock):
+    return mock.client().verification.create(phone='5551234567')['sessionId']
+
+
+def _get_concurrently(verifly, session_id):
+    barrier = threading.Barrier(CALLERS)
+    outcomes = [None] * CALLERS
+
+    def call(i):
+        barrier.wait()
+        try:
+            outcomes[i] = verifly.verification.get(session_id)
+        except Exception as e:
+            outcomes[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(CALLERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_sync_concurrent_gets_share_one_request():
+    # The server's latency keeps the first request in flight while the rest arrive
+    with MockVerifly(latency=0.3) as mock:
+        session_id = _session(mock)
+        verifly = mock.client(coalesce_requests=True)
+        requests = mock.request_count
+        outcomes = _get_concurrently(verifly, session_id)
+        assert mock.request_count == requests + 1
+        assert all(status['sessionId'] == session_id for status in outcomes)
+        assert all(status is outcomes[0] for status in outcomes)
+
+
+def test_sync_error_reaches_every_caller():
+    with MockVerifly(latency=0.3) as mock:
+        session_id = _session(mock)
+        verifly = mock.client(coalesce_requests=True, retry=RetryPolicy.disabled())
+        requests = mock.request_count
+        mock.fail_next(503)
+        outcomes = _get_concurrently(verifly, session_id)
+        assert mock.request_count == requests + 1
+        assert all(isinstance(e, ServerError) for e in outcomes)
+        # Nothing is kept once the request completes
+        assert verifly.verification.get(session_id)['sessionId'] == session_id
+
+
+@pytest.mark.parametrize('fail', [False, True])
+def test_async_concurrent_gets_share_one_request(fail):
+    loop = asyncio.new_event_loop()
+
+    async def run(mock, session_id):
+        verifly = mock.async_client(coalesce_requests=True, retry=RetryPolicy.disabled())
+        try:
+            return await asyncio.gather(
+                *[verifly.verification.get(session_id) for _ in range(CALLERS)],
+                return_exceptions=True
+            )
+        finally:
+            await verifly.close()
+
+    try:
+        with MockVerifly(latency=0.3) as mock:
+            session_id = _session(mock)
+            requests = mock.request_count
+            if fail:
+                mock.fail_next(503)
+            outcomes = loop.run_until_complete(run(mock, session_id))
+            assert mock.request_count == requests + 1
+    finally:
+        loop.close()
+    if fail:
+        assert all(isinstance(e, ServerError) for e in outcomes)
+    else:
+        assert all(status['sessionId'] == session_id for status in outcomes)
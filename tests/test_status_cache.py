@@ -0,0 +1,69 @@
+"""
+StatusCache: webhook events update cached sessions
+"""
+
+import queue
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from verifly import StatusCache
+from verifly.testing import MockVerifly
+
+
+def test_event_name_sets_the_status():
+    cache = StatusCache()
+    cache.set_status('s1', {'sessionId': 's1', 'status': 'pending', 'method': None})
+    # Webhook data has no status field
+    cache.apply_event({'event': 'verification.completed', 'data': {'sessionId': 's1', 'method': 'sms'}})
+    assert cache.get_status('s1') == {'sessionId': 's1', 'status': 'verified', 'method': 'sms'}
+
+    cache.set_status('s2', {'sessionId': 's2', 'status': 'pending'})
+    cache.apply_event({'event': 'verification.failed', 'data': {'sessionId': 's2', 'reason': 'x'}})
+    assert cache.get_status('s2')['status'] == 'failed'
+
+
+def test_unknown_event_drops_the_entry():
+    cache = StatusCache()
+    cache.set_status('s1', {'sessionId': 's1', 'status': 'pending'})
+    cache.apply_event({'event': 'verification.unknown', 'data': {'sessionId': 's1'}})
+    assert cache.get_status('s1') is None
+
+
+def _receiver():
+    deliveries = queue.Queue()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers['Content-Length']))
+            deliveries.put((body, dict(self.headers)))
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, deliveries
+
+
+def test_delivered_webhook_updates_the_cache():
+    server, deliveries = _receiver()
+    url = f'http://127.0.0.1:{server.server_address[1]}/hook'
+    try:
+        with MockVerifly(webhook_url=url) as mock:
+            verifly = mock.client(cache=StatusCache())
+            session_id = verifly.verification.create(phone='5551234567')['sessionId']
+            assert verifly.verification.get(session_id)['status'] == 'pending'
+            requests = mock.request_count
+            mock.complete(session_id, 'sms')
+            body, headers = deliveries.get(timeout=5)
+            event = verifly.webhook.construct_event_from_bytes(
+                body, headers['X-Signature'], headers['X-Timestamp']
+            )
+            assert 'status' not in event['data']
+            assert verifly.verification.get(session_id)['status'] == 'verified'
+            assert mock.request_count == requests
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,173 @@
+"""
+Transaction history: cursor pagination with prefetch, and exports
+"""
+
+import asyncio
+import csv
+import io
+import json
+import time
+
+import pytest
+
+from verifly import (
+    Transaction, awrite_transactions_csv, awrite_transactions_ndjson,
+    write_transactions_csv, write_transactions_ndjson
+)
+from verifly.testing import MockVerifly
+from verifly.utils.pagination import aiter_pages, iter_pages
+
+
+def _pages(count, size=2):
+    """fetch() over ``count`` pages of ``size`` ints, recording cursors"""
+    requested = []
+
+    def fetch(cursor):
+        page = int(cursor or 0)
+        requested.append(page)
+        items = list(range(page * size, (page + 1) * size))
+        return items, str(page + 1) if page + 1 < count else None
+
+    return fetch, requested
+
+
+def test_iter_pages_prefetches_one_page_ahead():
+    fetch, requested = _pages(3)
+    pages = iter_pages(fetch)
+    assert next(pages) == 0
+    # The second page is requested while the first is being consumed
+    deadline = time.monotonic() + 5
+    while len(requested) < 2 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert requested == [0, 1]
+    assert list(pages) == [1, 2, 3, 4, 5]
+    assert requested == [0, 1, 2]
+
+
+def test_iter_pages_without_prefetch_fetches_on_demand():
+    fetch, requested = _pages(3)
+    pages = iter_pages(fetch, prefetch=False)
+    assert [next(pages), next(pages)] == [0, 1]
+    assert requested == [0]
+    assert next(pages) == 2 and requested == [0, 1]
+    pages.close()
+    assert requested == [0, 1]
+
+
+def test_aiter_pages_prefetches_and_stops_early():
+    fetched = []
+
+    async def fetch(cursor):
+        page = int(cursor or 0)
+        fetched.append(page)
+        return [page], str(page + 1)
+
+    async def run():
+        seen = []
+        async for item in aiter_pages(fetch):
+            seen.append(item)
+            await asyncio.sleep(0)
+            if item == 2:
+                break
+        return seen
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(run()) == [0, 1, 2]
+    finally:
+        loop.close()
+    # At most one page beyond the one being consumed
+    assert fetched == [0, 1, 2, 3]
+
+
+def _history(mock, sessions=5):
+    verifly = mock.client()
+    for i in range(sessions):
+        verifly.verification.create(phone=f'555123456{i}')
+        # Distinct millisecond timestamps
+        time.sleep(0.005)
+    return verifly
+
+
+def test_iter_transactions_walks_every_page():
+    with MockVerifly() as mock:
+        verifly = _history(mock)
+        balance = verifly.verification.get_balance()
+        requests = mock.request_count
+        transactions = list(verifly.verification.iter_transactions(page_size=2))
+        assert len(transactions) == 5
+        assert mock.request_count == requests + 3
+        ids = {t['sessionId'] for t in balance['recentTransactions']}
+        assert ids <= {t['sessionId'] for t in transactions}
+        with pytest.raises(ValueError):
+            verifly.verification.iter_transactions(page_size=0)
+
+
+def test_iter_transactions_since_filter():
+    with MockVerifly() as mock:
+        verifly = _history(mock)
+        everything = list(verifly.verification.iter_transactions())
+        since = everything[2]['createdAt']
+        recent = list(verifly.verification.iter_transactions(since=since, page_size=2))
+        assert recent == everything[2:]
+
+
+def test_typed_transactions():
+    with MockVerifly() as mock:
+        _history(mock, sessions=2)
+        verifly = mock.client(typed_responses=True)
+        transactions = list(verifly.verification.iter_transactions())
+        assert all(isinstance(t, Transaction) for t in transactions)
+        assert transactions[0].created_at.tzinfo is not None
+
+
+TRANSACTIONS = [
+    {'createdAt': '2025-01-01T00:00:00.000Z', 'type': 'debit', 'amount': 1.0,
+     'description': 'Doğrulama, "SMS"', 'sessionId': 's1'},
+    Transaction({'createdAt': '2025-01-02T00:00:00.000Z', 'type': 'credit', 'amount': 50.0}),
+]
+
+
+def _check_csv(text, count):
+    assert count == 2
+    rows = list(csv.reader(io.StringIO(text)))
+    assert rows[0] == ['createdAt', 'type', 'amount', 'description', 'sessionId']
+    assert rows[1] == ['2025-01-01T00:00:00.000Z', 'debit', '1.0', 'Doğrulama, "SMS"', 's1']
+    assert rows[2] == ['2025-01-02T00:00:00.000Z', 'credit', '50.0', '', '']
+
+
+def _check_ndjson(text, count):
+    assert count == 2
+    lines = text.splitlines()
+    assert [json.loads(line) for line in lines] == [dict(t) for t in TRANSACTIONS]
+    assert 'Doğrulama' in lines[0]
+
+
+def test_export_csv_and_ndjson():
+    out = io.StringIO(newline='')
+    count = write_transactions_csv(TRANSACTIONS, out)
+    _check_csv(out.getvalue(), count)
+    out = io.StringIO(newline='')
+    assert write_transactions_csv(TRANSACTIONS, out, fields=('type',), header=False) == 2
+    assert out.getvalue().splitlines() == ['debit', 'credit']
+
+    out = io.StringIO()
+    count = write_transactions_ndjson(iter(TRANSACTIONS), out)
+    _check_ndjson(out.getvalue(), count)
+
+
+def test_async_export_csv_and_ndjson():
+    async def source():
+        for transaction in TRANSACTIONS:
+            yield transaction
+
+    loop = asyncio.new_event_loop()
+    try:
+        out = io.StringIO(newline='')
+        count = loop.run_until_complete(awrite_transactions_csv(source(), out))
+        _check_csv(out.getvalue(), count)
+        out = io.StringIO()
+        count = loop.run_until_complete(awrite_transactions_ndjson(source(), out))
+        _check_ndjson(out.getvalue(), count)
+    finally:
+        loop.close()
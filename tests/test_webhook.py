@@ -0,0 +1,98 @@
+"""
+Webhook verification over raw bodies and parsed payloads
+"""
+
+import json
+import time
+
+import pytest
+
+from verifly import Verifly, WebhookVerificationError
+from verifly.resources.webhook import Webhook
+
+SECRET = 'test-secret-key'
+
+
+def _deliver(payload, timestamp=None, ensure_ascii=False):
+    body = json.dumps(payload, separators=(',', ':'), ensure_ascii=ensure_ascii).encode('utf-8')
+    timestamp = timestamp or str(int(time.time()))
+    return body, Webhook(SECRET).signer.sign(body, timestamp), timestamp
+
+
+PAYLOAD = {
+    'event': 'verification.completed',
+    'data': {'sessionId': 's1', 'method': 'sms', 'customData': {'name': 'Çağrı Işık'}},
+}
+
+
+def test_raw_body_accepts_delivered_bytes():
+    webhook = Webhook(SECRET, tolerance=300)
+    body, signature, timestamp = _deliver(PAYLOAD)
+    assert webhook.verify_raw(body, signature, timestamp)
+    assert webhook.verify_raw(bytearray(body), signature, timestamp)
+    assert webhook.verify_raw(memoryview(body), signature, timestamp)
+    assert webhook.construct_event_from_bytes(memoryview(body), signature, timestamp) == PAYLOAD
+
+
+def test_raw_body_is_verified_as_sent():
+    # The sender's encoding is what counts, not a re-serialization
+    webhook = Webhook(SECRET, tolerance=300)
+    body, signature, timestamp = _deliver(PAYLOAD, ensure_ascii=True)
+    assert webhook.verify_raw(body, signature, timestamp)
+    assert webhook.construct_event_from_bytes(body, signature, timestamp) == PAYLOAD
+
+
+@pytest.mark.parametrize('tamper', [
+    lambda body: body.replace(b's1', b's2'),
+    lambda body: body + b' ',
+    lambda body: body.replace(b',', b', ', 1),
+])
+def test_raw_body_rejects_tampered_bytes(tamper):
+    webhook = Webhook(SECRET, tolerance=300)
+    body, signature, timestamp = _deliver(PAYLOAD)
+    assert not webhook.verify_raw(tamper(body), signature, timestamp)
+    with pytest.raises(WebhookVerificationError):
+        webhook.construct_event_from_bytes(tamper(body), signature, timestamp)
+
+
+@pytest.mark.parametrize('timestamp', [str(int(time.time()) - 3600), 'not-a-number', None])
+def test_raw_body_rejects_bad_timestamps(timestamp):
+    webhook = Webhook(SECRET, tolerance=300)
+    body, signature, _ = _deliver(PAYLOAD, timestamp=timestamp)
+    assert not webhook.verify_raw(body, signature, timestamp)
+    with pytest.raises(WebhookVerificationError):
+        webhook.construct_event_from_bytes(body, signature, timestamp)
+
+
+def test_raw_body_rejects_missing_or_foreign_signature():
+    webhook = Webhook(SECRET, tolerance=300)
+    body, _, timestamp = _deliver(PAYLOAD)
+    assert not webhook.verify_raw(body, None, timestamp)
+    assert not webhook.verify_raw(body, Webhook('other').signer.sign(body, timestamp), timestamp)
+
+
+def test_raw_and_dict_verification_agree():
+    webhook = Webhook(SECRET, tolerance=300)
+    body, signature, timestamp = _deliver(PAYLOAD)
+    assert webhook.verify_raw(body, signature, timestamp)
+    assert webhook.verify(PAYLOAD, signature, timestamp)
+    assert webhook.generate_signature(PAYLOAD, timestamp) == signature
+    assert webhook.construct_event(PAYLOAD, signature, timestamp) == \
+        webhook.construct_event_from_bytes(body, signature, timestamp)
+
+
+def test_timestamps_are_not_checked_by_default():
+    old = str(int(time.time()) - 86400)
+    body, signature, timestamp = _deliver(PAYLOAD, timestamp=old)
+    webhook = Webhook(SECRET)
+    assert webhook.verify(PAYLOAD, signature, timestamp)
+    assert webhook.construct_event_from_bytes(body, signature, timestamp) == PAYLOAD
+    assert not Webhook(SECRET, tolerance=300).verify(PAYLOAD, signature, timestamp)
+
+
+def test_client_webhook_tolerance_is_opt_in():
+    old = str(int(time.time()) - 3600)
+    body, signature, timestamp = _deliver(PAYLOAD, timestamp=old)
+    assert Verifly('key', SECRET).webhook.verify_raw(body, signature, timestamp)
+    strict = Verifly('key', SECRET, webhook_tolerance=300)
+    assert not strict.webhook.verify_raw(body, signature, timestamp)
@@ -20,7 +20,13 @@ Example:
 __version__ = '1.0.0'
 __author__ = 'SOCIFLY SOFTWARE LTD.'
 
+import logging
+
+# Library logging stays silent unless the application configures it
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 from .client import Verifly
+from .async_client import AsyncVerifly
 from .errors import (
     VeriflyError,
     AuthenticationError,
@@ -28,16 +34,72 @@ from .errors import (
     InsufficientBalanceError,
     NotFoundError,
     RateLimitError,
-    ServerError
+    ClientRateLimitError,
+    ServerError,
+    NetworkError,
+    RequestTimeoutError,
+    CircuitOpenError,
+    WaitTimeoutError,
+    WebhookVerificationError,
+    DuplicateWebhookError
+)
+from .dispatcher import WebhookDispatcher, AsyncWebhookDispatcher
+from .models import Session, SessionStatus, Balance, Transaction, Status
+from .utils.circuit import CircuitBreaker
+from .utils.export import (
+    write_transactions_csv,
+    write_transactions_ndjson,
+    awrite_transactions_csv,
+    awrite_transactions_ndjson
 )
+from .utils.failover import EndpointPool, HedgePolicy
+from .utils.hooks import RequestHooks, RequestEvent
+from .utils.idempotency import IdempotencyStore, InMemoryIdempotencyStore
+from .utils.ratelimit import RateLimiter, InMemoryBucketBackend, FileLockBucketBackend
+from .utils.replay import ReplayStore, InMemoryReplayStore
+from .utils.retry import RetryPolicy
+from .utils.status_cache import StatusCache
 
 __all__ = [
     'Verifly',
+    'AsyncVerifly',
     'VeriflyError',
     'AuthenticationError',
     'ValidationError',
     'InsufficientBalanceError',
     'NotFoundError',
     'RateLimitError',
+    'ClientRateLimitError',
     'ServerError',
+    'NetworkError',
+    'RequestTimeoutError',
+    'CircuitOpenError',
+    'WaitTimeoutError',
+    'WebhookVerificationError',
+    'DuplicateWebhookError',
+    'WebhookDispatcher',
+    'AsyncWebhookDispatcher',
+    'Session',
+    'SessionStatus',
+    'Balance',
+    'Transaction',
+    'Status',
+    'RetryPolicy',
+    'CircuitBreaker',
+    'EndpointPool',
+    'HedgePolicy',
+    'RequestHooks',
+    'RequestEvent',
+    'RateLimiter',
+    'InMemoryBucketBackend',
+    'FileLockBucketBackend',
+    'ReplayStore',
+    'InMemoryReplayStore',
+    'StatusCache',
+    'IdempotencyStore',
+    'InMemoryIdempotencyStore',
+    'write_transactions_csv',
+    'write_transactions_ndjson',
+    'awrite_transactions_csv',
+    'awrite_transactions_ndjson',
 ]
@@ -0,0 +1,211 @@
+"""
+Verifly Asyncio Client
+"""
+
+from typing import Optional, Sequence, Union
+from .utils.async_request import AsyncRequestHandler
+from .utils.ratelimit import RateLimiter
+from .utils.retry import RetryPolicy
+from .utils.serializer import Serializer
+from .utils.signer import Signer
+from .resources.async_verification import AsyncVerification
+from .resources.webhook import Webhook
+from .utils.replay import ReplayStore
+from .utils.circuit import CircuitBreaker
+from .utils.failover import EndpointPool, HedgePolicy
+from .utils.hooks import RequestHooks
+from .utils.idempotency import IdempotencyStore
+from .utils.status_cache import StatusCache
+
+
+class AsyncVerifly:
+    """
+    Asyncio Verifly SDK client
+
+    Mirrors ``Verifly`` with awaitable resource methods. All requests share
+    one bounded connection pool, so a single process can keep many
+    verification calls in flight without blocking the event loop.
+
+    Example:
+        from verifly import AsyncVerifly
+
+        async with AsyncVerifly(
+            api_key='your-api-key',
+            secret_key='your-secret-key'
+        ) as verifly:
+            session = await verifly.verification.create(
+                phone='5551234567',
+                methods=['sms', 'whatsapp']
+            )
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        secret_key: str,
+        timeout: int = 30,
+        debug: bool = False,
+        max_connections: int = 100,
+        session=None,
+        serializer: Optional[Serializer] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        keepalive_timeout: float = 15.0,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        webhook_tolerance: Optional[float] = None,
+        webhook_replay_store: Optional[ReplayStore] = None,
+        hooks: Optional[Sequence[RequestHooks]] = None,
+        cache: Optional[StatusCache] = None,
+        coalesce_requests: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        base_urls: Optional[Union[Sequence[str], EndpointPool]] = None,
+        hedge: Optional[HedgePolicy] = None,
+        typed_responses: bool = False,
+        idempotency_store: Optional[IdempotencyStore] = None
+    ):
+        """
+        Initialize async Verifly client
+
+        Args:
+            api_key: Your Verifly API key
+            secret_key: Application secret key (REQUIRED for HMAC authentication)
+            timeout: Request timeout in seconds (default: 30)
+            debug: Enable debug logging (default: False)
+            max_connections: Maximum concurrent connections in the pool (default: 100)
+            session: Existing ``aiohttp.ClientSession`` to share between clients
+            serializer: Callable encoding request data to JSON bytes
+            retry: Retry policy for transient failures (default: RetryPolicy())
+            rate_limiter: Client-side rate limiter applied before each request
+            keepalive_timeout: Seconds idle connections are kept alive (default: 15)
+            connect_timeout: Connection timeout in seconds (default: timeout)
+            read_timeout: Socket read timeout in seconds (default: timeout)
+            webhook_tolerance: Maximum webhook X-Timestamp age in seconds,
+                e.g. 300 (default: None, timestamps are not checked)
+            webhook_replay_store: Store used to reject duplicate webhook deliveries
+            hooks: Request lifecycle hooks (see RequestHooks)
+            cache: Cache for session status and balance reads; kept up
+                to date by webhooks verified with this client
+            coalesce_requests: Let concurrent identical GETs (``get``,
+                ``get_balance``) share one HTTP request (default: False)
+            circuit_breaker: Fail requests fast with CircuitOpenError while
+                the API is failing (see CircuitBreaker)
+            base_urls: API base URLs in order of preference, with failover
+                to the next healthy one; or an EndpointPool to tune health
+                tracking (default: the production API)
+            hedge: Hedge slow GETs with a second request (see HedgePolicy)
+            typed_responses: Return Session, SessionStatus and Balance
+                models instead of dicts (default: False)
+            idempotency_store: Remember create() results by idempotency
+                key and return them for repeated keys (see
+                InMemoryIdempotencyStore)
+
+        Raises:
+            ValueError: If api_key or secret_key is missing
+            ImportError: If aiohttp is not installed
+        """
+        if not api_key:
+            raise ValueError('API key is required')
+
+        if not secret_key:
+            raise ValueError(
+                'Secret key is required. '
+                'Get it from Dashboard → Application → Secret Key'
+            )
+
+        self.api_key = api_key
+        self.secret_key = secret_key
+        self.timeout = timeout
+        self.debug = debug
+
+        # One pre-keyed signer shared by requests and webhooks
+        self._signer = Signer(self.secret_key)
+
+        # Initialize request handler
+        self._request_handler = AsyncRequestHandler(
+            api_key=self.api_key,
+            secret_key=self.secret_key,
+            timeout=self.timeout,
+            debug=self.debug,
+            max_connections=max_connections,
+            session=session,
+            serializer=serializer,
+            signer=self._signer,
+            retry_policy=retry,
+            rate_limiter=rate_limiter,
+            keepalive_timeout=keepalive_timeout,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            hooks=hooks,
+            coalesce_requests=coalesce_requests,
+            circuit_breaker=circuit_breaker,
+            base_urls=base_urls,
+            hedge=hedge
+        )
+
+        # Initialize resources
+        self.verification = AsyncVerification(
+            self._request_handler,
+            cache=cache,
+            typed_responses=typed_responses,
+            idempotency_store=idempotency_store
+        )
+        self.webhook = Webhook(
+            self.secret_key,
+            signer=self._signer,
+            tolerance=webhook_tolerance,
+            replay_store=webhook_replay_store,
+            hooks=hooks
+        )
+        if cache is not None:
+            self.webhook.add_listener(cache.apply_event)
+
+    def set_secret_key(self, secret_key: str) -> None:
+        """
+        Update secret key
+
+        The connection pool is kept; only the signing key changes.
+
+        Args:
+            secret_key: New secret key
+        """
+        self.set_credentials(self.api_key, secret_key)
+
+    def set_credentials(self, api_key: str, secret_key: str) -> None:
+        """
+        Atomically replace the API key and secret key
+
+        Args:
+            api_key: New API key
+            secret_key: New secret key
+        """
+        if not api_key or not secret_key:
+            raise ValueError('API key and secret key are required')
+
+        signer = Signer(secret_key)
+        self._request_handler.set_credentials(api_key, signer)
+        self.webhook.signer = signer
+        self._signer = signer
+        self.api_key = api_key
+        self.secret_key = secret_key
+
+    def set_debug(self, enabled: bool) -> None:
+        """
+        Enable or disable debug mode
+
+        Args:
+            enabled: Enable debug logging
+        """
+        self.debug = enabled
+        self._request_handler.debug = enabled
+
+    async def close(self) -> None:
+        """Stop background polling and close the connection pool"""
+        await self.verification.poller.close()
+        await self._request_handler.close()
+
+    async def __aenter__(self) -> 'AsyncVerifly':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
@@ -2,10 +2,20 @@
 Verifly Main Client
 """
 
-from typing import Optional
+from typing import Optional, Sequence, Union
 from .utils.request import RequestHandler
+from .utils.ratelimit import RateLimiter
+from .utils.retry import RetryPolicy
+from .utils.serializer import Serializer
+from .utils.signer import Signer
 from .resources.verification import Verification
 from .resources.webhook import Webhook
+from .utils.replay import ReplayStore
+from .utils.circuit import CircuitBreaker
+from .utils.failover import EndpointPool, HedgePolicy
+from .utils.hooks import RequestHooks
+from .utils.idempotency import IdempotencyStore
+from .utils.status_cache import StatusCache
 
 
 class Verifly:
@@ -32,7 +42,24 @@ class Verifly:
         api_key: str,
         secret_key: str,
         timeout: int = 30,
-        debug: bool = False
+        debug: bool = False,
+        serializer: Optional[Serializer] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        pool_size: int = 10,
+        pool_block: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        webhook_tolerance: Optional[float] = None,
+        webhook_replay_store: Optional[ReplayStore] = None,
+        hooks: Optional[Sequence[RequestHooks]] = None,
+        cache: Optional[StatusCache] = None,
+        coalesce_requests: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        base_urls: Optional[Union[Sequence[str], EndpointPool]] = None,
+        hedge: Optional[HedgePolicy] = None,
+        typed_responses: bool = False,
+        idempotency_store: Optional[IdempotencyStore] = None
     ):
         """
         Initialize Verifly client
@@ -42,6 +69,36 @@ class Verifly:
             secret_key: Application secret key (REQUIRED for HMAC authentication)
             timeout: Request timeout in seconds (default: 30)
             debug: Enable debug logging (default: False)
+            serializer: Callable encoding request data to JSON bytes
+                (default: orjson if installed, else the json module)
+            retry: Retry policy for transient failures (default: RetryPolicy();
+                use RetryPolicy.disabled() to turn retries off)
+            rate_limiter: Client-side rate limiter applied before each request
+            pool_size: Keep-alive connections retained per host (default: 10);
+                set it to at least the number of threads using the client
+            pool_block: Make pool_size a hard cap on concurrent connections
+                instead of opening short-lived extras (default: False)
+            connect_timeout: Connection timeout in seconds (default: timeout)
+            read_timeout: Read timeout in seconds (default: timeout)
+            webhook_tolerance: Maximum webhook X-Timestamp age in seconds,
+                e.g. 300 (default: None, timestamps are not checked)
+            webhook_replay_store: Store used to reject duplicate webhook deliveries
+            hooks: Request lifecycle hooks (see RequestHooks)
+            cache: Cache for session status and balance reads; kept up
+                to date by webhooks verified with this client
+            coalesce_requests: Let concurrent identical GETs (``get``,
+                ``get_balance``) share one HTTP request (default: False)
+            circuit_breaker: Fail requests fast with CircuitOpenError while
+                the API is failing (see CircuitBreaker)
+            base_urls: API base URLs in order of preference, with failover
+                to the next healthy one; or an EndpointPool to tune health
+                tracking (default: the production API)
+            hedge: Hedge slow GETs with a second request (see HedgePolicy)
+            typed_responses: Return Session, SessionStatus and Balance
+                models instead of dicts (default: False)
+            idempotency_store: Remember create() results by idempotency
+                key and return them for repeated keys (see
+                InMemoryIdempotencyStore)
             
         Raises:
             ValueError: If api_key or secret_key is missing
@@ -74,38 +131,86 @@ class Verifly:
         self.secret_key = secret_key
         self.timeout = timeout
         self.debug = debug
+        self.serializer = serializer
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
         
-        # Initialize request handler
+        # One pre-keyed signer shared by requests and webhooks
+        self._signer = Signer(self.secret_key)
+        
+        # Initialize request handler (one transport for the client's lifetime)
         self._request_handler = RequestHandler(
             api_key=self.api_key,
             secret_key=self.secret_key,
             timeout=self.timeout,
-            debug=self.debug
+            debug=self.debug,
+            serializer=self.serializer,
+            signer=self._signer,
+            retry_policy=self.retry,
+            rate_limiter=self.rate_limiter,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            pool_maxsize=pool_size,
+            pool_block=pool_block,
+            hooks=hooks,
+            coalesce_requests=coalesce_requests,
+            circuit_breaker=circuit_breaker,
+            base_urls=base_urls,
+            hedge=hedge
         )
         
         # Initialize resources
-        self.verification = Verification(self._request_handler)
-        self.webhook = Webhook(self.secret_key)
+        self.verification = Verification(
+            self._request_handler,
+            cache=cache,
+            typed_responses=typed_responses,
+            idempotency_store=idempotency_store
+        )
+        self.webhook = Webhook(
+            self.secret_key,
+            signer=self._signer,
+            tolerance=webhook_tolerance,
+            replay_store=webhook_replay_store,
+            hooks=hooks
+        )
+        if cache is not None:
+            self.webhook.add_listener(cache.apply_event)
     
     def set_secret_key(self, secret_key: str) -> None:
         """
         Update secret key
         
+        The connection pool is kept; requests already in flight finish
+        with the previous key.
+        
         Args:
             secret_key: New secret key
             
         Example:
             verifly.set_secret_key('new-secret-key')
         """
+        self.set_credentials(self.api_key, secret_key)
+    
+    def set_credentials(self, api_key: str, secret_key: str) -> None:
+        """
+        Atomically replace the API key and secret key
+        
+        Args:
+            api_key: New API key
+            secret_key: New secret key
+            
+        Example:
+            verifly.set_credentials('new-api-key', 'new-secret-key')
+        """
+        if not api_key or not secret_key:
+            raise ValueError('API key and secret key are required')
+        
+        signer = Signer(secret_key)
+        self._request_handler.set_credentials(api_key, signer)
+        self.webhook.signer = signer
+        self._signer = signer
+        self.api_key = api_key
         self.secret_key = secret_key
-        self.webhook = Webhook(secret_key)
-        self._request_handler = RequestHandler(
-            api_key=self.api_key,
-            secret_key=secret_key,
-            timeout=self.timeout,
-            debug=self.debug
-        )
-        self.verification = Verification(self._request_handler)
     
     def set_debug(self, enabled: bool) -> None:
         """
@@ -118,10 +223,22 @@ class Verifly:
             verifly.set_debug(True)
         """
         self.debug = enabled
-        self._request_handler = RequestHandler(
-            api_key=self.api_key,
-            secret_key=self.secret_key,
-            timeout=self.timeout,
-            debug=enabled
-        )
-        self.verification = Verification(self._request_handler)
+        self._request_handler.debug = enabled
+    
+    def close(self) -> None:
+        """
+        Stop background polling and close pooled connections
+        
+        Example:
+            with Verifly(api_key='...', secret_key='...') as verifly:
+                verifly.verification.get_balance()
+        """
+        if self.verification._poller is not None:
+            self.verification._poller.close()
+        self._request_handler.close()
+    
+    def __enter__(self) -> 'Verifly':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
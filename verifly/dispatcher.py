@@ -0,0 +1,392 @@
+"""
+Webhook Dispatcher - Acknowledge fast, process events on a worker pool
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .errors import DuplicateWebhookError, WebhookVerificationError
+from .resources.webhook import Webhook, WebhookResponse
+
+logger = logging.getLogger(__name__)
+
+# Handlers registered under this event type receive every event
+ALL_EVENTS = '*'
+
+# Async verification of bodies at least this large runs off the event loop
+OFFLOAD_THRESHOLD = 64 * 1024
+
+Handler = Callable[[Dict[str, Any]], Any]
+ErrorHandler = Callable[[Dict[str, Any], BaseException], Any]
+
+
+def _response(status: int, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    # WebhookResponse bodies carry the status as '_status'; it is not sent
+    return status, {k: v for k, v in body.items() if k != '_status'}
+
+
+def verify_delivery(
+    webhook: Webhook,
+    body: Union[bytes, bytearray, str],
+    signature: Optional[str],
+    timestamp: Optional[str]
+) -> Tuple[Optional[Dict[str, Any]], Optional[Tuple[int, Dict[str, Any]]]]:
+    """
+    Verify a raw webhook delivery and map failures to HTTP responses
+
+    Args:
+        webhook: Webhook resource used for verification
+        body: Raw request body
+        signature: X-Signature header
+        timestamp: X-Timestamp header
+
+    Returns:
+        (event, None) when verified, otherwise (None, (status, body)):
+        200 for duplicates, 401 for invalid signatures, 400 for bad JSON
+    """
+    try:
+        return webhook.construct_event_from_bytes(body, signature, timestamp), None
+    except DuplicateWebhookError:
+        return None, _response(200, WebhookResponse.success('Duplicate delivery'))
+    except WebhookVerificationError:
+        return None, _response(401, WebhookResponse.unauthorized('Invalid signature'))
+    except ValueError:
+        return None, _response(400, WebhookResponse.error('Invalid payload'))
+
+
+async def verify_delivery_async(
+    webhook: Webhook,
+    body: Union[bytes, bytearray, str],
+    signature: Optional[str],
+    timestamp: Optional[str]
+) -> Tuple[Optional[Dict[str, Any]], Optional[Tuple[int, Dict[str, Any]]]]:
+    """
+    ``verify_delivery`` that keeps the event loop responsive
+
+    Bodies larger than ``OFFLOAD_THRESHOLD`` are hashed and parsed on the
+    default executor; hashlib releases the GIL for large inputs, so the
+    loop keeps serving other requests meanwhile.
+    """
+    if len(body) < OFFLOAD_THRESHOLD:
+        return verify_delivery(webhook, body, signature, timestamp)
+    return await asyncio.get_event_loop().run_in_executor(
+        None, verify_delivery, webhook, body, signature, timestamp
+    )
+
+
+class _BaseDispatcher:
+    def __init__(
+        self,
+        webhook: Webhook,
+        workers: int,
+        queue_size: int,
+        busy_status: int,
+        on_error: Optional[ErrorHandler]
+    ):
+        if workers < 1:
+            raise ValueError('workers must be at least 1')
+        if busy_status not in (429, 503):
+            raise ValueError('busy_status must be 429 or 503')
+
+        self.webhook = webhook
+        self.workers = workers
+        self.queue_size = queue_size
+        self.busy_status = busy_status
+        self.on_error = on_error
+        self._handlers = {}  # type: Dict[str, List[Handler]]
+
+    def register(self, event_type: str, handler: Handler) -> Handler:
+        """
+        Register a handler for an event type
+
+        Args:
+            event_type: Event name such as 'verification.completed', or '*'
+            handler: Callable receiving the event dict
+
+        Returns:
+            The handler, unchanged
+        """
+        self._handlers.setdefault(event_type, []).append(handler)
+        return handler
+
+    def on(self, event_type: str) -> Callable[[Handler], Handler]:
+        """
+        Decorator form of ``register``
+
+        Example:
+            @dispatcher.on('verification.completed')
+            def completed(event):
+                ...
+        """
+        return lambda handler: self.register(event_type, handler)
+
+    def _handlers_for(self, event: Dict[str, Any]) -> List[Handler]:
+        event_type = event.get('event') if isinstance(event, dict) else None
+        return self._handlers.get(event_type, []) + self._handlers.get(ALL_EVENTS, [])
+
+    def _report(self, event: Dict[str, Any], error: BaseException) -> None:
+        if self.on_error is not None:
+            try:
+                self.on_error(event, error)
+                return
+            except Exception:
+                # A failing error handler must not take the worker down
+                logger.exception('Webhook on_error handler %r failed', self.on_error)
+        logger.error('Webhook handler failed for %r', event.get('event'), exc_info=error)
+
+    def _enqueued_response(self, accepted: bool, signature: Optional[str]) -> Tuple[int, Dict[str, Any]]:
+        if accepted:
+            return _response(200, WebhookResponse.success())
+        # The sender retries a refused delivery; it must not look like a duplicate
+        self.webhook.forget_delivery(signature)
+        return _response(self.busy_status, WebhookResponse.error('Busy, retry later', self.busy_status))
+
+
+class WebhookDispatcher(_BaseDispatcher):
+    """
+    Route verified webhook events to handlers on a bounded thread pool
+
+    ``handle()`` verifies the raw body, enqueues the event and returns at
+    once, so slow business logic never delays the acknowledgement. When
+    the queue is full the delivery is refused with 503 (or 429) and the
+    sender retries later.
+
+    Example:
+        dispatcher = WebhookDispatcher(verifly.webhook, workers=8)
+
+        @dispatcher.on('verification.completed')
+        def completed(event):
+            grant_access(event['data']['sessionId'])
+
+        @app.route('/webhook/verifly', methods=['POST'])
+        def verifly_webhook():
+            status, body = dispatcher.handle(
+                request.get_data(),
+                request.headers.get('X-Signature'),
+                request.headers.get('X-Timestamp')
+            )
+            return jsonify(body), status
+    """
+
+    def __init__(
+        self,
+        webhook: Webhook,
+        workers: int = 4,
+        queue_size: int = 1000,
+        busy_status: int = 503,
+        on_error: Optional[ErrorHandler] = None
+    ):
+        """
+        Initialize dispatcher
+
+        Args:
+            webhook: Webhook resource used for verification
+            workers: Worker threads (default: 4)
+            queue_size: Maximum queued events before refusing deliveries (default: 1000)
+            busy_status: Status returned when the queue is full, 503 or 429 (default: 503)
+            on_error: Called with (event, exception) when a handler raises
+                (default: log the error); errors it raises are logged
+        """
+        super().__init__(webhook, workers, queue_size, busy_status, on_error)
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._threads = []  # type: List[threading.Thread]
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def start(self) -> None:
+        """Start worker threads (called automatically on first dispatch)"""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('Dispatcher is closed')
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(
+                    target=self._work, name=f'verifly-webhook-{index}', daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def dispatch(self, event: Dict[str, Any]) -> bool:
+        """
+        Enqueue an already verified event
+
+        Args:
+            event: Verified event dict
+
+        Returns:
+            True if queued, False if the queue is full
+        """
+        if not self._threads:
+            self.start()
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            return False
+        return True
+
+    def handle(
+        self,
+        body: Union[bytes, str],
+        signature: Optional[str],
+        timestamp: Optional[str]
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        Verify a raw delivery and enqueue it
+
+        Args:
+            body: Raw request body
+            signature: X-Signature header
+            timestamp: X-Timestamp header
+
+        Returns:
+            (HTTP status, response body): 200 when accepted or duplicate,
+            401 for invalid signatures, 400 for malformed JSON, and
+            ``busy_status`` when the queue is full (the delivery is then
+            removed from the replay store so its retry is accepted)
+        """
+        event, response = verify_delivery(self.webhook, body, signature, timestamp)
+        if response is not None:
+            return response
+        return self._enqueued_response(self.dispatch(event), signature)
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stop accepting events and shut the workers down
+
+        Args:
+            wait: Process queued events and join the workers before returning
+        """
+        with self._lock:
+            self._closed = True
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def __enter__(self) -> 'WebhookDispatcher':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _work(self) -> None:
+        while True:
+            event = self._queue.get()
+            if event is None:
+                return
+            for handler in self._handlers_for(event):
+                try:
+                    handler(event)
+                except Exception as e:
+                    self._report(event, e)
+
+
+class AsyncWebhookDispatcher(_BaseDispatcher):
+    """
+    asyncio variant of ``WebhookDispatcher``
+
+    Handlers may be plain functions or coroutine functions; events are
+    processed by ``workers`` tasks reading a bounded ``asyncio.Queue``.
+    """
+
+    def __init__(
+        self,
+        webhook: Webhook,
+        workers: int = 8,
+        queue_size: int = 1000,
+        busy_status: int = 503,
+        on_error: Optional[ErrorHandler] = None
+    ):
+        """
+        Initialize dispatcher
+
+        Args:
+            webhook: Webhook resource used for verification
+            workers: Worker tasks (default: 8)
+            queue_size: Maximum queued events before refusing deliveries (default: 1000)
+            busy_status: Status returned when the queue is full, 503 or 429 (default: 503)
+            on_error: Called with (event, exception) when a handler raises;
+                errors it raises are logged
+        """
+        super().__init__(webhook, workers, queue_size, busy_status, on_error)
+        self._queue = None
+        self._tasks = []  # type: List[asyncio.Future]
+
+    def start(self) -> None:
+        """Start worker tasks on the running loop (called on first dispatch)"""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [asyncio.ensure_future(self._work()) for _ in range(self.workers)]
+
+    def dispatch(self, event: Dict[str, Any]) -> bool:
+        """
+        Enqueue an already verified event
+
+        Args:
+            event: Verified event dict
+
+        Returns:
+            True if queued, False if the queue is full
+        """
+        if not self._tasks:
+            self.start()
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def handle(
+        self,
+        body: Union[bytes, str],
+        signature: Optional[str],
+        timestamp: Optional[str]
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        Verify a raw delivery and enqueue it
+
+        Returns:
+            (HTTP status, response body); see ``WebhookDispatcher.handle``
+        """
+        event, response = await verify_delivery_async(self.webhook, body, signature, timestamp)
+        if response is not None:
+            return response
+        return self._enqueued_response(self.dispatch(event), signature)
+
+    async def close(self, wait: bool = True) -> None:
+        """
+        Shut the workers down
+
+        Args:
+            wait: Process queued events before returning
+        """
+        tasks, self._tasks = self._tasks, []
+        if not tasks:
+            return
+        if wait:
+            await self._queue.join()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _work(self) -> None:
+        while True:
+            event = await self._queue.get()
+            try:
+                for handler in self._handlers_for(event):
+                    try:
+                        result = handler(event)
+                        if asyncio.iscoroutine(result):
+                            await result
+                    except Exception as e:
+                        self._report(event, e)
+            finally:
+                self._queue.task_done()
@@ -5,6 +5,9 @@ Verifly SDK Error Classes
 class VeriflyError(Exception):
     """Base exception for all Verifly errors"""
     
+    # Seconds the server asked us to wait (Retry-After header), if any
+    retry_after = None
+    
     def __init__(self, message: str, status_code: int = None, response: dict = None):
         super().__init__(message)
         self.message = message
@@ -45,6 +48,44 @@ class RateLimitError(VeriflyError):
     pass
 
 
+class ClientRateLimitError(RateLimitError):
+    """Raised by the client-side RateLimiter without contacting the API"""
+    pass
+
+
 class ServerError(VeriflyError):
     """Raised when server error occurs (500+)"""
     pass
+
+
+class NetworkError(VeriflyError):
+    """Raised when the API cannot be reached (connection failure)"""
+    pass
+
+
+class RequestTimeoutError(NetworkError):
+    """Raised when a request times out"""
+    pass
+
+
+class CircuitOpenError(VeriflyError):
+    """Raised without contacting the API while its circuit breaker is open"""
+    
+    def __init__(self, message: str, endpoint: str = None):
+        super().__init__(message)
+        self.endpoint = endpoint
+
+
+class WaitTimeoutError(VeriflyError):
+    """Raised when waiting for a session to complete times out"""
+    pass
+
+
+class WebhookVerificationError(VeriflyError, ValueError):
+    """Raised when a webhook fails signature or timestamp verification"""
+    pass
+
+
+class DuplicateWebhookError(WebhookVerificationError):
+    """Raised when a webhook delivery has already been processed"""
+    pass
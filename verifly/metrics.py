@@ -0,0 +1,262 @@
+"""
+Client metrics in OpenMetrics text format
+
+``MetricsCollector`` is a ``RequestHooks`` implementation that counts
+requests, errors, retries and webhook verifications and keeps latency
+histograms. Each thread records into its own shard without locking;
+shards are merged only when metrics are scraped.
+"""
+
+import bisect
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .utils.hooks import RequestEvent, RequestHooks
+
+# Latency histogram upper bounds in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+
+class _Shard:
+    """Counters recorded by one thread"""
+
+    __slots__ = ('requests', 'latency', 'errors', 'retries', 'hedges', 'webhooks', 'inflight')
+
+    def __init__(self):
+        self.requests = {}  # type: Dict[Tuple[str, str, str], int]
+        self.latency = {}  # type: Dict[str, List[float]]
+        self.errors = {}  # type: Dict[Tuple[str, str], int]
+        self.retries = {}  # type: Dict[str, int]
+        self.hedges = {}  # type: Dict[str, int]
+        self.webhooks = {}  # type: Dict[str, int]
+        self.inflight = 0
+
+    def merge(self, other: '_Shard') -> None:
+        # dict.copy() and list() are atomic under the GIL, so a shard can
+        # be read while its owning thread keeps recording
+        for name in ('requests', 'errors', 'retries', 'hedges', 'webhooks'):
+            mine = getattr(self, name)
+            for key, value in getattr(other, name).copy().items():
+                mine[key] = mine.get(key, 0) + value
+        for key, counts in other.latency.copy().items():
+            counts = list(counts)
+            mine = self.latency.get(key)
+            if mine is None:
+                self.latency[key] = counts
+            else:
+                for i, value in enumerate(counts):
+                    mine[i] += value
+        self.inflight += other.inflight
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels: Any) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + '}'
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsCollector(RequestHooks):
+    """
+    Low-overhead request and webhook metrics
+
+    Example:
+        metrics = MetricsCollector(pool_size=10)
+        verifly = Verifly(api_key, secret_key, pool_size=10, hooks=[metrics])
+
+        # Expose for Prometheus, e.g. in Flask
+        @app.route('/metrics')
+        def metrics_endpoint():
+            return metrics.render(), 200, {'Content-Type': CONTENT_TYPE}
+
+    Exposed metrics (prefixed with ``namespace``):
+        requests_total{endpoint,method,status}: HTTP attempts
+        request_duration_seconds{endpoint}: Attempt latency histogram
+        errors_total{endpoint,error}: Failed requests by error class
+        retries_total{endpoint}: Retried attempts
+        hedges_total{endpoint}: Attempts hedged with a second request
+        inflight_requests: Attempts currently in progress
+        pool_size: Configured connection pool size, if given
+        circuit_state{endpoint}: Circuit breaker state (stateset), once
+            a breaker has changed state
+        webhook_verifications_total{result}: Webhook verification outcomes
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        pool_size: Optional[int] = None,
+        namespace: str = 'verifly'
+    ):
+        """
+        Initialize collector
+
+        Args:
+            buckets: Latency histogram upper bounds in seconds
+            pool_size: Connection pool size to export alongside
+                inflight_requests, to watch pool saturation
+            namespace: Metric name prefix (default: 'verifly')
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.pool_size = pool_size
+        self.namespace = namespace
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards = []  # type: List[Tuple[threading.Thread, _Shard]]
+        self._retired = _Shard()
+        self._circuits = {}  # type: Dict[str, str]
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        self._shard().inflight += 1
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        shard = self._shard()
+        shard.inflight -= 1
+
+        key = (event.endpoint, event.method, str(event.status or 'none'))
+        shard.requests[key] = shard.requests.get(key, 0) + 1
+
+        elapsed = event.timings['total'] or 0.0
+        counts = shard.latency.get(event.endpoint)
+        if counts is None:
+            # One count per bucket, then +Inf, then the running sum
+            counts = shard.latency[event.endpoint] = [0] * (len(self.buckets) + 1) + [0.0]
+        counts[bisect.bisect_left(self.buckets, elapsed)] += 1
+        counts[-1] += elapsed
+
+    def on_retry(self, event: RequestEvent) -> None:
+        retries = self._shard().retries
+        retries[event.endpoint] = retries.get(event.endpoint, 0) + 1
+
+    def on_hedge(self, event: RequestEvent) -> None:
+        hedges = self._shard().hedges
+        hedges[event.endpoint] = hedges.get(event.endpoint, 0) + 1
+
+    def on_error(self, event: RequestEvent) -> None:
+        errors = self._shard().errors
+        key = (event.endpoint, type(event.error).__name__)
+        errors[key] = errors.get(key, 0) + 1
+
+    def on_circuit_state_change(self, endpoint: str, old: str, new: str) -> None:
+        # Rare, so a plain shared dict is enough
+        self._circuits[endpoint] = new
+
+    def on_webhook_verify(self, result: str, elapsed: float) -> None:
+        webhooks = self._shard().webhooks
+        webhooks[result] = webhooks.get(result, 0) + 1
+
+    def snapshot(self) -> _Shard:
+        """Merge all shards into one (shards of finished threads are folded in)"""
+        with self._lock:
+            live = []
+            for thread, shard in self._shards:
+                if thread.is_alive():
+                    live.append((thread, shard))
+                else:
+                    self._retired.merge(shard)
+            self._shards = live
+
+            total = _Shard()
+            total.merge(self._retired)
+            for _, shard in live:
+                total.merge(shard)
+        return total
+
+    def render(self) -> str:
+        """
+        Render all metrics in OpenMetrics text format
+
+        Returns:
+            Exposition text ending with '# EOF'
+        """
+        data = self.snapshot()
+        ns = self.namespace
+        lines = []  # type: List[str]
+
+        def family(name: str, kind: str, help_text: str, samples: Iterable[str]) -> None:
+            lines.append(f'# TYPE {ns}_{name} {kind}')
+            lines.append(f'# HELP {ns}_{name} {help_text}')
+            lines.extend(samples)
+
+        family('requests', 'counter', 'HTTP attempts by endpoint, method and status', (
+            f'{ns}_requests_total{_labels(endpoint=e, method=m, status=s)} {v}'
+            for (e, m, s), v in sorted(data.requests.items())
+        ))
+
+        histogram = []
+        for endpoint, counts in sorted(data.latency.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(float(bound))
+                histogram.append(
+                    f'{ns}_request_duration_seconds_bucket'
+                    f'{_labels(endpoint=endpoint, le=le)} {cumulative}'
+                )
+            histogram.append(
+                f'{ns}_request_duration_seconds_count{_labels(endpoint=endpoint)} {cumulative}'
+            )
+            histogram.append(
+                f'{ns}_request_duration_seconds_sum{_labels(endpoint=endpoint)} '
+                f'{_number(counts[-1])}'
+            )
+        family('request_duration_seconds', 'histogram', 'HTTP attempt latency', histogram)
+
+        family('errors', 'counter', 'Failed requests by error class', (
+            f'{ns}_errors_total{_labels(endpoint=e, error=err)} {v}'
+            for (e, err), v in sorted(data.errors.items())
+        ))
+        family('retries', 'counter', 'Retried attempts', (
+            f'{ns}_retries_total{_labels(endpoint=e)} {v}'
+            for e, v in sorted(data.retries.items())
+        ))
+        family('hedges', 'counter', 'Attempts hedged with a second request', (
+            f'{ns}_hedges_total{_labels(endpoint=e)} {v}'
+            for e, v in sorted(data.hedges.items())
+        ))
+        family('inflight_requests', 'gauge', 'Attempts in progress', [
+            f'{ns}_inflight_requests {data.inflight}'
+        ])
+        if self.pool_size is not None:
+            family('pool_size', 'gauge', 'Configured connection pool size', [
+                f'{ns}_pool_size {self.pool_size}'
+            ])
+        states = ('closed', 'open', 'half_open')
+        family('circuit_state', 'stateset', 'Circuit breaker state by endpoint class', (
+            f'{ns}_circuit_state'
+            f'{_labels(endpoint=e, **{ns + "_circuit_state": st})} {int(st == current)}'
+            for e, current in sorted(self._circuits.copy().items()) for st in states
+        ))
+        family('webhook_verifications', 'counter', 'Webhook verification outcomes', (
+            f'{ns}_webhook_verifications_total{_labels(result=r)} {v}'
+            for r, v in sorted(data.webhooks.items())
+        ))
+
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def wsgi_app(self, environ: Dict[str, Any], start_response: Callable) -> List[bytes]:
+        """Minimal WSGI application serving ``render()``"""
+        body = self.render().encode('utf-8')
+        start_response('200 OK', [
+            ('Content-Type', CONTENT_TYPE),
+            ('Content-Length', str(len(body))),
+        ])
+        return [body]
@@ -0,0 +1,363 @@
+"""
+WSGI and ASGI webhook endpoints
+
+Mount a Verifly webhook endpoint without going through the framework's
+request parsing: the body is read once into a single buffer, verified
+with the raw-bytes HMAC and parsed only after the signature passes.
+"""
+
+import asyncio
+import json
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .dispatcher import verify_delivery, verify_delivery_async
+from .resources.webhook import Webhook, WebhookResponse
+
+# Largest request body accepted (custom data is capped at 100KB by the API)
+DEFAULT_MAX_BODY_SIZE = 1024 * 1024
+
+DEFAULT_PATH = '/webhook/verifly'
+
+Callback = Callable[[Dict[str, Any]], Any]
+
+_REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    401: 'Unauthorized',
+    405: 'Method Not Allowed',
+    411: 'Length Required',
+    413: 'Payload Too Large',
+    429: 'Too Many Requests',
+    503: 'Service Unavailable',
+}
+
+
+def _encode_response(body: Dict[str, Any]) -> bytes:
+    return json.dumps(
+        {k: v for k, v in body.items() if k != '_status'}, separators=(',', ':')
+    ).encode('utf-8')
+
+
+def _error(status: int, message: str) -> Tuple[int, Dict[str, Any]]:
+    return status, WebhookResponse.error(message, status)
+
+
+def _callback_response(result: Any, busy_status: int) -> Tuple[int, Dict[str, Any]]:
+    # A callback returning False (e.g. WebhookDispatcher.dispatch on a full
+    # queue) refuses the delivery so Verifly retries it later
+    if result is False:
+        return _error(busy_status, 'Busy, retry later')
+    return 200, WebhookResponse.success()
+
+
+class _WebhookEndpoint:
+    def __init__(
+        self,
+        webhook: Webhook,
+        callback: Callback,
+        max_body_size: int,
+        busy_status: int
+    ):
+        self.webhook = webhook
+        self.callback = callback
+        self.max_body_size = max_body_size
+        self.busy_status = busy_status
+
+    def _respond(self, result: Any, signature: str) -> Tuple[int, Dict[str, Any]]:
+        if result is False:
+            # Let the sender's retry through instead of acking it as a duplicate
+            self.webhook.forget_delivery(signature)
+        return _callback_response(result, self.busy_status)
+
+    def _check_length(self, length: Optional[int]) -> Optional[Tuple[int, Dict[str, Any]]]:
+        if length is not None and length > self.max_body_size:
+            return _error(413, 'Payload too large')
+        return None
+
+
+class WSGIWebhookApp(_WebhookEndpoint):
+    """
+    WSGI application that verifies Verifly webhooks
+
+    Reads ``wsgi.input`` once, verifies the raw bytes and calls
+    ``callback(event)`` with the parsed event. Responds 200 on success,
+    401 on a bad signature, and 503 (or ``busy_status``) when the
+    callback returns False. A refused delivery, or one whose callback
+    raised, is removed from the replay store so the sender's retry is
+    processed.
+
+    Example:
+        dispatcher = WebhookDispatcher(verifly.webhook)
+        webhook_app = WSGIWebhookApp(verifly.webhook, dispatcher.dispatch)
+
+        # Mount alongside a Flask app
+        app.wsgi_app = WSGIWebhookMiddleware(
+            app.wsgi_app, verifly.webhook, dispatcher.dispatch, path='/webhook/verifly'
+        )
+    """
+
+    def __init__(
+        self,
+        webhook: Webhook,
+        callback: Callback,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+        busy_status: int = 503
+    ):
+        """
+        Initialize app
+
+        Args:
+            webhook: Webhook resource used for verification
+            callback: Called with each verified event; return False to refuse it
+            max_body_size: Largest body accepted in bytes (default: 1MB)
+            busy_status: Status returned when the callback refuses an event (default: 503)
+        """
+        super().__init__(webhook, callback, max_body_size, busy_status)
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        status, body = self._handle(environ)
+        payload = _encode_response(body)
+        start_response(f'{status} {_REASONS.get(status, "")}'.rstrip(), [
+            ('Content-Type', 'application/json'),
+            ('Content-Length', str(len(payload))),
+        ])
+        return [payload]
+
+    def _handle(self, environ: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        if environ.get('REQUEST_METHOD') != 'POST':
+            return _error(405, 'Method not allowed')
+
+        signature = environ.get('HTTP_X_SIGNATURE')
+        timestamp = environ.get('HTTP_X_TIMESTAMP')
+        if not signature or not timestamp:
+            return _error(400, 'Missing signature headers')
+
+        try:
+            length = int(environ.get('CONTENT_LENGTH') or '')
+        except ValueError:
+            length = None
+
+        stream = environ['wsgi.input']
+        if length is not None:
+            error = self._check_length(length)
+            if error is not None:
+                return error
+            body = stream.read(length)
+        elif environ.get('wsgi.input_terminated'):
+            body = stream.read(self.max_body_size + 1)
+            if len(body) > self.max_body_size:
+                return _error(413, 'Payload too large')
+        else:
+            return _error(411, 'Length required')
+
+        event, response = verify_delivery(self.webhook, body, signature, timestamp)
+        if response is not None:
+            return response
+        try:
+            result = self.callback(event)
+        except BaseException:
+            self.webhook.forget_delivery(signature)
+            raise
+        return self._respond(result, signature)
+
+
+class WSGIWebhookMiddleware:
+    """
+    WSGI middleware serving a webhook endpoint at ``path``
+
+    Requests to ``path`` are handled by ``WSGIWebhookApp``; everything
+    else is passed to the wrapped application.
+    """
+
+    def __init__(
+        self,
+        app: Callable,
+        webhook: Webhook,
+        callback: Callback,
+        path: str = DEFAULT_PATH,
+        **options: Any
+    ):
+        """
+        Initialize middleware
+
+        Args:
+            app: Wrapped WSGI application
+            webhook: Webhook resource used for verification
+            callback: Called with each verified event; return False to refuse it
+            path: Webhook path (default: '/webhook/verifly')
+            **options: ``max_body_size`` and ``busy_status`` for ``WSGIWebhookApp``
+        """
+        self.app = app
+        self.path = path
+        self.webhook_app = WSGIWebhookApp(webhook, callback, **options)
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        if environ.get('PATH_INFO') == self.path:
+            return self.webhook_app(environ, start_response)
+        return self.app(environ, start_response)
+
+
+class ASGIWebhookApp(_WebhookEndpoint):
+    """
+    ASGI application that verifies Verifly webhooks
+
+    Body chunks are collected into one buffer, and large bodies are
+    verified on the default executor so hashing never blocks the event
+    loop. The callback
+    may be a plain function or a coroutine function; returning False
+    refuses the delivery with 503 (or ``busy_status``).
+
+    Example:
+        dispatcher = AsyncWebhookDispatcher(verifly.webhook)
+        app = ASGIWebhookMiddleware(
+            fastapi_app, verifly.webhook, dispatcher.dispatch, path='/webhook/verifly'
+        )
+    """
+
+    def __init__(
+        self,
+        webhook: Webhook,
+        callback: Callback,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+        busy_status: int = 503
+    ):
+        """
+        Initialize app
+
+        Args:
+            webhook: Webhook resource used for verification
+            callback: Function or coroutine function called with each
+                verified event; return False to refuse it
+            max_body_size: Largest body accepted in bytes (default: 1MB)
+            busy_status: Status returned when the callback refuses an event (default: 503)
+        """
+        super().__init__(webhook, callback, max_body_size, busy_status)
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        status, body = await self._handle(scope, receive)
+        payload = _encode_response(body)
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(payload)).encode('ascii')),
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': payload})
+
+    async def _handle(self, scope: Dict[str, Any], receive: Callable) -> Tuple[int, Dict[str, Any]]:
+        if scope.get('method') != 'POST':
+            return _error(405, 'Method not allowed')
+
+        headers = {}
+        for name, value in scope.get('headers', ()):
+            if name in (b'x-signature', b'x-timestamp', b'content-length'):
+                headers[name] = value.decode('latin-1')
+
+        signature = headers.get(b'x-signature')
+        timestamp = headers.get(b'x-timestamp')
+        if not signature or not timestamp:
+            return _error(400, 'Missing signature headers')
+
+        try:
+            length = int(headers.get(b'content-length', ''))
+        except ValueError:
+            length = None
+        error = self._check_length(length)
+        if error is not None:
+            return error
+
+        body = await self._read_body(receive)
+        if body is None:
+            return _error(413, 'Payload too large')
+
+        event, response = await verify_delivery_async(self.webhook, body, signature, timestamp)
+        if response is not None:
+            return response
+
+        try:
+            result = self.callback(event)
+            if asyncio.iscoroutine(result):
+                result = await result
+        except BaseException:
+            self.webhook.forget_delivery(signature)
+            raise
+        return self._respond(result, signature)
+
+    async def _read_body(self, receive: Callable) -> Optional[bytes]:
+        """Read the request body; None if it exceeds ``max_body_size``"""
+        chunks = []  # type: List[bytes]
+        size = 0
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                break
+            chunk = message.get('body', b'')
+            if chunk:
+                size += len(chunk)
+                if size > self.max_body_size:
+                    return None
+                chunks.append(chunk)
+            if not message.get('more_body', False):
+                break
+
+        # The common single-chunk case is used as is; otherwise the chunks
+        # are joined with exactly one copy
+        if len(chunks) == 1:
+            return chunks[0]
+        return b''.join(chunks)
+
+    @staticmethod
+    async def _lifespan(receive: Callable, send: Callable) -> None:
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+
+class ASGIWebhookMiddleware:
+    """
+    ASGI middleware serving a webhook endpoint at ``path``
+
+    HTTP requests to ``path`` are handled by ``ASGIWebhookApp``;
+    everything else, including lifespan events, goes to the wrapped app.
+    """
+
+    def __init__(
+        self,
+        app: Callable,
+        webhook: Webhook,
+        callback: Callback,
+        path: str = DEFAULT_PATH,
+        **options: Any
+    ):
+        """
+        Initialize middleware
+
+        Args:
+            app: Wrapped ASGI application
+            webhook: Webhook resource used for verification
+            callback: Function or coroutine function called with each
+                verified event; return False to refuse it
+            path: Webhook path (default: '/webhook/verifly')
+            **options: ``max_body_size`` and ``busy_status`` for ``ASGIWebhookApp``
+        """
+        self.app = app
+        self.path = path
+        self.webhook_app = ASGIWebhookApp(webhook, callback, **options)
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope['type'] == 'http' and scope.get('path') == self.path:
+            await self.webhook_app(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
@@ -0,0 +1,266 @@
+"""
+Typed response models
+
+Enabled with ``typed_responses=True``. Models keep the API's values in
+``__slots__`` instead of a per-object dict, and parse timestamps and
+statuses only when the attribute is first read. They are read-only
+mappings over the original camelCase keys, so code written against the
+plain dict responses keeps working:
+
+    status = verifly.verification.get(session_id)
+    status.verified_at        # datetime, parsed on first access
+    status['verifiedAt']      # original ISO string
+    status.to_dict()          # plain dict, e.g. for JSON
+"""
+
+from abc import ABCMeta
+from collections.abc import Mapping
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+from .utils.poller import TERMINAL_STATUSES
+from .utils.timeutil import parse_datetime
+
+# Raw slot value for a key absent from the response
+_MISSING = object()
+# Parsed-value slot before the first access
+_UNSET = object()
+
+
+class Status(str, Enum):
+    """Session status; members compare equal to the API's strings"""
+
+    PENDING = 'pending'
+    VERIFIED = 'verified'
+    FAILED = 'failed'
+    EXPIRED = 'expired'
+    ABORTED = 'aborted'
+
+
+def _status(value: str) -> Union[Status, str]:
+    try:
+        return Status(value)
+    except ValueError:
+        # Statuses added to the API later stay plain strings
+        return value
+
+
+def _field(
+    attr: str,
+    key: str,
+    parse: Optional[Callable[[Any], Any]] = None,
+    convert: Optional[Callable[[Any], Any]] = None
+) -> Tuple[str, str, Optional[Callable[[Any], Any]], Optional[Callable[[Any], Any]]]:
+    """
+    Declare a model field
+
+    Args:
+        attr: Attribute name
+        key: API key
+        parse: Applied lazily on first attribute access; ``model[key]``
+            keeps returning the raw value
+        convert: Applied when the model is built; ``model[key]`` returns
+            the converted value
+    """
+    return attr, key, parse, convert
+
+
+def _plain(slot: str, doc: str) -> property:
+    def get(self):
+        value = getattr(self, slot)
+        return None if value is _MISSING else value
+    return property(get, doc=doc)
+
+
+def _lazy(slot: str, parse: Callable[[Any], Any], doc: str) -> property:
+    cache = slot + '_parsed'
+
+    def get(self):
+        value = getattr(self, cache)
+        if value is _UNSET:
+            raw = getattr(self, slot)
+            value = None if raw is _MISSING or raw is None else parse(raw)
+            setattr(self, cache, value)
+        return value
+    return property(get, doc=doc)
+
+
+class _ModelMeta(ABCMeta):
+    """Builds ``__slots__`` and attribute properties from ``_FIELDS``"""
+
+    def __new__(mcs, name, bases, namespace):
+        fields = namespace.get('_FIELDS')
+        if fields is not None:
+            slots = []
+            key_slots = {}
+            lazy_slots = []
+            converters = {}
+            for attr, key, parse, convert in fields:
+                slot = '_' + attr
+                slots.append(slot)
+                key_slots[key] = slot
+                doc = f'``{key}`` from the API response'
+                if parse is None:
+                    namespace[attr] = _plain(slot, doc)
+                else:
+                    slots.append(slot + '_parsed')
+                    lazy_slots.append(slot + '_parsed')
+                    namespace[attr] = _lazy(slot, parse, doc)
+                if convert is not None:
+                    converters[slot] = convert
+            namespace['__slots__'] = tuple(slots)
+            namespace['_KEY_SLOTS'] = key_slots
+            namespace['_LAZY_SLOTS'] = tuple(lazy_slots)
+            namespace['_CONVERTERS'] = converters
+        return super().__new__(mcs, name, bases, namespace)
+
+
+class Model(Mapping, metaclass=_ModelMeta):
+    """
+    Base class for response models
+
+    Keys not known to the model are kept and remain reachable with
+    ``model[key]``.
+    """
+
+    __slots__ = ('_extra',)
+
+    _KEY_SLOTS = {}  # type: Dict[str, str]
+    _LAZY_SLOTS = ()  # type: Tuple[str, ...]
+    _CONVERTERS = {}  # type: Dict[str, Callable[[Any], Any]]
+
+    def __init__(self, data: Mapping):
+        """
+        Build a model from an API response
+
+        Args:
+            data: Response data with camelCase keys
+        """
+        key_slots = self._KEY_SLOTS
+        for slot in key_slots.values():
+            setattr(self, slot, _MISSING)
+        for slot in self._LAZY_SLOTS:
+            setattr(self, slot, _UNSET)
+
+        extra = None
+        for key, value in data.items():
+            slot = key_slots.get(key)
+            if slot is None:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+            else:
+                convert = self._CONVERTERS.get(slot)
+                setattr(self, slot, value if convert is None else convert(value))
+        self._extra = extra
+
+    def __getitem__(self, key: str) -> Any:
+        slot = self._KEY_SLOTS.get(key)
+        if slot is not None:
+            value = getattr(self, slot)
+            if value is not _MISSING:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for key, slot in self._KEY_SLOTS.items():
+            if getattr(self, slot) is not _MISSING:
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __reduce__(self):
+        return type(self), (self.to_dict(),)
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{key}={self[key]!r}' for key in list(self)[:4])
+        return f'{type(self).__name__}({fields})'
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a plain dict with the API's keys and raw values
+
+        Nested models are converted too.
+        """
+        result = {}
+        for key in self:
+            value = self[key]
+            if isinstance(value, Model):
+                value = value.to_dict()
+            elif isinstance(value, list):
+                value = [v.to_dict() if isinstance(v, Model) else v for v in value]
+            result[key] = value
+        return result
+
+
+class Transaction(Model):
+    """Balance transaction"""
+
+    _FIELDS = (
+        _field('type', 'type'),
+        _field('amount', 'amount'),
+        _field('description', 'description'),
+        _field('session_id', 'sessionId'),
+        _field('created_at', 'createdAt', parse=parse_datetime),
+    )
+
+
+def _transactions(value: Any) -> Any:
+    if not isinstance(value, list):
+        return value
+    return [t if isinstance(t, Model) or not isinstance(t, Mapping) else Transaction(t)
+            for t in value]
+
+
+class Session(Model):
+    """Session returned by ``verification.create()``"""
+
+    _FIELDS = (
+        _field('session_id', 'sessionId'),
+        _field('iframe_url', 'iframeUrl'),
+        _field('status', 'status', parse=_status),
+        _field('method', 'method'),
+        _field('allowed_methods', 'allowedMethods'),
+        _field('recipient_contact', 'recipientContact'),
+        _field('created_at', 'createdAt', parse=parse_datetime),
+        _field('expires_at', 'expiresAt', parse=parse_datetime),
+    )
+
+
+class SessionStatus(Model):
+    """Session status returned by ``verification.get()``"""
+
+    _FIELDS = (
+        _field('session_id', 'sessionId'),
+        _field('status', 'status', parse=_status),
+        _field('method', 'method'),
+        _field('allowed_methods', 'allowedMethods'),
+        _field('recipient_contact', 'recipientContact'),
+        _field('verification_code', 'verificationCode'),
+        _field('iframe_url', 'iframeUrl'),
+        _field('created_at', 'createdAt', parse=parse_datetime),
+        _field('expires_at', 'expiresAt', parse=parse_datetime),
+        _field('verified_at', 'verifiedAt', parse=parse_datetime),
+    )
+
+    @property
+    def is_terminal(self) -> bool:
+        """Whether the session can no longer change"""
+        return self['status'] in TERMINAL_STATUSES if 'status' in self else False
+
+
+class Balance(Model):
+    """Account balance returned by ``verification.get_balance()``"""
+
+    _FIELDS = (
+        _field('balance', 'balance'),
+        _field('currency', 'currency'),
+        _field('user_id', 'userId'),
+        _field('email', 'email'),
+        _field('recent_transactions', 'recentTransactions', convert=_transactions),
+    )
@@ -0,0 +1,369 @@
+"""
+Async Verification Resource - Handle verification sessions with asyncio
+"""
+
+from datetime import datetime
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Any, Tuple, Union
+from ..errors import VeriflyError
+from ..models import Balance, Session, SessionStatus
+from ..utils.async_request import AsyncRequestHandler
+from ..utils.batch import AsyncCreateBatch
+from ..utils.concurrency import aiter_bounded
+from ..utils.idempotency import (
+    IdempotencyStore, check_fingerprint, fingerprint, lookup, remember
+)
+from ..utils.pagination import Page, aiter_pages
+from ..utils.poller import AsyncStatusPoller
+from ..utils.singleflight import AsyncSingleFlight
+from ..utils.status_cache import StatusCache
+from .verification import (
+    build_create_payload, build_transactions_params, parse_transactions_page
+)
+
+
+class AsyncVerification:
+    """Verification session management for the asyncio client"""
+
+    def __init__(
+        self,
+        request_handler: AsyncRequestHandler,
+        cache: Optional[StatusCache] = None,
+        typed_responses: bool = False,
+        idempotency_store: Optional[IdempotencyStore] = None
+    ):
+        """
+        Initialize AsyncVerification resource
+
+        Args:
+            request_handler: Configured async request handler
+            cache: Cache for ``get()`` and ``get_balance()`` results
+            typed_responses: Return ``Session``, ``SessionStatus`` and
+                ``Balance`` models instead of dicts
+            idempotency_store: Remembers ``create()`` results by
+                idempotency key
+        """
+        self.request = request_handler
+        self.cache = cache
+        self.typed_responses = typed_responses
+        self.idempotency_store = idempotency_store
+        self._creates = AsyncSingleFlight()
+        self.poller = AsyncStatusPoller(self._fetch)
+
+    async def create(
+        self,
+        phone: Optional[str] = None,
+        email: Optional[str] = None,
+        methods: Optional[List[str]] = None,
+        lang: Optional[str] = None,
+        webhook_url: Optional[str] = None,
+        redirect_url: Optional[str] = None,
+        timeout: Optional[int] = None,
+        data: Optional[Any] = None,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Create verification session
+
+        Args:
+            phone: Phone number (will be cleaned automatically)
+            email: Email address
+            methods: Allowed verification methods ['sms', 'whatsapp', 'call', 'email']
+            lang: Language code ('en', 'tr')
+            webhook_url: Webhook URL for completion callback
+            redirect_url: Redirect URL after verification
+            timeout: Session timeout in minutes (1-15)
+            data: Custom data to attach to the session (max 100KB)
+            idempotency_key: Unique key for this creation; sent as the
+                Idempotency-Key header and makes the call safe to
+                retry. With an idempotency store, a repeated key returns
+                the stored session without an API call
+
+        Returns:
+            Session data with sessionId and iframeUrl
+
+        Raises:
+            ValidationError: If the key was already used with different
+                parameters (detected by the idempotency store)
+
+        Example:
+            session = await verifly.verification.create(
+                phone='5551234567',
+                methods=['sms', 'whatsapp']
+            )
+        """
+        payload = build_create_payload(
+            phone=phone,
+            email=email,
+            methods=methods,
+            lang=lang,
+            webhook_url=webhook_url,
+            redirect_url=redirect_url,
+            timeout=timeout,
+            data=data
+        )
+
+        if idempotency_key and self.idempotency_store is not None:
+            digest = fingerprint(payload)
+            # Concurrent calls with one key share a single request; a
+            # caller whose parameters differ from the one in flight is
+            # rejected instead of receiving its session
+            leader, data = await self._creates.do(
+                idempotency_key, lambda: self._create_once(payload, idempotency_key, digest)
+            )
+            check_fingerprint(idempotency_key, leader, digest)
+        else:
+            data = await self._post_create(payload, idempotency_key)
+        return Session(data) if self.typed_responses else data
+
+    async def _create_once(
+        self,
+        payload: Dict[str, Any],
+        idempotency_key: str,
+        digest: str
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Return the body digest with the stored result, or create and store one"""
+        data = lookup(self.idempotency_store, idempotency_key, digest)
+        if data is None:
+            data = await self._post_create(payload, idempotency_key)
+            remember(self.idempotency_store, idempotency_key, digest, data)
+        return digest, data
+
+    async def _post_create(
+        self,
+        payload: Dict[str, Any],
+        idempotency_key: Optional[str]
+    ) -> Dict[str, Any]:
+        response = await self.request.post(
+            '/api/verify/create', payload, idempotency_key=idempotency_key
+        )
+        if self.cache is not None:
+            self.cache.invalidate_balance()
+        return response.get('data', response)
+
+    def create_many(
+        self,
+        specs: Iterable[Dict[str, Any]],
+        concurrency: int = 50,
+        ordered: bool = False
+    ) -> AsyncCreateBatch:
+        """
+        Create many verification sessions concurrently
+
+        See ``Verification.create_many``; the returned batch is consumed
+        with ``async for`` or ``await batch.run()``.
+
+        Args:
+            specs: Iterable of dicts of ``create()`` keyword arguments
+            concurrency: Maximum concurrent requests (default: 50)
+            ordered: Yield results in submission order (default: False)
+
+        Returns:
+            Async iterable batch with a ``summary``
+        """
+        return AsyncCreateBatch(
+            self.create, specs, concurrency, ordered,
+            self.request.retry_policy.is_retryable
+        )
+
+    async def get(self, session_id: str) -> Dict[str, Any]:
+        """
+        Get verification session status
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Session status data, served from the cache when one is
+            configured and holds a live entry
+
+        Example:
+            status = await verifly.verification.get('session-id')
+        """
+        if self.cache is not None:
+            cached = self.cache.get_status(session_id)
+            if cached is not None:
+                return cached
+        return await self._fetch(session_id)
+
+    async def _fetch(self, session_id: str) -> Dict[str, Any]:
+        """Fetch session status from the API, refreshing the cache"""
+        response = await self.request.get(f'/api/verify/{session_id}')
+        data = response.get('data', response)
+        if self.typed_responses:
+            data = SessionStatus(data)
+        if self.cache is not None:
+            self.cache.set_status(session_id, data)
+        return data
+
+    async def get_many(
+        self,
+        session_ids: Iterable[str],
+        concurrency: int = 50
+    ) -> AsyncIterator[Tuple[str, Union[Dict[str, Any], VeriflyError]]]:
+        """
+        Get the status of many sessions concurrently
+
+        Results are yielded as they complete, with at most ``concurrency``
+        requests in flight. Per-session API errors are yielded in place of
+        the result instead of aborting the batch.
+
+        Args:
+            session_ids: Iterable of session IDs
+            concurrency: Maximum concurrent requests (default: 50)
+
+        Yields:
+            (session_id, status data or VeriflyError) tuples
+
+        Example:
+            async for session_id, result in verifly.verification.get_many(ids):
+                ...
+        """
+        async for session_id, result, error in aiter_bounded(self.get, session_ids, concurrency):
+            if error is not None:
+                if not isinstance(error, VeriflyError):
+                    raise error
+                result = error
+            yield session_id, result
+
+    async def wait(self, session_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait until a session is verified, failed, aborted or expired
+
+        See ``Verification.wait``; polling is shared across all waiting
+        coroutines of this client.
+
+        Args:
+            session_id: Session ID
+            timeout: Maximum seconds to wait (default: until the session expires)
+
+        Returns:
+            Last observed session status data
+
+        Raises:
+            WaitTimeoutError: If the timeout elapses first
+        """
+        return await self.poller.wait(session_id, timeout)
+
+    async def select_method(
+        self,
+        session_id: str,
+        method: str,
+        recipient_contact: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Select verification method
+
+        Args:
+            session_id: Session ID
+            method: Selected method ('sms', 'whatsapp', 'call', 'email')
+            recipient_contact: Contact if not provided in create
+
+        Returns:
+            Updated session data
+        """
+        data = {'method': method}
+        if recipient_contact:
+            data['recipientContact'] = recipient_contact
+
+        response = await self._action(session_id, 'select-method', data)
+        return response.get('data', response)
+
+    async def cancel(self, session_id: str) -> Dict[str, Any]:
+        """
+        Cancel verification session (temporary)
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Cancellation result
+        """
+        return await self._action(session_id, 'cancel')
+
+    async def abort(self, session_id: str) -> Dict[str, Any]:
+        """
+        Abort verification session (permanent)
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Abort result
+        """
+        return await self._action(session_id, 'abort')
+
+    async def _action(
+        self,
+        session_id: str,
+        action: str,
+        data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """POST a session action, dropping the cached status afterwards"""
+        try:
+            return await self.request.post(f'/api/verify/{session_id}/{action}', data)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(session_id)
+
+    async def get_balance(self) -> Dict[str, Any]:
+        """
+        Get account balance and recent transactions
+
+        Returns:
+            Balance data with recent transactions
+
+        Example:
+            balance = await verifly.verification.get_balance()
+        """
+        if self.cache is not None:
+            cached = self.cache.get_balance()
+            if cached is not None:
+                return cached
+        response = await self.request.get('/api/verify/balance')
+        data = response.get('data', response)
+        if self.typed_responses:
+            data = Balance(data)
+        if self.cache is not None:
+            self.cache.set_balance(data)
+        return data
+
+    def iter_transactions(
+        self,
+        since: Optional[Union[str, datetime]] = None,
+        page_size: int = 100,
+        prefetch: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over the full transaction history, oldest first
+
+        Pages are requested lazily; the next page is fetched in a task
+        while the caller processes the current one.
+
+        Args:
+            since: Only transactions created at or after this time (ISO
+                8601 string or datetime; naive datetimes are taken as UTC)
+            page_size: Transactions per request (default: 100)
+            prefetch: Fetch the next page in the background (default: True)
+
+        Returns:
+            Async iterator of transaction data (``Transaction`` models with
+            typed_responses)
+
+        Raises:
+            ValueError: If page_size is less than 1
+
+        Example:
+            async for tx in verifly.verification.iter_transactions(page_size=500):
+                print(tx['createdAt'], tx['amount'])
+        """
+        if page_size < 1:
+            raise ValueError('page_size must be at least 1')
+
+        async def fetch(cursor: Optional[str]) -> Page:
+            response = await self.request.get(
+                '/api/verify/transactions',
+                build_transactions_params(since, page_size, cursor)
+            )
+            return parse_transactions_page(response, self.typed_responses)
+
+        return aiter_pages(fetch, prefetch)
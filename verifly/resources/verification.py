@@ -2,21 +2,142 @@
 Verification Resource - Handle verification sessions
 """
 
-from typing import Dict, List, Optional, Any
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
+from ..errors import VeriflyError
+from ..models import Balance, Session, SessionStatus, Transaction
+from ..utils.batch import CreateBatch
+from ..utils.concurrency import iter_bounded
+from ..utils.idempotency import (
+    IdempotencyStore, check_fingerprint, fingerprint, lookup, remember
+)
+from ..utils.pagination import Page, iter_pages
+from ..utils.poller import StatusPoller
 from ..utils.request import RequestHandler
+from ..utils.singleflight import SingleFlight
+from ..utils.status_cache import StatusCache
+
+
+def build_create_payload(
+    phone: Optional[str] = None,
+    email: Optional[str] = None,
+    methods: Optional[List[str]] = None,
+    lang: Optional[str] = None,
+    webhook_url: Optional[str] = None,
+    redirect_url: Optional[str] = None,
+    timeout: Optional[int] = None,
+    data: Optional[Any] = None
+) -> Dict[str, Any]:
+    """
+    Build the request body for session creation
+    
+    Shared by the sync and async Verification resources so both send
+    identical payloads. See ``Verification.create`` for argument details.
+    
+    Returns:
+        Request body dict with unset fields omitted
+    """
+    payload = {}
+    
+    if phone:
+        payload['phone'] = phone
+    if email:
+        payload['email'] = email
+    if methods:
+        payload['methods'] = methods
+    if lang:
+        payload['lang'] = lang
+    if webhook_url:
+        payload['webhookUrl'] = webhook_url
+    if redirect_url:
+        payload['redirectUrl'] = redirect_url
+    if timeout:
+        payload['timeout'] = timeout
+    if data is not None:
+        payload['data'] = data
+    
+    return payload
+
+
+def build_transactions_params(
+    since: Optional[Union[str, datetime]],
+    page_size: int,
+    cursor: Optional[str]
+) -> Dict[str, str]:
+    """
+    Build query parameters for one page of the transaction history
+    
+    Shared by the sync and async Verification resources. See
+    ``Verification.iter_transactions`` for argument details.
+    
+    Returns:
+        Query parameter dict with unset fields omitted
+    """
+    params = {'limit': str(page_size)}
+    if since is not None:
+        if isinstance(since, datetime):
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            since = since.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+        params['since'] = since
+    if cursor:
+        params['cursor'] = cursor
+    return params
+
+
+def parse_transactions_page(response: Dict[str, Any], typed: bool) -> Page:
+    """
+    Split a transaction history response into (transactions, next cursor)
+    
+    Args:
+        response: Response body
+        typed: Wrap transactions in ``Transaction`` models
+    """
+    data = response.get('data', response)
+    transactions = data.get('transactions') or []
+    if typed:
+        transactions = [Transaction(t) for t in transactions]
+    return transactions, data.get('nextCursor') or None
 
 
 class Verification:
     """Verification session management"""
     
-    def __init__(self, request_handler: RequestHandler):
+    def __init__(
+        self,
+        request_handler: RequestHandler,
+        cache: Optional[StatusCache] = None,
+        typed_responses: bool = False,
+        idempotency_store: Optional[IdempotencyStore] = None
+    ):
         """
         Initialize Verification resource
         
         Args:
             request_handler: Configured request handler
+            cache: Cache for ``get()`` and ``get_balance()`` results
+            typed_responses: Return ``Session``, ``SessionStatus`` and
+                ``Balance`` models instead of dicts
+            idempotency_store: Remembers ``create()`` results by
+                idempotency key
         """
         self.request = request_handler
+        self.cache = cache
+        self.typed_responses = typed_responses
+        self.idempotency_store = idempotency_store
+        self._creates = SingleFlight()
+        self._poller = None
+        self._poller_lock = threading.Lock()
+    
+    @property
+    def poller(self) -> StatusPoller:
+        """Shared scheduler backing ``wait()``, created on first use"""
+        if self._poller is None:
+            with self._poller_lock:
+                if self._poller is None:
+                    self._poller = StatusPoller(self._fetch)
+        return self._poller
     
     def create(
         self,
@@ -27,7 +148,8 @@ class Verification:
         webhook_url: Optional[str] = None,
         redirect_url: Optional[str] = None,
         timeout: Optional[int] = None,
-        data: Optional[Any] = None
+        data: Optional[Any] = None,
+        idempotency_key: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Create verification session
@@ -41,10 +163,18 @@ class Verification:
             redirect_url: Redirect URL after verification
             timeout: Session timeout in minutes (1-15)
             data: Custom data to attach to the session (max 100KB)
+            idempotency_key: Unique key for this creation; sent as the
+                Idempotency-Key header and makes the call safe to
+                retry. With an idempotency store, a repeated key returns
+                the stored session without an API call
             
         Returns:
             Session data with sessionId and iframeUrl
             
+        Raises:
+            ValidationError: If the key was already used with different
+                parameters (detected by the idempotency store)
+            
         Example:
             session = verifly.verification.create(
                 phone='5551234567',
@@ -52,28 +182,89 @@ class Verification:
                 data={'userId': '12345', 'orderId': 'ORD-789'}
             )
         """
-        payload = {}
-        
-        if phone:
-            payload['phone'] = phone
-        if email:
-            payload['email'] = email
-        if methods:
-            payload['methods'] = methods
-        if lang:
-            payload['lang'] = lang
-        if webhook_url:
-            payload['webhookUrl'] = webhook_url
-        if redirect_url:
-            payload['redirectUrl'] = redirect_url
-        if timeout:
-            payload['timeout'] = timeout
-        if data is not None:
-            payload['data'] = data
-        
-        response = self.request.post('/api/verify/create', payload)
+        payload = build_create_payload(
+            phone=phone,
+            email=email,
+            methods=methods,
+            lang=lang,
+            webhook_url=webhook_url,
+            redirect_url=redirect_url,
+            timeout=timeout,
+            data=data
+        )
+        
+        if idempotency_key and self.idempotency_store is not None:
+            digest = fingerprint(payload)
+            # Concurrent calls with one key share a single request; a
+            # caller whose parameters differ from the one in flight is
+            # rejected instead of receiving its session
+            leader, data = self._creates.do(
+                idempotency_key, lambda: self._create_once(payload, idempotency_key, digest)
+            )
+            check_fingerprint(idempotency_key, leader, digest)
+        else:
+            data = self._post_create(payload, idempotency_key)
+        return Session(data) if self.typed_responses else data
+    
+    def _create_once(
+        self,
+        payload: Dict[str, Any],
+        idempotency_key: str,
+        digest: str
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Return the body digest with the stored result, or create and store one"""
+        data = lookup(self.idempotency_store, idempotency_key, digest)
+        if data is None:
+            data = self._post_create(payload, idempotency_key)
+            remember(self.idempotency_store, idempotency_key, digest, data)
+        return digest, data
+    
+    def _post_create(self, payload: Dict[str, Any], idempotency_key: Optional[str]) -> Dict[str, Any]:
+        response = self.request.post(
+            '/api/verify/create', payload, idempotency_key=idempotency_key
+        )
+        if self.cache is not None:
+            self.cache.invalidate_balance()
         return response.get('data', response)
     
+    def create_many(
+        self,
+        specs: Iterable[Dict[str, Any]],
+        concurrency: int = 10,
+        ordered: bool = False
+    ) -> CreateBatch:
+        """
+        Create many verification sessions concurrently
+        
+        Specs are consumed lazily with at most ``concurrency`` requests in
+        flight. The batch stops starting new sessions as soon as the API
+        reports insufficient balance (402).
+        
+        Args:
+            specs: Iterable of dicts of ``create()`` keyword arguments
+            concurrency: Maximum concurrent requests (default: 10)
+            ordered: Yield results in submission order instead of
+                completion order (default: False)
+            
+        Returns:
+            Iterable batch yielding (index, spec, session or VeriflyError);
+            its ``summary`` reports successes, the balance cut-off point
+            and retryable failures
+            
+        Example:
+            batch = verifly.verification.create_many(
+                ({'phone': phone, 'methods': ['sms']} for phone in phones),
+                concurrency=20
+            )
+            for index, spec, result in batch:
+                ...
+            print(batch.summary)
+        """
+        return CreateBatch(
+            self.create, specs, concurrency, ordered,
+            self.request.retry_policy.is_retryable
+        )
+    
     def get(self, session_id: str) -> Dict[str, Any]:
         """
         Get verification session status
@@ -82,13 +273,88 @@ class Verification:
             session_id: Session ID
             
         Returns:
-            Session status data
+            Session status data, served from the cache when one is
+            configured and holds a live entry
             
         Example:
             status = verifly.verification.get('session-id')
         """
+        if self.cache is not None:
+            cached = self.cache.get_status(session_id)
+            if cached is not None:
+                return cached
+        return self._fetch(session_id)
+    
+    def _fetch(self, session_id: str) -> Dict[str, Any]:
+        """Fetch session status from the API, refreshing the cache"""
         response = self.request.get(f'/api/verify/{session_id}')
-        return response.get('data', response)
+        data = response.get('data', response)
+        if self.typed_responses:
+            data = SessionStatus(data)
+        if self.cache is not None:
+            self.cache.set_status(session_id, data)
+        return data
+    
+    def get_many(
+        self,
+        session_ids: Iterable[str],
+        concurrency: int = 10
+    ) -> Iterator[Tuple[str, Union[Dict[str, Any], VeriflyError]]]:
+        """
+        Get the status of many sessions concurrently
+        
+        IDs are consumed lazily and at most ``concurrency`` requests are in
+        flight, so large inputs are streamed in constant memory. Results
+        are yielded as they complete; per-session API errors (for example
+        ``NotFoundError``) are yielded in place of the result instead of
+        aborting the batch.
+        
+        Args:
+            session_ids: Iterable of session IDs
+            concurrency: Maximum concurrent requests (default: 10)
+            
+        Yields:
+            (session_id, status data or VeriflyError) tuples
+            
+        Example:
+            for session_id, result in verifly.verification.get_many(ids, concurrency=20):
+                if isinstance(result, VeriflyError):
+                    print(f"{session_id}: {result}")
+                else:
+                    print(f"{session_id}: {result['status']}")
+        """
+        for session_id, result, error in iter_bounded(self.get, session_ids, concurrency):
+            if error is not None:
+                if not isinstance(error, VeriflyError):
+                    raise error
+                result = error
+            yield session_id, result
+    
+    def wait(self, session_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait until a session is verified, failed, aborted or expired
+        
+        Polling for all waiting sessions is coalesced into one shared
+        scheduler. Each session is polled quickly right after its status
+        or method changes and progressively less often while idle, and
+        polling stops at the session's ``expiresAt``.
+        
+        Args:
+            session_id: Session ID
+            timeout: Maximum seconds to wait (default: until the session expires)
+            
+        Returns:
+            Last observed session status data
+            
+        Raises:
+            WaitTimeoutError: If the timeout elapses first
+            
+        Example:
+            status = verifly.verification.wait('session-id', timeout=300)
+            if status['status'] == 'verified':
+                print('Verified!')
+        """
+        return self.poller.wait(session_id, timeout)
     
     def select_method(
         self,
@@ -118,7 +384,7 @@ class Verification:
         if recipient_contact:
             data['recipientContact'] = recipient_contact
         
-        response = self.request.post(f'/api/verify/{session_id}/select-method', data)
+        response = self._action(session_id, 'select-method', data)
         return response.get('data', response)
     
     def cancel(self, session_id: str) -> Dict[str, Any]:
@@ -134,8 +400,7 @@ class Verification:
         Example:
             result = verifly.verification.cancel('session-id')
         """
-        response = self.request.post(f'/api/verify/{session_id}/cancel')
-        return response
+        return self._action(session_id, 'cancel')
     
     def abort(self, session_id: str) -> Dict[str, Any]:
         """
@@ -150,8 +415,20 @@ class Verification:
         Example:
             result = verifly.verification.abort('session-id')
         """
-        response = self.request.post(f'/api/verify/{session_id}/abort')
-        return response
+        return self._action(session_id, 'abort')
+    
+    def _action(
+        self,
+        session_id: str,
+        action: str,
+        data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """POST a session action, dropping the cached status afterwards"""
+        try:
+            return self.request.post(f'/api/verify/{session_id}/{action}', data)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(session_id)
     
     def get_balance(self) -> Dict[str, Any]:
         """
@@ -164,5 +441,55 @@ class Verification:
             balance = verifly.verification.get_balance()
             print(f"Balance: {balance['balance']} {balance['currency']}")
         """
+        if self.cache is not None:
+            cached = self.cache.get_balance()
+            if cached is not None:
+                return cached
         response = self.request.get('/api/verify/balance')
-        return response.get('data', response)
+        data = response.get('data', response)
+        if self.typed_responses:
+            data = Balance(data)
+        if self.cache is not None:
+            self.cache.set_balance(data)
+        return data
+    
+    def iter_transactions(
+        self,
+        since: Optional[Union[str, datetime]] = None,
+        page_size: int = 100,
+        prefetch: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the full transaction history, oldest first
+        
+        Pages are requested lazily from ``/api/verify/transactions``.
+        While the caller processes one page, the next is fetched on a
+        background thread, and at most two pages are held in memory.
+        
+        Args:
+            since: Only transactions created at or after this time (ISO
+                8601 string or datetime; naive datetimes are taken as UTC)
+            page_size: Transactions per request (default: 100)
+            prefetch: Fetch the next page in the background (default: True)
+            
+        Yields:
+            Transaction data (``Transaction`` models with typed_responses)
+            
+        Raises:
+            ValueError: If page_size is less than 1
+            
+        Example:
+            for tx in verifly.verification.iter_transactions(since='2025-01-01T00:00:00Z'):
+                print(tx['createdAt'], tx['type'], tx['amount'])
+        """
+        if page_size < 1:
+            raise ValueError('page_size must be at least 1')
+        
+        def fetch(cursor: Optional[str]) -> Page:
+            response = self.request.get(
+                '/api/verify/transactions',
+                build_transactions_params(since, page_size, cursor)
+            )
+            return parse_transactions_page(response, self.typed_responses)
+        
+        return iter_pages(fetch, prefetch)
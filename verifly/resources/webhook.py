@@ -2,23 +2,123 @@
 Webhook Resource - Verify webhook signatures
 """
 
-import hashlib
-import hmac
 import json
-from typing import Dict, Any, Optional
+import logging
+import time
+from typing import Callable, Dict, Any, List, Optional, Sequence, Union
+from ..errors import WebhookVerificationError, DuplicateWebhookError
+from ..utils.hooks import RequestHooks, emit
+from ..utils.replay import ReplayStore
+from ..utils.signer import Signer
+
+logger = logging.getLogger(__name__)
 
 
 class Webhook:
     """Webhook signature verification"""
     
-    def __init__(self, secret_key: str):
+    def __init__(
+        self,
+        secret_key: str,
+        signer: Optional[Signer] = None,
+        tolerance: Optional[float] = None,
+        replay_store: Optional[ReplayStore] = None,
+        hooks: Optional[Sequence[RequestHooks]] = None
+    ):
         """
         Initialize Webhook resource
         
         Args:
             secret_key: Application secret key
+            signer: Pre-keyed signer to share (default: built from secret_key)
+            tolerance: Maximum age in seconds of X-Timestamp, e.g. 300
+                (default: None, timestamps are not checked)
+            replay_store: Store of processed signatures; when set,
+                construct_event rejects repeated deliveries
+            hooks: Hooks notified of each verification outcome
+        """
+        self.signer = signer if signer is not None else Signer(secret_key)
+        self.tolerance = tolerance
+        self.replay_store = replay_store
+        self.hooks = list(hooks or ())
+        self._listeners = []  # type: List[Callable[[Dict[str, Any]], None]]
+    
+    @property
+    def secret_key(self) -> str:
+        """Secret key used for webhook signatures"""
+        return self.signer.secret_key
+    
+    @secret_key.setter
+    def secret_key(self, secret_key: str) -> None:
+        self.signer = Signer(secret_key)
+    
+    def _timestamp_ok(self, timestamp: Optional[str]) -> bool:
+        """Check X-Timestamp is within the tolerance window"""
+        if self.tolerance is None:
+            return True
+        try:
+            sent_at = float(timestamp)
+        except (TypeError, ValueError):
+            return False
+        if sent_at > 1e11:  # milliseconds
+            sent_at /= 1000.0
+        return abs(time.time() - sent_at) <= self.tolerance
+    
+    def _check_replay(self, signature: str, started: Optional[float] = None) -> None:
+        """Record a verified delivery, rejecting ones already seen"""
+        if self.replay_store is None:
+            return
+        ttl = 2 * self.tolerance if self.tolerance is not None else 86400
+        if not self.replay_store.add(signature, ttl):
+            self._report(started, 'duplicate')
+            raise DuplicateWebhookError('Duplicate webhook delivery')
+    
+    def forget_delivery(self, signature: Optional[str]) -> None:
         """
-        self.secret_key = secret_key
+        Forget a delivery recorded by the replay store
+        
+        Call when a verified event could not be accepted for processing
+        (for example, a full queue answered with 503), so that the
+        sender's retry is not rejected as a duplicate.
+        
+        Args:
+            signature: X-Signature header of the refused delivery
+        """
+        if self.replay_store is None or not signature:
+            return
+        try:
+            self.replay_store.discard(signature)
+        except NotImplementedError:
+            logger.warning(
+                '%s does not implement discard(); a refused webhook delivery '
+                'will be treated as a duplicate when retried',
+                type(self.replay_store).__name__
+            )
+    
+    def add_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Call ``listener(event)`` for every event that passes verification
+        
+        Listeners run synchronously inside ``construct_event()`` and
+        ``construct_event_from_bytes()``; exceptions they raise are logged
+        and never fail the verification.
+        
+        Args:
+            listener: Callable receiving the verified event
+        """
+        self._listeners.append(listener)
+    
+    def _notify(self, event: Dict[str, Any]) -> None:
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.exception('Webhook listener %r failed', listener)
+    
+    def _report(self, started: Optional[float], result: str) -> None:
+        """Notify hooks of a verification outcome (started is None without hooks)"""
+        if started is not None:
+            emit(self.hooks, 'on_webhook_verify', result, time.perf_counter() - started)
     
     def generate_signature(self, payload: Dict[str, Any], timestamp: str) -> str:
         """
@@ -35,15 +135,7 @@ class Webhook:
             signature = verifly.webhook.generate_signature(payload, timestamp)
         """
         payload_str = json.dumps(payload, separators=(',', ':'), ensure_ascii=False)
-        message = f"{payload_str}{timestamp}"
-        
-        signature = hmac.new(
-            self.secret_key.encode('utf-8'),
-            message.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        
-        return signature
+        return self.signer.sign(payload_str, timestamp)
     
     def verify(self, payload: Dict[str, Any], signature: str, timestamp: str) -> bool:
         """
@@ -55,15 +147,50 @@ class Webhook:
             timestamp: Timestamp from X-Timestamp header
             
         Returns:
-            True if signature is valid
+            True if signature is valid and the timestamp is within tolerance
             
         Example:
             is_valid = verifly.webhook.verify(payload, signature, timestamp)
             if not is_valid:
                 raise ValueError('Invalid signature')
         """
-        expected_signature = self.generate_signature(payload, timestamp)
-        return hmac.compare_digest(expected_signature, signature)
+        if not self._timestamp_ok(timestamp):
+            return False
+        
+        payload_str = json.dumps(payload, separators=(',', ':'), ensure_ascii=False)
+        return self.signer.verify(payload_str, timestamp, signature)
+    
+    def verify_raw(
+        self,
+        body: Union[bytes, str],
+        signature: Optional[str],
+        timestamp: Optional[str]
+    ) -> bool:
+        """
+        Verify webhook signature against the raw request body
+        
+        The HMAC is computed over the body exactly as received, so the
+        payload never has to be parsed or re-serialized.
+        
+        Args:
+            body: Raw request body bytes
+            signature: Signature from X-Signature header
+            timestamp: Timestamp from X-Timestamp header
+            
+        Returns:
+            True if signature is valid and the timestamp is within tolerance
+            
+        Example:
+            is_valid = verifly.webhook.verify_raw(
+                request.get_data(),
+                request.headers.get('X-Signature'),
+                request.headers.get('X-Timestamp')
+            )
+        """
+        if not signature or not self._timestamp_ok(timestamp):
+            return False
+        
+        return self.signer.verify(body, timestamp, signature)
     
     def construct_event(
         self,
@@ -83,15 +210,80 @@ class Webhook:
             Verified event data
             
         Raises:
-            ValueError: If signature is invalid
+            WebhookVerificationError: If signature or timestamp is invalid
+            DuplicateWebhookError: If the delivery was already processed
+                (both are ValueError subclasses)
             
         Example:
             event = verifly.webhook.construct_event(payload, signature, timestamp)
         """
+        started = time.perf_counter() if self.hooks else None
+        
+        if not self._timestamp_ok(timestamp):
+            self._report(started, 'stale')
+            raise WebhookVerificationError('Webhook timestamp outside tolerance window')
+        
         if not self.verify(payload, signature, timestamp):
-            raise ValueError('Invalid webhook signature')
+            self._report(started, 'invalid')
+            raise WebhookVerificationError('Invalid webhook signature')
         
+        self._check_replay(signature, started)
+        self._report(started, 'valid')
+        if self._listeners:
+            self._notify(payload)
         return payload
+    
+    def construct_event_from_bytes(
+        self,
+        body: Union[bytes, bytearray, memoryview, str],
+        signature: Optional[str],
+        timestamp: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Verify raw webhook body and construct event object
+        
+        JSON is parsed only after the signature has been verified, so
+        forged requests are rejected without paying for parsing.
+        
+        Args:
+            body: Raw request body bytes
+            signature: Signature from X-Signature header
+            timestamp: Timestamp from X-Timestamp header
+            
+        Returns:
+            Verified event data
+            
+        Raises:
+            WebhookVerificationError: If signature or timestamp is invalid
+            DuplicateWebhookError: If the delivery was already processed
+            ValueError: If body is not valid JSON
+            
+        Example:
+            event = verifly.webhook.construct_event_from_bytes(
+                request.get_data(), signature, timestamp
+            )
+        """
+        started = time.perf_counter() if self.hooks else None
+        
+        if not self._timestamp_ok(timestamp):
+            self._report(started, 'stale')
+            raise WebhookVerificationError('Webhook timestamp outside tolerance window')
+        
+        if not self.verify_raw(body, signature, timestamp):
+            self._report(started, 'invalid')
+            raise WebhookVerificationError('Invalid webhook signature')
+        
+        self._check_replay(signature, started)
+        self._report(started, 'valid')
+        
+        if isinstance(body, memoryview):
+            body = body.tobytes()
+        
+        # json.loads reads UTF-8 bytes directly, without a decoded copy
+        event = json.loads(body)
+        if self._listeners:
+            self._notify(event)
+        return event
 
 
 class WebhookResponse:
@@ -0,0 +1,19 @@
+"""
+Testing utilities
+
+``MockVerifly`` runs a local stand-in for the Verifly API, in-process or
+from the command line::
+
+    python -m verifly.testing --port 8080 --latency 0.02 --error 503=0.01
+
+Example:
+    from verifly.testing import MockVerifly
+
+    with MockVerifly() as mock:
+        verifly = mock.client()
+        session = verifly.verification.create(phone='5551234567', methods=['sms'])
+"""
+
+from .server import MockVerifly
+
+__all__ = ['MockVerifly']
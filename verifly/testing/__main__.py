@@ -0,0 +1,76 @@
+"""
+Run the mock Verifly API server
+
+Usage:
+    python -m verifly.testing [--host HOST] [--port PORT] [--latency SECONDS]
+                              [--error STATUS=RATE ...] [--balance AMOUNT]
+"""
+
+import argparse
+from typing import List, Optional, Tuple
+
+from .server import MockVerifly
+
+
+def _error_rate(value: str) -> Tuple[int, float]:
+    try:
+        status, rate = value.split('=', 1)
+        return int(status), float(rate)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'expected STATUS=RATE, got {value!r}')
+
+
+def _latency(value: str):
+    if '-' in value:
+        low, high = value.split('-', 1)
+        return float(low), float(high)
+    return float(value)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m verifly.testing',
+        description='Serve a local stand-in for the Verifly API'
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='interface to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8080, help='port to bind (default: 8080)')
+    parser.add_argument('--api-key', default='test-api-key', help='accepted API key')
+    parser.add_argument('--secret-key', default='test-secret-key', help='HMAC secret key')
+    parser.add_argument('--balance', type=float, default=1000.0, help='starting balance')
+    parser.add_argument('--cost', type=float, default=1.0, help='balance charged per session')
+    parser.add_argument(
+        '--latency', type=_latency, default=0.0,
+        help='added delay in seconds, or a MIN-MAX range (default: 0)'
+    )
+    parser.add_argument(
+        '--error', type=_error_rate, action='append', default=[], metavar='STATUS=RATE',
+        help='inject an error status at a rate, e.g. 503=0.01 (repeatable)'
+    )
+    parser.add_argument(
+        '--auto-verify-after', type=float, default=None, metavar='SECONDS',
+        help='verify sessions this long after a method is selected'
+    )
+    parser.add_argument('--webhook-url', default=None, help='deliver all webhooks to this URL')
+    parser.add_argument('--seed', type=int, default=None, help='seed for latency and error sampling')
+    args = parser.parse_args(argv)
+
+    mock = MockVerifly(
+        api_key=args.api_key,
+        secret_key=args.secret_key,
+        host=args.host,
+        port=args.port,
+        balance=args.balance,
+        cost=args.cost,
+        latency=args.latency,
+        errors=dict(args.error),
+        auto_verify_after=args.auto_verify_after,
+        webhook_url=args.webhook_url,
+        seed=args.seed
+    )
+    mock.start()
+    print(f'Mock Verifly API listening on {mock.url} (api key {args.api_key!r})')
+    mock.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
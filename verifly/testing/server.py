@@ -0,0 +1,655 @@
+"""
+In-process stand-in for the Verifly API
+
+``MockVerifly`` serves the verification endpoints over real HTTP on a
+local port, validating API keys and HMAC signatures the way the
+production API does. Sessions follow the real state machine, balance is
+charged per session, and signed webhooks are delivered to each
+session's ``webhookUrl``.
+"""
+
+import json
+import queue
+import random
+import secrets
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..utils.signer import Signer
+from ..utils.timeutil import to_epoch
+
+VALID_METHODS = ('sms', 'whatsapp', 'call', 'email')
+
+# Default session lifetime in minutes, as documented for ``create(timeout=...)``
+DEFAULT_SESSION_TIMEOUT = 10
+
+_ERROR_MESSAGES = {
+    402: 'Insufficient balance',
+    429: 'Too many requests',
+    500: 'Internal server error',
+    502: 'Bad gateway',
+    503: 'Service unavailable',
+    504: 'Gateway timeout',
+}
+
+Latency = Union[float, Tuple[float, float]]
+
+
+def _isoformat(moment: datetime) -> str:
+    return moment.strftime('%Y-%m-%dT%H:%M:%S.') + f'{moment.microsecond // 1000:03d}Z'
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class _ApiError(Exception):
+    def __init__(self, status: int, message: str, data: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.status = status
+        self.data = data
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    # Deep accept backlog for load tests with many concurrent clients
+    request_queue_size = 1024
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients hanging up mid-response, e.g. cancelled hedge requests,
+        # are expected and not worth a traceback
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes; without TCP_NODELAY,
+    # Nagle's algorithm and delayed ACKs add ~40ms to every response
+    disable_nagle_algorithm = True
+    mock = None  # type: MockVerifly
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._dispatch('GET')
+
+    def do_POST(self) -> None:
+        self._dispatch('POST')
+
+    def _dispatch(self, method: str) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        path, _, query = self.path.partition('?')
+        status, payload, headers = self.mock._handle(
+            method, path, self.headers, body, dict(urllib.parse.parse_qsl(query))
+        )
+        content = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class MockVerifly:
+    """
+    Local Verifly API server for tests, load tests and offline development
+
+    Implements ``/api/verify/create``, ``/api/verify/{id}``,
+    ``/api/verify/{id}/select-method``, ``/cancel``, ``/abort``,
+    ``/api/verify/balance`` and the cursor-paginated
+    ``/api/verify/transactions``. Requests must carry a valid ``X-API-Key``,
+    a fresh ``X-Timestamp`` and an ``X-Signature`` computed exactly as the
+    SDK signs requests; otherwise the server answers 401.
+
+    Sessions start ``pending``. Selecting a method keeps them pending
+    until ``complete()`` or ``fail()`` is called (or ``auto_verify_after``
+    elapses); ``cancel`` clears the method, ``abort`` is final and
+    sessions expire at ``expiresAt``. Each transition to a terminal
+    status sends a signed webhook to the session's ``webhookUrl``.
+
+    Example:
+        with MockVerifly(latency=0.02, errors={503: 0.01}) as mock:
+            verifly = mock.client()
+            session = verifly.verification.create(phone='5551234567', methods=['sms'])
+            verifly.verification.select_method(session['sessionId'], 'sms')
+            mock.complete(session['sessionId'])
+            assert verifly.verification.get(session['sessionId'])['status'] == 'verified'
+    """
+
+    def __init__(
+        self,
+        api_key: str = 'test-api-key',
+        secret_key: str = 'test-secret-key',
+        host: str = '127.0.0.1',
+        port: int = 0,
+        balance: float = 1000.0,
+        cost: float = 1.0,
+        currency: str = 'TRY',
+        latency: Latency = 0.0,
+        errors: Optional[Dict[int, float]] = None,
+        auto_verify_after: Optional[float] = None,
+        timestamp_tolerance: float = 300,
+        webhook_url: Optional[str] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize mock server
+
+        Args:
+            api_key: Accepted X-API-Key
+            secret_key: Secret key used to check request signatures and sign webhooks
+            host: Interface to bind (default: '127.0.0.1')
+            port: Port to bind (default: 0, any free port)
+            balance: Starting account balance
+            cost: Balance charged per created session
+            currency: Balance currency
+            latency: Added delay per request in seconds, or a (min, max)
+                range sampled uniformly
+            errors: Injected error rates by status, e.g. {429: 0.05, 503: 0.01}
+            auto_verify_after: Verify sessions this many seconds after a
+                method is selected (default: only via ``complete()``)
+            timestamp_tolerance: Maximum X-Timestamp skew in seconds
+            webhook_url: Deliver webhooks here instead of each session's webhookUrl
+            seed: Seed for latency and error sampling, for reproducible runs
+        """
+        self.api_key = api_key
+        self.signer = Signer(secret_key)
+        self.host = host
+        self.port = port
+        self.balance = balance
+        self.cost = cost
+        self.currency = currency
+        self.latency = latency
+        self.errors = dict(errors or {})
+        self.auto_verify_after = auto_verify_after
+        self.timestamp_tolerance = timestamp_tolerance
+        self.webhook_url = webhook_url
+        self.request_count = 0
+        self.deliveries = []  # type: List[Tuple[str, Dict[str, Any], Optional[int]]]
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._sessions = {}  # type: Dict[str, Dict[str, Any]]
+        self._idempotency = {}  # type: Dict[str, str]
+        self._transactions = []  # type: List[Dict[str, Any]]
+        self._forced = []  # type: List[int]
+        self._server = None  # type: Optional[_Server]
+        self._webhooks = queue.Queue()
+        self._threads = []  # type: List[threading.Thread]
+
+    # -- lifecycle ---------------------------------------------------------
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server"""
+        if self._server is None:
+            raise RuntimeError('Server is not running')
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'MockVerifly':
+        """Start serving on a background thread"""
+        if self._server is not None:
+            return self
+        handler = type('MockVeriflyHandler', (_Handler,), {'mock': self})
+        self._server = _Server((self.host, self.port), handler)
+        self._threads = [
+            threading.Thread(target=self._server.serve_forever, name='verifly-mock', daemon=True),
+            threading.Thread(target=self._deliver_webhooks, name='verifly-mock-webhooks', daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted (used by the CLI)"""
+        self.start()
+        try:
+            self._threads[0].join()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop the server and the webhook sender"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        self._webhooks.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def __enter__(self) -> 'MockVerifly':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def client(self, **options: Any):
+        """
+        Create a ``Verifly`` client pointed at this server
+
+        Args:
+            **options: Extra ``Verifly`` constructor arguments; pass
+                ``base_urls`` to put this server behind other URLs
+
+        Returns:
+            Configured Verifly client
+        """
+        from ..client import Verifly
+
+        options.setdefault('base_urls', [self.url])
+        return Verifly(self.api_key, self.signer.secret_key, **options)
+
+    def async_client(self, **options: Any):
+        """
+        Create an ``AsyncVerifly`` client pointed at this server
+
+        Args:
+            **options: Extra ``AsyncVerifly`` constructor arguments; pass
+                ``base_urls`` to put this server behind other URLs
+
+        Returns:
+            Configured AsyncVerifly client
+        """
+        from ..async_client import AsyncVerifly
+
+        options.setdefault('base_urls', [self.url])
+        return AsyncVerifly(self.api_key, self.signer.secret_key, **options)
+
+    # -- test controls -----------------------------------------------------
+
+    def fail_next(self, status: int, count: int = 1) -> None:
+        """
+        Answer the next ``count`` requests with an error status
+
+        Args:
+            status: HTTP status to return (e.g. 429, 502, 503)
+            count: Number of requests affected
+        """
+        with self._lock:
+            self._forced.extend([status] * count)
+
+    def complete(self, session_id: str, method: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Mark a session verified and send ``verification.completed``
+
+        Args:
+            session_id: Session ID
+            method: Method used (default: the selected method)
+
+        Returns:
+            Session data
+        """
+        with self._lock:
+            session = self._session(session_id)
+            self._verify(session, method)
+            return dict(session)
+
+    def fail(self, session_id: str, reason: str = 'Invalid code') -> Dict[str, Any]:
+        """
+        Mark a session failed and send ``verification.failed``
+
+        Args:
+            session_id: Session ID
+            reason: Failure reason included in the webhook
+
+        Returns:
+            Session data
+        """
+        with self._lock:
+            session = self._session(session_id)
+            self._finish(session, 'failed', 'verification.failed', {'reason': reason})
+            return dict(session)
+
+    def expire(self, session_id: str) -> Dict[str, Any]:
+        """
+        Expire a session now and send ``verification.expired``
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Session data
+        """
+        with self._lock:
+            session = self._session(session_id)
+            self._finish(session, 'expired', 'verification.expired')
+            return dict(session)
+
+    def sessions(self) -> List[Dict[str, Any]]:
+        """Return a snapshot of all sessions"""
+        with self._lock:
+            return [dict(session) for session in self._sessions.values()]
+
+    def sign_webhook(self, event: str, data: Dict[str, Any]) -> Tuple[bytes, Dict[str, str]]:
+        """
+        Build a signed webhook delivery
+
+        Args:
+            event: Event name, e.g. 'verification.completed'
+            data: Event data
+
+        Returns:
+            (body bytes, headers with X-Signature and X-Timestamp)
+        """
+        # Compact, UTF-8 encoded JSON, as the API sends it
+        body = json.dumps(
+            {'event': event, 'data': data}, separators=(',', ':'), ensure_ascii=False
+        ).encode('utf-8')
+        timestamp = str(int(time.time()))
+        return body, {
+            'Content-Type': 'application/json',
+            'X-Signature': self.signer.sign(body, timestamp),
+            'X-Timestamp': timestamp,
+        }
+
+    # -- request handling --------------------------------------------------
+
+    def _handle(
+        self,
+        method: str,
+        path: str,
+        headers: Any,
+        body: bytes,
+        query: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        with self._lock:
+            self.request_count += 1
+            forced = self._forced.pop(0) if self._forced else None
+
+        self._sleep()
+        try:
+            if forced is None:
+                forced = self._sample_error()
+            if forced is not None:
+                raise _ApiError(forced, _ERROR_MESSAGES.get(forced, 'Injected error'))
+            self._authenticate(headers, body)
+            data = json.loads(body) if body else {}
+            with self._lock:
+                result = self._route(
+                    method, path, data, headers.get('Idempotency-Key'), query or {}
+                )
+            return 200, result, {}
+        except _ApiError as e:
+            payload = {'success': False, 'message': str(e)}
+            if e.data is not None:
+                payload['data'] = e.data
+            extra = {'Retry-After': '1'} if e.status in (429, 503) else {}
+            return e.status, payload, extra
+        except ValueError:
+            return 400, {'success': False, 'message': 'Invalid JSON body'}, {}
+
+    def _sleep(self) -> None:
+        latency = self.latency
+        if isinstance(latency, tuple):
+            with self._lock:
+                latency = self._random.uniform(*latency)
+        if latency > 0:
+            time.sleep(latency)
+
+    def _sample_error(self) -> Optional[int]:
+        if not self.errors:
+            return None
+        with self._lock:
+            roll = self._random.random()
+        for status, rate in self.errors.items():
+            if roll < rate:
+                return status
+            roll -= rate
+        return None
+
+    def _authenticate(self, headers: Any, body: bytes) -> None:
+        if headers.get('X-API-Key') != self.api_key:
+            raise _ApiError(401, 'Invalid API key')
+
+        timestamp = headers.get('X-Timestamp') or ''
+        try:
+            skew = abs(time.time() - int(timestamp))
+        except ValueError:
+            raise _ApiError(401, 'Invalid timestamp')
+        if skew > self.timestamp_tolerance:
+            raise _ApiError(401, 'Request timestamp expired')
+
+        # Bodyless requests are signed over '{}', like the SDK does; the
+        # idempotency key is part of the signed message
+        if not self.signer.verify(
+            body or b'{}', timestamp, headers.get('X-Signature'), headers.get('Idempotency-Key')
+        ):
+            raise _ApiError(401, 'Invalid signature')
+
+    def _route(
+        self,
+        method: str,
+        path: str,
+        data: Dict[str, Any],
+        idempotency_key: Optional[str],
+        query: Dict[str, str]
+    ) -> Dict[str, Any]:
+        parts = path.strip('/').split('/')
+        if parts[:2] != ['api', 'verify'] or len(parts) < 3:
+            raise _ApiError(404, 'Not found')
+
+        if method == 'POST' and parts[2:] == ['create']:
+            return self._create(data, idempotency_key)
+        if method == 'GET' and parts[2:] == ['balance']:
+            return self._balance()
+        if method == 'GET' and parts[2:] == ['transactions']:
+            return self._transactions_page(query)
+
+        session = self._session(parts[2])
+        if method == 'GET' and len(parts) == 3:
+            return {'success': True, 'data': self._public(session)}
+        if method == 'POST' and len(parts) == 4:
+            action = parts[3]
+            if action == 'select-method':
+                return self._select_method(session, data)
+            if action == 'cancel':
+                return self._cancel(session)
+            if action == 'abort':
+                return self._abort(session)
+        raise _ApiError(404, 'Not found')
+
+    # -- session state machine (called with the lock held) ------------------
+
+    def _create(self, data: Dict[str, Any], idempotency_key: Optional[str]) -> Dict[str, Any]:
+        if idempotency_key and idempotency_key in self._idempotency:
+            session = self._sessions[self._idempotency[idempotency_key]]
+            return {'success': True, 'data': self._public(session)}
+
+        phone = data.get('phone')
+        email = data.get('email')
+        if not phone and not email:
+            raise _ApiError(400, 'phone or email is required')
+        methods = data.get('methods') or (['email'] if email and not phone else ['sms'])
+        invalid = [m for m in methods if m not in VALID_METHODS]
+        if invalid:
+            raise _ApiError(400, f'Invalid methods: {", ".join(invalid)}')
+
+        timeout = data.get('timeout') or DEFAULT_SESSION_TIMEOUT
+        if not 1 <= timeout <= 15:
+            raise _ApiError(400, 'timeout must be between 1 and 15 minutes')
+
+        if self.balance < self.cost:
+            raise _ApiError(402, 'Insufficient balance', {
+                'balance': self.balance, 'required': self.cost, 'currency': self.currency
+            })
+        self.balance -= self.cost
+
+        now = _now()
+        session_id = secrets.token_hex(12)
+        session = {
+            'sessionId': session_id,
+            'iframeUrl': f'{self.url}/verify/iframe/{session_id}',
+            'expiresAt': _isoformat(now + timedelta(minutes=timeout)),
+            'allowedMethods': list(methods),
+            'method': methods[0] if len(methods) == 1 else None,
+            'status': 'pending',
+            'recipientContact': phone or email,
+            'createdAt': _isoformat(now),
+            '_expires': time.time() + timeout * 60,
+            '_selected': None,
+            '_webhookUrl': self.webhook_url or data.get('webhookUrl'),
+            '_customData': data.get('data'),
+        }
+        self._sessions[session_id] = session
+        if idempotency_key:
+            self._idempotency[idempotency_key] = session_id
+        self._transactions.append({
+            'type': 'debit',
+            'amount': self.cost,
+            'description': 'Verification session',
+            'sessionId': session_id,
+            'createdAt': _isoformat(now),
+        })
+        return {'success': True, 'data': self._public(session)}
+
+    def _select_method(self, session: Dict[str, Any], data: Dict[str, Any]) -> Dict[str, Any]:
+        self._require_pending(session)
+        method = data.get('method')
+        if method not in session['allowedMethods']:
+            raise _ApiError(400, f'Method not allowed: {method}')
+        session['method'] = method
+        if data.get('recipientContact'):
+            session['recipientContact'] = data['recipientContact']
+        session['_selected'] = time.time()
+        return {'success': True, 'data': self._public(session)}
+
+    def _cancel(self, session: Dict[str, Any]) -> Dict[str, Any]:
+        self._require_pending(session)
+        if len(session['allowedMethods']) > 1:
+            session['method'] = None
+        session['_selected'] = None
+        return {'success': True, 'message': 'Session cancelled'}
+
+    def _abort(self, session: Dict[str, Any]) -> Dict[str, Any]:
+        self._require_pending(session)
+        self._finish(session, 'aborted', None)
+        return {'success': True, 'message': 'Session aborted'}
+
+    def _balance(self) -> Dict[str, Any]:
+        return {'success': True, 'data': {
+            'balance': self.balance,
+            'currency': self.currency,
+            'userId': 'mock-user',
+            'email': 'mock@example.com',
+            'recentTransactions': list(reversed(self._transactions[-10:])),
+        }}
+
+    def _transactions_page(self, query: Dict[str, str]) -> Dict[str, Any]:
+        # The cursor is the index of the next transaction; the list only grows
+        try:
+            limit = int(query.get('limit') or 100)
+            start = int(query.get('cursor') or 0)
+        except ValueError:
+            raise _ApiError(400, 'Invalid limit or cursor')
+        if not 1 <= limit <= 1000:
+            raise _ApiError(400, 'limit must be between 1 and 1000')
+        since = to_epoch(query['since']) if query.get('since') else None
+        if query.get('since') and since is None:
+            raise _ApiError(400, 'Invalid since')
+
+        page = []
+        index = start
+        while index < len(self._transactions) and len(page) < limit:
+            transaction = self._transactions[index]
+            index += 1
+            if since is None or to_epoch(transaction['createdAt']) >= since:
+                page.append(transaction)
+        next_cursor = str(index) if index < len(self._transactions) else None
+        return {'success': True, 'data': {'transactions': page, 'nextCursor': next_cursor}}
+
+    def _session(self, session_id: str) -> Dict[str, Any]:
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise _ApiError(404, 'Session not found')
+        self._advance(session)
+        return session
+
+    def _advance(self, session: Dict[str, Any]) -> None:
+        """Apply time-based transitions: auto-verification and expiry"""
+        if session['status'] != 'pending':
+            return
+        now = time.time()
+        selected = session['_selected']
+        if (
+            self.auto_verify_after is not None and selected is not None
+            and now - selected >= self.auto_verify_after
+        ):
+            self._verify(session, None)
+        elif now >= session['_expires']:
+            self._finish(session, 'expired', 'verification.expired')
+
+    def _require_pending(self, session: Dict[str, Any]) -> None:
+        if session['status'] != 'pending':
+            raise _ApiError(400, f"Session is {session['status']}")
+
+    def _verify(self, session: Dict[str, Any], method: Optional[str]) -> None:
+        session['method'] = method or session['method'] or session['allowedMethods'][0]
+        session['verificationCode'] = f'{self._random.randint(0, 999999):06d}'
+        session['verifiedAt'] = _isoformat(_now())
+        self._finish(session, 'verified', 'verification.completed', {
+            'method': session['method'],
+            'recipientContact': session['recipientContact'],
+            'verifiedAt': session['verifiedAt'],
+        })
+
+    def _finish(
+        self,
+        session: Dict[str, Any],
+        status: str,
+        event: Optional[str],
+        extra: Optional[Dict[str, Any]] = None
+    ) -> None:
+        session['status'] = status
+        url = session['_webhookUrl']
+        if event is None or url is None:
+            return
+        data = {'sessionId': session['sessionId']}
+        data.update(extra or {})
+        if session['_customData'] is not None:
+            data['customData'] = session['_customData']
+        self._webhooks.put((url, event, data))
+
+    @staticmethod
+    def _public(session: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in session.items() if not k.startswith('_')}
+
+    # -- webhook delivery --------------------------------------------------
+
+    def _deliver_webhooks(self) -> None:
+        while True:
+            item = self._webhooks.get()
+            if item is None:
+                return
+            url, event, data = item
+            body, headers = self.sign_webhook(event, data)
+            status = None
+            try:
+                request = urllib.request.Request(url, data=body, headers=headers, method='POST')
+                with urllib.request.urlopen(request, timeout=10) as response:
+                    status = response.status
+            except urllib.error.HTTPError as e:
+                status = e.code
+            except (urllib.error.URLError, OSError):
+                pass
+            with self._lock:
+                self.deliveries.append((url, {'event': event, 'data': data}, status))
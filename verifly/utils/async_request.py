@@ -0,0 +1,469 @@
+"""
+Async HTTP Request Handler with HMAC-SHA256 Authentication
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Dict, Any, Optional, Sequence, Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from ..errors import VeriflyError, NetworkError, RequestTimeoutError
+from .request import BaseRequestHandler, USER_AGENT
+from .circuit import CircuitBreaker
+from .endpoints import endpoint_class
+from .failover import EndpointPool, HedgePolicy
+from .hooks import RequestEvent, RequestHooks
+from .log import next_request_id
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .serializer import Serializer
+from .signer import Signer
+from .singleflight import AsyncSingleFlight
+
+# Sent with every request rather than as session defaults, so a
+# caller-supplied session sends them too
+_SDK_HEADERS = {
+    'Content-Type': 'application/json',
+    'User-Agent': USER_AGENT
+}
+
+
+class AsyncRequestHandler(BaseRequestHandler):
+    """Handles asyncio HTTP requests with HMAC-SHA256 authentication"""
+
+    def __init__(
+        self,
+        api_key: str,
+        secret_key: str,
+        timeout: int = 30,
+        debug: bool = False,
+        max_connections: int = 100,
+        session: Optional['aiohttp.ClientSession'] = None,
+        serializer: Optional[Serializer] = None,
+        signer: Optional[Signer] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        keepalive_timeout: float = 15.0,
+        hooks: Optional[Sequence[RequestHooks]] = None,
+        coalesce_requests: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        base_urls: Optional[Union[Sequence[str], EndpointPool]] = None,
+        hedge: Optional[HedgePolicy] = None
+    ):
+        """
+        Initialize async request handler
+
+        Args:
+            api_key: Verifly API key
+            secret_key: Application secret key for HMAC signature
+            timeout: Request timeout in seconds
+            debug: Enable debug logging
+            max_connections: Size of the shared connection pool
+            session: Existing aiohttp session to share (not closed by the handler)
+            serializer: Callable encoding request data to JSON bytes
+            signer: Pre-keyed signer to share
+            retry_policy: Retry policy for failed requests
+            rate_limiter: Optional client-side rate limiter
+            connect_timeout: Connection timeout in seconds (default: timeout)
+            read_timeout: Socket read timeout in seconds (default: timeout)
+            keepalive_timeout: Seconds idle connections are kept alive
+            hooks: Lifecycle hooks notified of every attempt
+            coalesce_requests: Share one in-flight request between
+                concurrent identical GETs
+            circuit_breaker: Breaker failing requests fast during outages
+            base_urls: API base URLs in order of preference, or an EndpointPool
+            hedge: Hedging policy for GETs (default: no hedging)
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError(
+                'The async client requires aiohttp. '
+                'Install it with: pip install verifly-sdk[async]'
+            )
+
+        super().__init__(
+            api_key=api_key,
+            secret_key=secret_key,
+            timeout=timeout,
+            debug=debug,
+            serializer=serializer,
+            signer=signer,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            hooks=hooks,
+            circuit_breaker=circuit_breaker,
+            base_urls=base_urls,
+            hedge=hedge
+        )
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+        self.session = session
+        self._owns_session = session is None
+        self._flights = AsyncSingleFlight() if coalesce_requests else None
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """
+        Return the pooled session, creating it on first use
+
+        The session is created lazily so that it binds to the running
+        event loop rather than the one active at construction time.
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                trace_configs=[self._connect_trace()] if self.hooks else None
+            )
+            self._owns_session = True
+        return self.session
+
+    @staticmethod
+    def _connect_trace() -> 'aiohttp.TraceConfig':
+        """Trace config recording connection setup time on the request's event"""
+        async def on_start(session, context, params):
+            context.connect_started = time.perf_counter()
+
+        async def on_end(session, context, params):
+            event = context.trace_request_ctx
+            if event is not None:
+                event.timings['connect'] = time.perf_counter() - context.connect_started
+
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_start.append(on_start)
+        trace.on_connection_create_end.append(on_end)
+        return trace
+
+    async def close(self) -> None:
+        """Close the pooled session if this handler owns it, and leave debug mode"""
+        self.debug = False
+        if self.session is not None and self._owns_session and not self.session.closed:
+            await self.session.close()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Make authenticated HTTP request
+
+        Transient failures are retried according to the retry policy when
+        the request is idempotent (GET, or sent with an idempotency key).
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API endpoint path
+            data: Request body data
+            params: URL query parameters
+            idempotency_key: Idempotency-Key header; makes the request retryable
+
+        Returns:
+            Response data as dict
+
+        Raises:
+            VeriflyError: On API errors
+        """
+        hooks = self.hooks
+        hedge = self.hedge if method == 'GET' else None
+
+        # Encode once: the signed bytes are the bytes sent
+        if hooks:
+            started = time.perf_counter()
+        body, payload = self._encode_body(data)
+        serialize = time.perf_counter() - started if hooks else None
+
+        idempotent = self._is_idempotent(method, idempotency_key)
+        endpoint = endpoint_class(method, path)
+        retry = self.retry_policy.start()
+        request_id = next_request_id()
+        breaker = self.circuit_breaker
+        avoid = None
+
+        while True:
+            base_url = self.endpoints.pick(avoid)
+            event = None
+            if hooks:
+                event = self._start_event(
+                    request_id, method, path, endpoint, retry.attempt, body, serialize
+                )
+            admitted = False
+            try:
+                # Breaker first: rejected requests must not spend rate budget
+                if breaker is not None:
+                    probe = breaker.allow(endpoint)
+                    admitted = True
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async(endpoint)
+                timeout = retry.attempt_timeout(self.timeout)
+                if hedge is None:
+                    result = await self._send_to(
+                        base_url, method, path, body, payload, params, idempotency_key,
+                        timeout, request_id, event
+                    )
+                else:
+                    result = await self._send_hedged(
+                        base_url, hedge, endpoint, method, path, body, payload, params,
+                        timeout, request_id, event
+                    )
+                if admitted:
+                    breaker.record(endpoint, None, probe)
+                if event is not None:
+                    self._end_event(event)
+                return result
+            except VeriflyError as e:
+                if admitted:
+                    breaker.record(endpoint, e, probe)
+                delay = retry.next_delay(e, idempotent)
+                if event is not None:
+                    self._end_event(event, e, delay)
+                if delay is None:
+                    self.logger.debug('[%d] %s %s failed: %r', request_id, method, path, e)
+                    raise
+                if CircuitBreaker.is_failure(e):
+                    # Fail over to another base URL at once; back off
+                    # only when retrying the same one
+                    avoid = base_url
+                    if self.endpoints.pick(avoid) != base_url:
+                        delay = 0.0
+                self.logger.info(
+                    '[%d] Retrying %s %s in %.2fs (attempt %d): %s',
+                    request_id, method, path, delay, retry.attempt, e
+                )
+                await asyncio.sleep(delay)
+            except BaseException as e:
+                # Cancellation or an unexpected error still ends the attempt
+                if admitted:
+                    breaker.record(endpoint, e, probe)
+                if event is not None:
+                    self._end_event(event, e)
+                raise
+
+    async def _send_to(
+        self,
+        base_url: str,
+        method: str,
+        path: str,
+        body: Optional[bytes],
+        payload: bytes,
+        params: Optional[Dict[str, Any]],
+        idempotency_key: Optional[str],
+        timeout: float,
+        request_id: int,
+        event: Optional[RequestEvent]
+    ) -> Dict[str, Any]:
+        """Send one attempt to a base URL and record the URL's health"""
+        try:
+            result = await self._send(
+                method, base_url + path, body, payload, params, idempotency_key,
+                timeout, request_id, event
+            )
+        except VeriflyError as e:
+            self.endpoints.record(base_url, e)
+            raise
+        self.endpoints.record(base_url)
+        return result
+
+    async def _send_hedged(
+        self,
+        base_url: str,
+        hedge: HedgePolicy,
+        endpoint: str,
+        method: str,
+        path: str,
+        body: Optional[bytes],
+        payload: bytes,
+        params: Optional[Dict[str, Any]],
+        timeout: float,
+        request_id: int,
+        event: Optional[RequestEvent]
+    ) -> Dict[str, Any]:
+        """
+        Send an attempt, hedging it with a second request if it is slow
+
+        The first successful response wins and the other request is
+        cancelled, which closes its connection.
+
+        Returns:
+            Response data as dict
+
+        Raises:
+            VeriflyError: The first error, if both requests fail
+        """
+        legs = {}  # type: Dict[asyncio.Future, Any]
+
+        def start(url: str) -> asyncio.Future:
+            leg = self._leg_event(event)
+            task = asyncio.ensure_future(self._send_to(
+                url, method, path, body, payload, params, None, timeout, request_id, leg
+            ))
+            legs[task] = (leg, time.perf_counter())
+            return task
+
+        try:
+            delay = hedge.delay(endpoint)
+            done, _ = await asyncio.wait([start(base_url)], timeout=delay)
+            if not done:
+                start(self.endpoints.pick(base_url))
+                self._hedged(event, request_id, method, path, delay)
+
+            error = None  # type: Optional[VeriflyError]
+            error_leg = None
+            pending = set(legs)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    leg, started = legs[task]
+                    exception = task.exception()
+                    if exception is None:
+                        hedge.observe(endpoint, time.perf_counter() - started)
+                        self._adopt(event, leg)
+                        return task.result()
+                    if not isinstance(exception, VeriflyError):
+                        raise exception
+                    if error is None:
+                        error, error_leg = exception, leg
+
+            self._adopt(event, error_leg)
+            raise error
+        finally:
+            for task in legs:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # Mark the exceptions of losing legs as retrieved
+                    task.exception()
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        payload: bytes,
+        params: Optional[Dict[str, Any]],
+        idempotency_key: Optional[str],
+        timeout: float,
+        request_id: int = 0,
+        event: Optional[RequestEvent] = None
+    ) -> Dict[str, Any]:
+        """
+        Perform a single signed HTTP attempt
+
+        Each attempt is signed with a fresh timestamp. When an event is
+        given, its status, sizes and phase timings are filled in.
+
+        Returns:
+            Response data as dict
+
+        Raises:
+            VeriflyError: On API or network errors
+        """
+        # Generate headers with signature
+        if event is not None:
+            signing = time.perf_counter()
+        headers = self._get_headers(payload, idempotency_key)
+        if event is not None:
+            event.timings['sign'] = time.perf_counter() - signing
+        headers.update(_SDK_HEADERS)
+
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self._log_request(request_id, method, url, headers, body, params)
+            started = time.perf_counter()
+
+        session = self._get_session()
+        if event is not None:
+            if self._owns_session:
+                # Traced sessions overwrite this when a new connection is opened
+                event.timings['connect'] = 0.0
+            sent = time.perf_counter()
+
+        try:
+            async with session.request(
+                method,
+                url,
+                data=body,
+                params=params,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(
+                    total=timeout,
+                    connect=self.connect_timeout,
+                    sock_read=self.read_timeout
+                ),
+                trace_request_ctx=event
+            ) as response:
+                if event is not None:
+                    event.timings['ttfb'] = time.perf_counter() - sent
+                content = await response.read()
+
+            if debug:
+                self._log_response(request_id, response.status, content, started)
+
+            if event is not None:
+                event.status = response.status
+                event.response_size = len(content)
+
+            # Check for errors
+            if response.status >= 400:
+                try:
+                    error_data = json.loads(content)
+                except ValueError:
+                    error_data = {}
+                raise self._error_for_status(response.status, error_data, response.headers)
+
+            if event is None:
+                return json.loads(content)
+            decoding = time.perf_counter()
+            result = json.loads(content)
+            event.timings['decode'] = time.perf_counter() - decoding
+            return result
+
+        except asyncio.TimeoutError:
+            raise RequestTimeoutError(f"Request timeout after {timeout:g}s")
+        except aiohttp.ClientError as e:
+            raise NetworkError(str(e))
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make GET request, joining an identical one in flight if coalescing"""
+        if self._flights is None:
+            return await self.request('GET', path, params=params)
+        return await self._flights.do(
+            self._flight_key('GET', path, params),
+            lambda: self.request('GET', path, params=params)
+        )
+
+    async def post(
+        self,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Make POST request"""
+        return await self.request('POST', path, data=data, idempotency_key=idempotency_key)
+
+    async def put(self, path: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make PUT request"""
+        return await self.request('PUT', path, data=data)
+
+    async def delete(self, path: str) -> Dict[str, Any]:
+        """Make DELETE request"""
+        return await self.request('DELETE', path)
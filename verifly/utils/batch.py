@@ -0,0 +1,156 @@
+"""
+Bulk session creation with partial-failure reporting
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..errors import VeriflyError, CircuitOpenError, InsufficientBalanceError
+from .concurrency import iter_bounded, aiter_bounded
+
+# (index, spec, session data or VeriflyError)
+BatchItem = Tuple[int, Dict[str, Any], Any]
+
+
+class BatchSummary:
+    """
+    Outcome counters for a bulk creation run
+
+    Attributes:
+        submitted: Specs that were sent to the API
+        succeeded: Sessions created
+        failed: Specs that raised an error
+        retryable: (index, spec, error) for transient failures worth resubmitting
+        balance_exhausted_at: Index of the first spec rejected with 402, if any
+    """
+
+    def __init__(self):
+        self.submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.retryable = []  # type: List[Tuple[int, Dict[str, Any], VeriflyError]]
+        self.balance_exhausted_at = None  # type: Optional[int]
+
+    @property
+    def balance_exhausted(self) -> bool:
+        """Whether the run was cut short by insufficient balance"""
+        return self.balance_exhausted_at is not None
+
+    def _record(
+        self,
+        index: int,
+        spec: Dict[str, Any],
+        error: Optional[VeriflyError],
+        is_retryable: Callable[[VeriflyError], bool]
+    ) -> None:
+        self.submitted += 1
+        if error is None:
+            self.succeeded += 1
+            return
+
+        self.failed += 1
+        if isinstance(error, InsufficientBalanceError):
+            if self.balance_exhausted_at is None or index < self.balance_exhausted_at:
+                self.balance_exhausted_at = index
+        elif isinstance(error, CircuitOpenError) or is_retryable(error):
+            # Specs rejected by an open circuit were never sent
+            self.retryable.append((index, spec, error))
+
+    def __repr__(self) -> str:
+        return (
+            f'BatchSummary(submitted={self.submitted}, succeeded={self.succeeded}, '
+            f'failed={self.failed}, retryable={len(self.retryable)}, '
+            f'balance_exhausted_at={self.balance_exhausted_at})'
+        )
+
+
+class _BaseCreateBatch:
+    def __init__(
+        self,
+        create: Callable[..., Any],
+        specs: Iterable[Dict[str, Any]],
+        concurrency: int,
+        ordered: bool,
+        is_retryable: Callable[[VeriflyError], bool]
+    ):
+        self._create = create
+        self._specs = specs
+        self._concurrency = concurrency
+        self._ordered = ordered
+        self._is_retryable = is_retryable
+        self._consumed = False
+        self.summary = BatchSummary()
+
+    def _start(self):
+        if self._consumed:
+            raise RuntimeError('A batch can only be iterated once')
+        self._consumed = True
+        return enumerate(self._specs)
+
+    def _should_stop(self) -> bool:
+        return self.summary.balance_exhausted
+
+    def _handle(self, entry: Tuple[int, Dict[str, Any]], result: Any, error: Any) -> BatchItem:
+        index, spec = entry
+        if error is not None and not isinstance(error, VeriflyError):
+            raise error
+        self.summary._record(index, spec, error, self._is_retryable)
+        return index, spec, error if error is not None else result
+
+
+class CreateBatch(_BaseCreateBatch):
+    """
+    Iterable bulk creation run
+
+    Iterate to receive ``(index, spec, session_or_error)`` as sessions are
+    created; ``summary`` is complete once iteration finishes. Once a spec
+    is rejected with ``InsufficientBalanceError`` no further specs are
+    started, in-flight ones are drained and iteration ends.
+    """
+
+    def __iter__(self):
+        outcomes = iter_bounded(
+            lambda entry: self._create(**entry[1]),
+            self._start(),
+            self._concurrency,
+            ordered=self._ordered,
+            should_stop=self._should_stop
+        )
+        for entry, result, error in outcomes:
+            yield self._handle(entry, result, error)
+
+    def run(self) -> BatchSummary:
+        """
+        Run the whole batch, discarding per-item results
+
+        Returns:
+            Final summary
+        """
+        for _ in self:
+            pass
+        return self.summary
+
+
+class AsyncCreateBatch(_BaseCreateBatch):
+    """Async iterable bulk creation run; see ``CreateBatch``"""
+
+    async def __aiter__(self):
+        outcomes = aiter_bounded(
+            lambda entry: self._create(**entry[1]),
+            self._start(),
+            self._concurrency,
+            ordered=self._ordered,
+            should_stop=self._should_stop
+        )
+        async for entry, result, error in outcomes:
+            yield self._handle(entry, result, error)
+
+    async def run(self) -> BatchSummary:
+        """
+        Run the whole batch, discarding per-item results
+
+        Returns:
+            Final summary
+        """
+        async for _ in self:
+            pass
+        return self.summary
@@ -0,0 +1,135 @@
+"""
+Bounded, thread-safe LRU cache with per-entry TTL
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    LRU cache whose entries also expire after a time-to-live
+
+    Memory is bounded by ``maxsize``: when full, the least recently used
+    entry is evicted. All operations are O(1) and guarded by one lock.
+
+    Example:
+        cache = TTLCache(maxsize=10000, ttl=60)
+        cache.set('key', 'value')
+        cache.get('key')
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 60.0):
+        """
+        Initialize cache
+
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Default time-to-live in seconds
+        """
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _live(self, key: Hashable, now: float) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[0] <= now:
+            del self._data[key]
+            return _MISSING
+        return entry[1]
+
+    def _store(self, key: Hashable, value: Any, ttl: Optional[float], now: float) -> None:
+        data = self._data
+        data[key] = (now + (self.ttl if ttl is None else ttl), value)
+        data.move_to_end(key)
+        while len(data) > self.maxsize:
+            data.popitem(last=False)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a live entry and mark it recently used
+
+        Args:
+            key: Cache key
+            default: Value returned when missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            value = self._live(key, time.monotonic())
+            if value is _MISSING:
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store an entry
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live in seconds (default: cache ttl)
+        """
+        with self._lock:
+            self._store(key, value, ttl, time.monotonic())
+
+    def add(self, key: Hashable, value: Any = True, ttl: Optional[float] = None) -> bool:
+        """
+        Store an entry only if no live entry exists (atomic check-and-set)
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live in seconds (default: cache ttl)
+
+        Returns:
+            True if the entry was added, False if the key was already present
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._live(key, now) is not _MISSING:
+                return False
+            self._store(key, value, ttl, now)
+            return True
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove an entry
+
+        Args:
+            key: Cache key
+            default: Value returned when missing or expired
+
+        Returns:
+            Removed value or default
+        """
+        with self._lock:
+            value = self._live(key, time.monotonic())
+            if value is _MISSING:
+                return default
+            del self._data[key]
+            return value
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._live(key, time.monotonic()) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
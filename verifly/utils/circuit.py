@@ -0,0 +1,279 @@
+"""
+Circuit breaker for API endpoint classes
+
+While the API is failing, requests are rejected immediately with
+``CircuitOpenError`` instead of each one waiting out its timeout.
+After ``reset_timeout`` a few probe requests are let through; the
+circuit closes again once they succeed.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..errors import (
+    CircuitOpenError, ClientRateLimitError, NetworkError, ServerError, VeriflyError
+)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# Number of buckets the sliding window is divided into
+_BUCKETS = 10
+
+StateListener = Callable[[str, str, str], None]
+
+logger = logging.getLogger(__name__)
+
+
+class _Circuit:
+    """State of one endpoint class"""
+
+    __slots__ = ('state', 'buckets', 'opened_at', 'probes', 'probe_successes')
+
+    def __init__(self):
+        self.state = CLOSED
+        # [bucket index, requests, failures] per slot
+        self.buckets = [[-1, 0, 0] for _ in range(_BUCKETS)]
+        self.opened_at = 0.0
+        self.probes = 0
+        self.probe_successes = 0
+
+    def reset_window(self) -> None:
+        for bucket in self.buckets:
+            bucket[0] = -1
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint-class circuit breaker
+
+    Endpoint classes are 'create', 'status', 'balance' and 'action', so
+    an outage of one endpoint does not block the others. Server errors
+    (5xx) and network failures, including timeouts, count as failures.
+    Other API errors such as 404 show the API is up and count as
+    successes.
+
+    Example:
+        breaker = CircuitBreaker(failure_rate=0.5, min_requests=20, window=30,
+                                 reset_timeout=15)
+        verifly = Verifly(api_key='...', secret_key='...', circuit_breaker=breaker)
+
+        try:
+            verifly.verification.get(session_id)
+        except CircuitOpenError as e:
+            ...  # Fail fast; e.retry_after says when probing resumes
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_requests: int = 20,
+        window: float = 30.0,
+        reset_timeout: float = 15.0,
+        half_open_probes: int = 1
+    ):
+        """
+        Initialize circuit breaker
+
+        Args:
+            failure_rate: Failure ratio within the window that opens the
+                circuit (default: 0.5)
+            min_requests: Requests needed in the window before the
+                failure rate is considered (default: 20)
+            window: Sliding window length in seconds (default: 30)
+            reset_timeout: Seconds the circuit stays open before probing
+                (default: 15)
+            half_open_probes: Concurrent probe requests allowed while half
+                open; this many successes close the circuit (default: 1)
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError('failure_rate must be in (0, 1]')
+        if min_requests < 1 or half_open_probes < 1:
+            raise ValueError('min_requests and half_open_probes must be at least 1')
+
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self._bucket_width = window / _BUCKETS
+        self._circuits = {}  # type: Dict[str, _Circuit]
+        self._lock = threading.Lock()
+        self._listeners = []  # type: List[StateListener]
+
+    def add_listener(self, listener: StateListener) -> None:
+        """
+        Call ``listener(endpoint, old_state, new_state)`` on every transition
+
+        Args:
+            listener: State change callback
+        """
+        self._listeners.append(listener)
+
+    def state(self, endpoint: str) -> str:
+        """
+        Current state of an endpoint class
+
+        Returns:
+            'closed', 'open' or 'half_open'
+        """
+        circuit = self._circuits.get(endpoint)
+        return circuit.state if circuit is not None else CLOSED
+
+    def states(self) -> Dict[str, str]:
+        """States of all endpoint classes seen so far"""
+        with self._lock:
+            return {endpoint: c.state for endpoint, c in self._circuits.items()}
+
+    @staticmethod
+    def is_failure(error: BaseException) -> Optional[bool]:
+        """
+        Classify an attempt's outcome
+
+        Returns:
+            True for server and network errors, False for other API
+            errors, None for anything else (e.g. cancellation or
+            client-side throttling), which is not counted
+        """
+        if isinstance(error, ClientRateLimitError):
+            return None
+        if isinstance(error, (ServerError, NetworkError)):
+            return True
+        if isinstance(error, VeriflyError):
+            return error.status_code is not None and error.status_code >= 500
+        return None
+
+    def allow(self, endpoint: str) -> bool:
+        """
+        Admit a request, or reject it while the circuit is open
+
+        Every admitted request must be followed by ``record()``.
+
+        Args:
+            endpoint: Endpoint class
+
+        Returns:
+            True if the request was admitted as a half-open probe
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half open with
+                all probe slots taken
+        """
+        transition = None
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                circuit = self._circuits[endpoint] = _Circuit()
+            if circuit.state == CLOSED:
+                return False
+
+            now = time.monotonic()
+            if circuit.state == OPEN:
+                remaining = circuit.opened_at + self.reset_timeout - now
+                if remaining > 0:
+                    raise self._rejection(endpoint, remaining)
+                transition = self._set_state(endpoint, circuit, HALF_OPEN)
+            if circuit.probes >= self.half_open_probes:
+                raise self._rejection(endpoint, None)
+            circuit.probes += 1
+        self._notify(transition)
+        return True
+
+    def record(
+        self,
+        endpoint: str,
+        error: Optional[BaseException] = None,
+        probe: bool = False
+    ) -> None:
+        """
+        Record the outcome of an admitted request
+
+        Args:
+            endpoint: Endpoint class
+            error: Exception raised by the attempt, or None on success
+            probe: Value returned by ``allow()`` for this request
+        """
+        failed = False if error is None else self.is_failure(error)
+        transition = None
+        with self._lock:
+            circuit = self._circuits[endpoint]
+            if circuit.state == CLOSED:
+                if failed is not None and not probe:
+                    transition = self._count(endpoint, circuit, failed)
+            elif circuit.state == HALF_OPEN and probe:
+                circuit.probes = max(0, circuit.probes - 1)
+                if failed:
+                    transition = self._set_state(endpoint, circuit, OPEN)
+                elif failed is not None:
+                    circuit.probe_successes += 1
+                    if circuit.probe_successes >= self.half_open_probes:
+                        transition = self._set_state(endpoint, circuit, CLOSED)
+        self._notify(transition)
+
+    def reset(self, endpoint: Optional[str] = None) -> None:
+        """
+        Close one circuit, or all of them
+
+        Args:
+            endpoint: Endpoint class (default: all)
+        """
+        transitions = []
+        with self._lock:
+            for name, circuit in self._circuits.items():
+                if endpoint is None or name == endpoint:
+                    if circuit.state != CLOSED:
+                        transitions.append(self._set_state(name, circuit, CLOSED))
+                    circuit.reset_window()
+        for transition in transitions:
+            self._notify(transition)
+
+    def _count(self, endpoint: str, circuit: _Circuit, failed: bool) -> Optional[Tuple[str, str, str]]:
+        index = int(time.monotonic() / self._bucket_width)
+        bucket = circuit.buckets[index % _BUCKETS]
+        if bucket[0] != index:
+            bucket[0], bucket[1], bucket[2] = index, 0, 0
+        bucket[1] += 1
+        if not failed:
+            return None
+        bucket[2] += 1
+
+        oldest = index - _BUCKETS
+        requests = failures = 0
+        for start, total, errors in circuit.buckets:
+            if start > oldest:
+                requests += total
+                failures += errors
+        if requests >= self.min_requests and failures >= self.failure_rate * requests:
+            return self._set_state(endpoint, circuit, OPEN)
+        return None
+
+    @staticmethod
+    def _set_state(endpoint: str, circuit: _Circuit, state: str) -> Tuple[str, str, str]:
+        old = circuit.state
+        circuit.state = state
+        circuit.probes = 0
+        circuit.probe_successes = 0
+        if state == OPEN:
+            circuit.opened_at = time.monotonic()
+        elif state == CLOSED:
+            circuit.reset_window()
+        return endpoint, old, state
+
+    @staticmethod
+    def _rejection(endpoint: str, remaining: Optional[float]) -> CircuitOpenError:
+        error = CircuitOpenError(f'Circuit open for {endpoint!r}', endpoint=endpoint)
+        error.retry_after = remaining
+        return error
+
+    def _notify(self, transition: Optional[Tuple[str, str, str]]) -> None:
+        if transition is None:
+            return
+        logger.info('Circuit for %r: %s -> %s', *transition)
+        for listener in self._listeners:
+            try:
+                listener(*transition)
+            except Exception:
+                logger.exception('Circuit listener %r failed', listener)
@@ -0,0 +1,146 @@
+"""
+Bounded concurrent execution helpers
+
+Both helpers keep at most ``concurrency`` calls in flight and pull new
+items from the input iterable only as slots free up, so arbitrarily long
+(or lazy) inputs are processed in constant memory.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Optional, Tuple
+
+# (item, result, error) - exactly one of result / error is meaningful
+Outcome = Tuple[Any, Any, Optional[BaseException]]
+
+
+def _outcome(item: Any, future: Any) -> Outcome:
+    if future.cancelled():
+        return item, None, asyncio.CancelledError()
+    error = future.exception()
+    if error is not None:
+        return item, None, error
+    return item, future.result(), None
+
+
+def iter_bounded(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    concurrency: int = 10,
+    ordered: bool = False,
+    should_stop: Optional[Callable[[], bool]] = None
+) -> Iterator[Outcome]:
+    """
+    Run ``fn`` over items on a thread pool with bounded concurrency
+
+    Args:
+        fn: Function called with each item
+        items: Input items, consumed lazily
+        concurrency: Maximum calls in flight
+        ordered: Yield in input order (True) or completion order (False)
+        should_stop: Checked before each submission; once it returns True
+            no further items are started and in-flight calls are drained
+
+    Yields:
+        (item, result, error) tuples; error is the exception raised by fn, if any
+    """
+    if concurrency < 1:
+        raise ValueError('concurrency must be at least 1')
+
+    source = iter(items)
+    pending = deque()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    exhausted = False
+
+    def fill():
+        nonlocal exhausted
+        while not exhausted and len(pending) < concurrency:
+            if should_stop is not None and should_stop():
+                exhausted = True
+                return
+            try:
+                item = next(source)
+            except StopIteration:
+                exhausted = True
+                return
+            pending.append((executor.submit(fn, item), item))
+
+    try:
+        fill()
+        while pending:
+            if ordered:
+                future, item = pending.popleft()
+                wait([future])
+                yield _outcome(item, future)
+            else:
+                done, _ = wait([future for future, _ in pending], return_when=FIRST_COMPLETED)
+                for entry in [entry for entry in pending if entry[0] in done]:
+                    pending.remove(entry)
+                    yield _outcome(entry[1], entry[0])
+            fill()
+    finally:
+        for future, _ in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiter_bounded(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    concurrency: int = 10,
+    ordered: bool = False,
+    should_stop: Optional[Callable[[], bool]] = None
+) -> AsyncIterator[Outcome]:
+    """
+    Run coroutine function ``fn`` over items with bounded concurrency
+
+    Args:
+        fn: Coroutine function called with each item
+        items: Input items, consumed lazily
+        concurrency: Maximum coroutines in flight
+        ordered: Yield in input order (True) or completion order (False)
+        should_stop: Checked before each submission; once it returns True
+            no further items are started and in-flight calls are drained
+
+    Yields:
+        (item, result, error) tuples; error is the exception raised by fn, if any
+    """
+    if concurrency < 1:
+        raise ValueError('concurrency must be at least 1')
+
+    source = iter(items)
+    pending = deque()
+    exhausted = False
+
+    def fill():
+        nonlocal exhausted
+        while not exhausted and len(pending) < concurrency:
+            if should_stop is not None and should_stop():
+                exhausted = True
+                return
+            try:
+                item = next(source)
+            except StopIteration:
+                exhausted = True
+                return
+            pending.append((asyncio.ensure_future(fn(item)), item))
+
+    try:
+        fill()
+        while pending:
+            if ordered:
+                task, item = pending.popleft()
+                await asyncio.wait([task])
+                yield _outcome(item, task)
+            else:
+                done, _ = await asyncio.wait(
+                    [task for task, _ in pending], return_when=asyncio.FIRST_COMPLETED
+                )
+                for entry in [entry for entry in pending if entry[0] in done]:
+                    pending.remove(entry)
+                    yield _outcome(entry[1], entry[0])
+            fill()
+    finally:
+        for task, _ in pending:
+            task.cancel()
@@ -0,0 +1,56 @@
+"""
+API endpoint classification
+"""
+
+CREATE = 'create'
+STATUS = 'status'
+BALANCE = 'balance'
+ACTION = 'action'
+
+# Path segments under /api/verify/ that are not session IDs
+_FIXED_SEGMENTS = frozenset(['create', 'balance', 'transactions'])
+
+
+def endpoint_class(method: str, path: str) -> str:
+    """
+    Classify a request into a coarse endpoint class
+
+    Args:
+        method: HTTP method
+        path: API endpoint path
+
+    Returns:
+        'create', 'balance' (balance and transaction history), 'status'
+        (session lookups) or 'action' (select-method, cancel, abort and
+        anything else)
+    """
+    if path == '/api/verify/create':
+        return CREATE
+    if path in ('/api/verify/balance', '/api/verify/transactions'):
+        return BALANCE
+    if method.upper() == 'GET':
+        return STATUS
+    return ACTION
+
+
+def endpoint_template(path: str) -> str:
+    """
+    Replace the session ID in a path with a placeholder
+
+    Keeps the number of distinct endpoint labels bounded, for example
+    in metrics and tracing span names.
+
+    Args:
+        path: API endpoint path
+
+    Returns:
+        Path template, e.g. '/api/verify/{session_id}/cancel'
+    """
+    parts = path.split('/')
+    if (
+        len(parts) > 3 and parts[1] == 'api' and parts[2] == 'verify'
+        and parts[3] not in _FIXED_SEGMENTS
+    ):
+        parts[3] = '{session_id}'
+        return '/'.join(parts)
+    return path
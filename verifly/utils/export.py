@@ -0,0 +1,106 @@
+"""
+Transaction export helpers
+
+Rows are written as they are read from the input, so exporting the
+output of ``iter_transactions()`` streams the full history to disk
+without building a list.
+"""
+
+import csv
+import json
+from typing import AsyncIterable, Iterable, Mapping, Sequence, TextIO
+
+# Default CSV columns, in order
+TRANSACTION_FIELDS = ('createdAt', 'type', 'amount', 'description', 'sessionId')
+
+
+def _csv_row(transaction: Mapping, fields: Sequence[str]) -> list:
+    return [transaction.get(field, '') for field in fields]
+
+
+def _json_line(transaction: Mapping) -> str:
+    return json.dumps(dict(transaction), separators=(',', ':'), ensure_ascii=False, default=str) + '\n'
+
+
+def write_transactions_csv(
+    transactions: Iterable[Mapping],
+    file: TextIO,
+    fields: Sequence[str] = TRANSACTION_FIELDS,
+    header: bool = True
+) -> int:
+    """
+    Write transactions as CSV
+
+    Args:
+        transactions: Transaction dicts or models, e.g. from ``iter_transactions()``
+        file: Text file opened with ``newline=''``
+        fields: API keys to write as columns (default: TRANSACTION_FIELDS)
+        header: Write a header row (default: True)
+
+    Returns:
+        Number of transactions written
+
+    Example:
+        with open('transactions.csv', 'w', newline='') as f:
+            write_transactions_csv(verifly.verification.iter_transactions(), f)
+    """
+    writer = csv.writer(file)
+    if header:
+        writer.writerow(fields)
+    count = 0
+    for transaction in transactions:
+        writer.writerow(_csv_row(transaction, fields))
+        count += 1
+    return count
+
+
+def write_transactions_ndjson(transactions: Iterable[Mapping], file: TextIO) -> int:
+    """
+    Write transactions as newline-delimited JSON, one object per line
+
+    Args:
+        transactions: Transaction dicts or models, e.g. from ``iter_transactions()``
+        file: Text file
+
+    Returns:
+        Number of transactions written
+    """
+    count = 0
+    for transaction in transactions:
+        file.write(_json_line(transaction))
+        count += 1
+    return count
+
+
+async def awrite_transactions_csv(
+    transactions: AsyncIterable[Mapping],
+    file: TextIO,
+    fields: Sequence[str] = TRANSACTION_FIELDS,
+    header: bool = True
+) -> int:
+    """
+    Write transactions from an async iterator as CSV
+
+    Same as ``write_transactions_csv()`` for ``AsyncVerification.iter_transactions()``.
+    """
+    writer = csv.writer(file)
+    if header:
+        writer.writerow(fields)
+    count = 0
+    async for transaction in transactions:
+        writer.writerow(_csv_row(transaction, fields))
+        count += 1
+    return count
+
+
+async def awrite_transactions_ndjson(transactions: AsyncIterable[Mapping], file: TextIO) -> int:
+    """
+    Write transactions from an async iterator as newline-delimited JSON
+
+    Same as ``write_transactions_ndjson()`` for ``AsyncVerification.iter_transactions()``.
+    """
+    count = 0
+    async for transaction in transactions:
+        file.write(_json_line(transaction))
+        count += 1
+    return count
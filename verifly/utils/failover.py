@@ -0,0 +1,214 @@
+"""
+Multi-endpoint failover and request hedging
+
+``EndpointPool`` tracks the health of each configured base URL and
+steers requests away from ones that keep failing. ``HedgePolicy``
+decides when an idempotent GET that has not answered yet is worth a
+second, parallel request.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+from .circuit import CircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+
+class EndpointPool:
+    """
+    Ordered base URLs with consecutive-failure health tracking
+
+    Requests go to the first healthy URL in order of preference. A URL
+    that fails ``failure_threshold`` times in a row (server errors or
+    network failures) is skipped for ``cooldown`` seconds. When every
+    URL is down, the one due to recover first is used.
+
+    Example:
+        verifly = Verifly(
+            api_key='...',
+            secret_key='...',
+            base_urls=EndpointPool(
+                ['https://eu.verifly.net', 'https://www.verifly.net'],
+                failure_threshold=3,
+                cooldown=30
+            )
+        )
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        failure_threshold: int = 3,
+        cooldown: float = 30.0
+    ):
+        """
+        Initialize pool
+
+        Args:
+            urls: Base URLs in order of preference
+            failure_threshold: Consecutive failures that mark a URL down (default: 3)
+            cooldown: Seconds a URL stays down (default: 30)
+        """
+        if not urls:
+            raise ValueError('At least one base URL is required')
+        if failure_threshold < 1:
+            raise ValueError('failure_threshold must be at least 1')
+
+        self.urls = tuple(url.rstrip('/') for url in urls)
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures = {url: 0 for url in self.urls}  # type: Dict[str, int]
+        self._down_until = {url: 0.0 for url in self.urls}  # type: Dict[str, float]
+        self._lock = threading.Lock()
+
+    def pick(self, avoid: Optional[str] = None) -> str:
+        """
+        Choose the base URL for a request
+
+        Args:
+            avoid: URL to pass over if another healthy one exists, e.g.
+                the one the previous attempt failed on
+
+        Returns:
+            Base URL without a trailing slash
+        """
+        urls = self.urls
+        if len(urls) == 1:
+            return urls[0]
+
+        now = time.monotonic()
+        down_until = self._down_until
+        for url in urls:
+            if url != avoid and down_until[url] <= now:
+                return url
+        if avoid is not None and down_until.get(avoid, 0.0) <= now:
+            return avoid
+        return min(urls, key=down_until.__getitem__)
+
+    def record(self, url: str, error: Optional[BaseException] = None) -> None:
+        """
+        Record the outcome of a request to ``url``
+
+        Args:
+            url: Base URL the request was sent to
+            error: Exception raised, or None on success
+        """
+        failed = error is not None and CircuitBreaker.is_failure(error)
+        if not failed:
+            if self._failures.get(url):
+                with self._lock:
+                    self._failures[url] = 0
+            return
+
+        with self._lock:
+            failures = self._failures[url] = self._failures.get(url, 0) + 1
+            if failures < self.failure_threshold or len(self.urls) == 1:
+                return
+            self._failures[url] = 0
+            self._down_until[url] = time.monotonic() + self.cooldown
+        logger.warning(
+            'Base URL %s marked down for %gs after %d failures: %s',
+            url, self.cooldown, failures, error
+        )
+
+    def healthy(self) -> Dict[str, bool]:
+        """Whether each URL is currently in service"""
+        now = time.monotonic()
+        return {url: self._down_until[url] <= now for url in self.urls}
+
+
+class HedgePolicy:
+    """
+    When to hedge idempotent GETs
+
+    If a GET has not answered after the observed ``percentile`` latency
+    of its endpoint class, a second request is sent (to another healthy
+    base URL when there is one) and the first response wins. Around
+    ``1 - percentile`` of requests are hedged, in exchange for cutting
+    the latency tail.
+
+    Example:
+        verifly = Verifly(
+            api_key='...',
+            secret_key='...',
+            base_urls=['https://eu.verifly.net', 'https://www.verifly.net'],
+            hedge=HedgePolicy(percentile=0.95, min_delay=0.02)
+        )
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        initial_delay: float = 0.25,
+        min_delay: float = 0.01,
+        max_delay: float = 2.0,
+        window: int = 256,
+        min_samples: int = 20
+    ):
+        """
+        Initialize hedge policy
+
+        Args:
+            percentile: Latency percentile used as the hedge delay (default: 0.95)
+            initial_delay: Delay in seconds until ``min_samples`` latencies
+                have been observed (default: 0.25)
+            min_delay: Lower bound on the delay in seconds (default: 0.01)
+            max_delay: Upper bound on the delay in seconds (default: 2.0)
+            window: Recent latencies kept per endpoint class (default: 256)
+            min_samples: Samples required before the percentile is used (default: 20)
+        """
+        if not 0 < percentile < 1:
+            raise ValueError('percentile must be between 0 and 1')
+        if window < min_samples:
+            raise ValueError('window must be at least min_samples')
+
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.window = window
+        self.min_samples = min_samples
+        self._samples = {}  # type: Dict[str, List[float]]
+        self._positions = {}  # type: Dict[str, int]
+        self._delays = {}  # type: Dict[str, float]
+        # The percentile is recomputed after this many new samples
+        self._refresh_every = max(1, window // 16)
+        self._lock = threading.Lock()
+
+    def delay(self, endpoint: str) -> float:
+        """
+        Seconds to wait before hedging a request
+
+        Args:
+            endpoint: Endpoint class
+        """
+        return self._delays.get(endpoint, self.initial_delay)
+
+    def observe(self, endpoint: str, latency: float) -> None:
+        """
+        Record the latency of a completed request
+
+        Args:
+            endpoint: Endpoint class
+            latency: Seconds from sending to the response
+        """
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = []
+                self._positions[endpoint] = 0
+
+            position = self._positions[endpoint]
+            if len(samples) < self.window:
+                samples.append(latency)
+            else:
+                samples[position % self.window] = latency
+            position = self._positions[endpoint] = position + 1
+
+            if len(samples) >= self.min_samples and position % self._refresh_every == 0:
+                ordered = sorted(samples)
+                value = ordered[min(len(ordered) - 1, int(len(ordered) * self.percentile))]
+                self._delays[endpoint] = min(self.max_delay, max(self.min_delay, value))
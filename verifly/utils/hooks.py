@@ -0,0 +1,158 @@
+"""
+Request lifecycle hooks
+
+Subclass ``RequestHooks`` and pass instances with ``hooks=[...]`` to
+observe every attempt the client makes and every webhook it verifies:
+latency histograms, tracing spans or audit logs can be wired in
+without patching the transport.
+When no hooks are registered no events are built.
+"""
+
+import logging
+import time
+from typing import Any, Dict, Optional, Sequence
+
+from .endpoints import endpoint_template
+
+logger = logging.getLogger('verifly.hooks')
+
+
+class RequestEvent:
+    """
+    One HTTP attempt
+
+    Attributes:
+        request_id: ID shared by all attempts of a logical request
+        method: HTTP method
+        path: Request path
+        endpoint: Path template, e.g. '/api/verify/{session_id}'
+        endpoint_class: 'create', 'status', 'balance' or 'action'
+        attempt: Attempt number, starting at 1
+        status: HTTP status, or None if no response was received
+        error: VeriflyError raised by the attempt, if any
+        retry_delay: Seconds before the next attempt (``on_retry`` only)
+        request_size: Request body size in bytes
+        response_size: Response body size in bytes, or None
+        timings: Seconds spent in each phase, keyed by 'serialize',
+            'sign', 'connect', 'ttfb', 'decode' and 'total'. 'connect'
+            covers DNS, TCP and TLS setup; it is only measured by the
+            async client and is 0.0 for reused connections. Phases that
+            were not reached are None.
+        started: ``time.perf_counter()`` when the attempt began
+        hedged: Whether a hedge request was sent for this attempt; status
+            and timings then describe the request that decided it
+    """
+
+    __slots__ = (
+        'request_id', 'method', 'path', 'endpoint', 'endpoint_class', 'attempt',
+        'status', 'error', 'retry_delay', 'request_size', 'response_size', 'timings',
+        'started', 'hedged'
+    )
+
+    def __init__(
+        self,
+        request_id: int,
+        method: str,
+        path: str,
+        endpoint_class: str,
+        attempt: int,
+        request_size: int,
+        serialize: float
+    ):
+        self.request_id = request_id
+        self.method = method
+        self.path = path
+        self.endpoint = endpoint_template(path)
+        self.endpoint_class = endpoint_class
+        self.attempt = attempt
+        self.status = None  # type: Optional[int]
+        self.error = None  # type: Optional[Exception]
+        self.retry_delay = None  # type: Optional[float]
+        self.request_size = request_size
+        self.response_size = None  # type: Optional[int]
+        self.timings = {
+            'serialize': serialize,
+            'sign': None,
+            'connect': None,
+            'ttfb': None,
+            'decode': None,
+            'total': None,
+        }  # type: Dict[str, Optional[float]]
+        self.started = time.perf_counter()
+        self.hedged = False
+
+    def __repr__(self) -> str:
+        return (
+            f'<RequestEvent #{self.request_id} {self.method} {self.endpoint} '
+            f'attempt={self.attempt} status={self.status}>'
+        )
+
+
+class RequestHooks:
+    """
+    Base class for lifecycle hooks; override the methods you need
+
+    Hooks run synchronously on the request path (on the event loop for
+    the async client), so keep them fast. Exceptions raised by a hook
+    are logged and never affect the request.
+
+    Example:
+        class LatencyHooks(RequestHooks):
+            def on_request_end(self, event):
+                histogram.labels(event.endpoint, event.status).observe(
+                    event.timings['total']
+                )
+
+        verifly = Verifly(api_key, secret_key, hooks=[LatencyHooks()])
+    """
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """Called before each attempt is sent"""
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        """Called after each attempt, successful or not (see ``event.error``)"""
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """Called when a failed attempt will be retried after ``event.retry_delay``"""
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Called when a request fails for good, after its final attempt"""
+
+    def on_hedge(self, event: RequestEvent) -> None:
+        """Called when a slow GET attempt is hedged with a second request"""
+
+    def on_circuit_state_change(self, endpoint: str, old: str, new: str) -> None:
+        """
+        Called when a circuit breaker changes state
+
+        Args:
+            endpoint: Endpoint class ('create', 'status', 'balance' or 'action')
+            old: Previous state ('closed', 'open' or 'half_open')
+            new: New state
+        """
+
+    def on_webhook_verify(self, result: str, elapsed: float) -> None:
+        """
+        Called after ``construct_event()`` or ``construct_event_from_bytes()``
+
+        Args:
+            result: 'valid', 'invalid' (bad signature), 'stale' (timestamp
+                outside tolerance) or 'duplicate'
+            elapsed: Seconds spent verifying
+        """
+
+
+def emit(hooks: Sequence[RequestHooks], name: str, *args: Any) -> None:
+    """
+    Call a hook method on every registered hook
+
+    Args:
+        hooks: Registered hooks
+        name: Hook method name, e.g. 'on_request_end'
+        *args: Arguments for the hook method
+    """
+    for hook in hooks:
+        try:
+            getattr(hook, name)(*args)
+        except Exception:
+            logger.exception('Hook %r failed in %s', hook, name)
@@ -0,0 +1,153 @@
+"""
+Client-side idempotency stores for session creation
+
+A store remembers the result of each ``create()`` call made with an
+idempotency key. Repeating the call with the same key returns the
+remembered session without contacting the API.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from ..errors import ValidationError
+from .cache import TTLCache
+
+
+class IdempotencyStore:
+    """
+    Interface for remembering ``create()`` results by idempotency key
+
+    Records are small JSON-serializable dicts, so a shared backend (for
+    example Redis ``SET key value NX EX ttl``) can implement ``get`` and
+    ``set`` to deduplicate across processes or hosts. The async client
+    calls the store directly, so keep both methods fast.
+    """
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a record
+
+        Args:
+            key: Idempotency key
+
+        Returns:
+            The record stored for the key, or None
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, record: Dict[str, Any]) -> None:
+        """
+        Store a record
+
+        Args:
+            key: Idempotency key
+            record: JSON-serializable record
+        """
+        raise NotImplementedError
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    """
+    Bounded in-process idempotency store
+
+    Remembers up to ``max_entries`` keys for ``ttl`` seconds, evicting
+    the least recently used first.
+
+    Example:
+        verifly = Verifly(
+            api_key='...',
+            secret_key='...',
+            idempotency_store=InMemoryIdempotencyStore(max_entries=10000, ttl=3600)
+        )
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 86400.0):
+        """
+        Initialize store
+
+        Args:
+            max_entries: Maximum keys remembered (default: 10000)
+            ttl: Seconds each key is remembered (default: 86400)
+        """
+        self._cache = TTLCache(maxsize=max_entries, ttl=ttl)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._cache.get(key)
+
+    def set(self, key: str, record: Dict[str, Any]) -> None:
+        self._cache.set(key, record)
+
+    def clear(self) -> None:
+        """Forget all keys"""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+def fingerprint(payload: Dict[str, Any]) -> str:
+    """
+    Hash a request body so key reuse with different parameters is detected
+
+    Args:
+        payload: Request body
+
+    Returns:
+        Hex SHA-256 of the canonical JSON encoding
+    """
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def lookup(store: IdempotencyStore, key: str, digest: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the stored result for a key, if any
+
+    Args:
+        store: Idempotency store
+        key: Idempotency key
+        digest: ``fingerprint()`` of the current request body
+
+    Returns:
+        The remembered result, or None if the key is new
+
+    Raises:
+        ValidationError: If the key was used with different parameters
+    """
+    record = store.get(key)
+    if record is None:
+        return None
+    check_fingerprint(key, record.get('fingerprint'), digest)
+    return record.get('result')
+
+
+def check_fingerprint(key: str, expected: Optional[str], digest: str) -> None:
+    """
+    Reject a request whose body differs from an earlier one with the same key
+
+    Args:
+        key: Idempotency key
+        expected: ``fingerprint()`` of the earlier request body
+        digest: ``fingerprint()`` of the current request body
+
+    Raises:
+        ValidationError: If the fingerprints differ
+    """
+    if expected != digest:
+        raise ValidationError(
+            f'Idempotency key {key!r} was already used with different parameters'
+        )
+
+
+def remember(store: IdempotencyStore, key: str, digest: str, result: Dict[str, Any]) -> None:
+    """
+    Store the result of a successful call
+
+    Args:
+        store: Idempotency store
+        key: Idempotency key
+        digest: ``fingerprint()`` of the request body
+        result: Session data returned by the API
+    """
+    store.set(key, {'fingerprint': digest, 'result': result})
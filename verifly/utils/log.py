@@ -0,0 +1,104 @@
+"""
+Logging helpers
+
+The SDK logs under the ``verifly`` logger. Messages use lazy
+%-formatting and the argument wrappers below defer decoding and
+truncation, so nothing is formatted unless a record is emitted.
+"""
+
+import itertools
+import logging
+import threading
+from typing import Any, Optional
+
+logger = logging.getLogger('verifly')
+
+# Bytes of a request or response body included in a log record
+MAX_BODY_LOG = 256
+
+_DEBUG_FORMAT = '%(asctime)s %(name)s %(levelname)s %(message)s'
+
+# Records of clients created with ``debug=True``. This child logger is
+# always at DEBUG, so debug output never changes the level of the
+# ``verifly`` logger the application may have configured.
+debug_logger = logger.getChild('debug')
+debug_logger.setLevel(logging.DEBUG)
+
+_debug_handler = None  # type: Optional[logging.Handler]
+_debug_clients = 0
+_debug_lock = threading.Lock()
+
+# Per-process request counter used to correlate log lines
+_request_ids = itertools.count(1)
+
+
+def next_request_id() -> int:
+    """Return a new request ID for log correlation"""
+    return next(_request_ids)
+
+
+def enable_debug_logging(enabled: bool = True) -> None:
+    """
+    Count a client in or out of debug mode
+
+    Used by ``debug=True``. While at least one client is in debug mode a
+    stderr handler is attached to ``debug_logger`` and its records stop
+    propagating, so request and response dumps reach only stderr and not
+    the application's handlers. The level and handlers of the ``verifly``
+    logger are never changed; applications with their own logging setup
+    configure it directly.
+
+    Args:
+        enabled: Count a client in (True) or out (False)
+    """
+    global _debug_handler, _debug_clients
+
+    with _debug_lock:
+        if enabled:
+            _debug_clients += 1
+            if _debug_handler is None:
+                _debug_handler = logging.StreamHandler()
+                _debug_handler.setFormatter(logging.Formatter(_DEBUG_FORMAT))
+                debug_logger.addHandler(_debug_handler)
+                debug_logger.propagate = False
+        elif _debug_clients > 0:
+            _debug_clients -= 1
+            if _debug_clients == 0 and _debug_handler is not None:
+                debug_logger.removeHandler(_debug_handler)
+                debug_logger.propagate = True
+                _debug_handler = None
+
+
+class Redacted:
+    """Log argument showing only the first characters of a secret"""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: Optional[str]):
+        self.value = value
+
+    def __str__(self) -> str:
+        if not self.value:
+            return '-'
+        return self.value[:4] + '***'
+
+
+class Truncated:
+    """Log argument rendering at most ``limit`` bytes of a body"""
+
+    __slots__ = ('body', 'limit')
+
+    def __init__(self, body: Any, limit: int = MAX_BODY_LOG):
+        self.body = body
+        self.limit = limit
+
+    def __str__(self) -> str:
+        body = self.body
+        if body is None:
+            return '-'
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        text = bytes(body[:self.limit]).decode('utf-8', 'replace')
+        if len(body) > self.limit:
+            return f'{text}... ({len(body)} bytes)'
+        return text
@@ -0,0 +1,96 @@
+"""
+Cursor pagination helpers
+
+Pages are fetched on demand and items are yielded one at a time. With
+prefetching, the request for the next page runs while the caller works
+through the current one, so at most two pages are held in memory
+regardless of the total number of items.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional, Tuple
+
+# (items, next cursor or None on the last page)
+Page = Tuple[List[Any], Optional[str]]
+
+
+def iter_pages(
+    fetch: Callable[[Optional[str]], Page],
+    prefetch: bool = True
+) -> Iterator[Any]:
+    """
+    Iterate over the items of a cursor-paginated listing
+
+    Args:
+        fetch: Called with the cursor (None for the first page) and
+            returning (items, next_cursor)
+        prefetch: Fetch the next page on a background thread while the
+            current one is consumed (default: True)
+
+    Yields:
+        Items in page order
+    """
+    executor = ThreadPoolExecutor(1, 'verifly-pages') if prefetch else None
+    future = None
+    try:
+        items, cursor = fetch(None)
+        while True:
+            if executor is not None and cursor is not None:
+                future = executor.submit(fetch, cursor)
+            yield from items
+            if cursor is None:
+                return
+            items = None
+            if future is not None:
+                items, cursor = future.result()
+                future = None
+            else:
+                items, cursor = fetch(cursor)
+    finally:
+        if future is not None:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def aiter_pages(
+    fetch: Callable[[Optional[str]], Awaitable[Page]],
+    prefetch: bool = True
+) -> AsyncIterator[Any]:
+    """
+    Iterate over the items of a cursor-paginated listing asynchronously
+
+    Args:
+        fetch: Coroutine function called with the cursor (None for the
+            first page) and returning (items, next_cursor)
+        prefetch: Fetch the next page in a task while the current one is
+            consumed (default: True)
+
+    Yields:
+        Items in page order
+    """
+    task = None
+    try:
+        items, cursor = await fetch(None)
+        while True:
+            if prefetch and cursor is not None:
+                task = asyncio.ensure_future(fetch(cursor))
+            for item in items:
+                yield item
+            if cursor is None:
+                return
+            items = None
+            if task is not None:
+                items, cursor = await task
+                task = None
+            else:
+                items, cursor = await fetch(cursor)
+    finally:
+        if task is not None:
+            if task.done():
+                if not task.cancelled():
+                    # Retrieve the error of a page that was never consumed
+                    task.exception()
+            else:
+                task.cancel()
@@ -0,0 +1,413 @@
+"""
+Shared status polling scheduler for ``verification.wait``
+
+All sessions being waited on by one client are polled from a single
+scheduler. Waiters on the same session share one polling schedule, and
+each session's interval adapts to activity: it resets to
+``min_interval`` whenever the status or selected method changes and
+backs off geometrically while nothing happens. Polling stops at
+``expiresAt``.
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from ..errors import (
+    CircuitOpenError, NetworkError, RateLimitError, ServerError, WaitTimeoutError
+)
+from .timeutil import to_epoch
+
+# Statuses after which a session can no longer change
+TERMINAL_STATUSES = frozenset(['verified', 'failed', 'expired', 'aborted'])
+
+# Errors that do not end a wait; polling continues with backoff
+TRANSIENT_ERRORS = (NetworkError, ServerError, RateLimitError, CircuitOpenError)
+
+
+class _Watch:
+    """Polling state for one session, shared by all of its waiters"""
+
+    __slots__ = (
+        'session_id', 'waiters', 'interval', 'status', 'method',
+        'expires_at', 'result', 'error', 'in_flight'
+    )
+
+    def __init__(self, session_id: str, interval: float):
+        self.session_id = session_id
+        self.waiters = []  # type: List[Any]
+        self.interval = interval
+        self.status = None
+        self.method = None
+        self.expires_at = None  # type: Optional[float]
+        self.result = None
+        self.error = None  # type: Optional[BaseException]
+        self.in_flight = False
+
+
+class _PollingPolicy:
+    """Adaptive interval logic shared by the sync and async schedulers"""
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Any],
+        concurrency: int,
+        min_interval: float,
+        max_interval: float,
+        backoff: float,
+        expiry_grace: float
+    ):
+        self._fetch = fetch
+        self.concurrency = concurrency
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.expiry_grace = expiry_grace
+        self._watches = {}  # type: Dict[str, _Watch]
+        self._heap = []  # type: List[Any]
+        self._seq = itertools.count()
+
+    def _push(self, watch: _Watch, delay: float) -> None:
+        heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), watch))
+
+    def _pop_due(self) -> List[_Watch]:
+        now = time.monotonic()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            watch = heapq.heappop(self._heap)[2]
+            # Skip entries whose waiters have all given up
+            if self._watches.get(watch.session_id) is watch and not watch.in_flight:
+                watch.in_flight = True
+                due.append(watch)
+        return due
+
+    def _next_due_in(self) -> Optional[float]:
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - time.monotonic())
+
+    def _complete(self, watch: _Watch, result: Any, error: Optional[BaseException]) -> Optional[float]:
+        """
+        Update a watch with a poll outcome
+
+        Errors other than transient API errors, including unexpected
+        ones such as a malformed response, end the wait and are raised
+        to every waiter.
+
+        Returns:
+            Delay before the next poll, or None if the wait is over
+        """
+        try:
+            return self._advance(watch, result, error)
+        except Exception as e:
+            watch.error = e
+            return None
+
+    def _advance(self, watch: _Watch, result: Any, error: Optional[BaseException]) -> Optional[float]:
+        if error is not None:
+            if not isinstance(error, TRANSIENT_ERRORS):
+                watch.error = error
+                return None
+            watch.interval = min(self.max_interval, watch.interval * self.backoff)
+            return max(watch.interval, error.retry_after or 0.0)
+
+        watch.result = result
+        status = result.get('status')
+        method = result.get('method')
+        if status in TERMINAL_STATUSES:
+            return None
+
+        if watch.expires_at is None:
+            watch.expires_at = to_epoch(result.get('expiresAt'))
+
+        now = time.time()
+        if watch.expires_at is not None and now >= watch.expires_at + self.expiry_grace:
+            return None
+
+        if status != watch.status or method != watch.method:
+            watch.interval = self.min_interval
+        else:
+            watch.interval = min(self.max_interval, watch.interval * self.backoff)
+        watch.status = status
+        watch.method = method
+
+        delay = watch.interval
+        if watch.expires_at is not None:
+            delay = min(delay, max(0.0, watch.expires_at - now) + self.min_interval)
+        return delay
+
+    def _register(self, session_id: str, waiter: Any) -> _Watch:
+        watch = self._watches.get(session_id)
+        if watch is None:
+            watch = self._watches[session_id] = _Watch(session_id, self.min_interval)
+            self._push(watch, 0.0)
+        watch.waiters.append(waiter)
+        return watch
+
+    def _unregister(self, watch: _Watch, waiter: Any) -> None:
+        if waiter in watch.waiters:
+            watch.waiters.remove(waiter)
+        if not watch.waiters and self._watches.get(watch.session_id) is watch:
+            del self._watches[watch.session_id]
+
+
+class _Waiter:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class StatusPoller(_PollingPolicy):
+    """
+    Thread-based shared polling scheduler
+
+    One daemon thread keeps the schedule; polls run on a bounded thread
+    pool, so thousands of concurrent waiters cost at most ``concurrency``
+    requests in flight.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Any],
+        concurrency: int = 10,
+        min_interval: float = 1.0,
+        max_interval: float = 15.0,
+        backoff: float = 1.5,
+        expiry_grace: float = 5.0
+    ):
+        """
+        Initialize poller
+
+        Args:
+            fetch: Function returning session status data for a session ID
+            concurrency: Maximum polls in flight (default: 10)
+            min_interval: Interval after a status change in seconds (default: 1.0)
+            max_interval: Longest interval between polls in seconds (default: 15.0)
+            backoff: Interval growth factor while nothing changes (default: 1.5)
+            expiry_grace: Seconds past expiresAt before giving up (default: 5.0)
+        """
+        super().__init__(fetch, concurrency, min_interval, max_interval, backoff, expiry_grace)
+        self._cond = threading.Condition()
+        self._thread = None  # type: Optional[threading.Thread]
+        self._executor = None  # type: Optional[ThreadPoolExecutor]
+        self._closed = False
+
+    def _ensure_started(self) -> None:
+        if self._closed:
+            raise RuntimeError('Poller is closed')
+        if self._thread is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.concurrency)
+            self._thread = threading.Thread(
+                target=self._run, name='verifly-poller', daemon=True
+            )
+            self._thread.start()
+
+    def wait(self, session_id: str, timeout: Optional[float] = None) -> Any:
+        """
+        Block until a session reaches a terminal status or expires
+
+        Args:
+            session_id: Session ID
+            timeout: Maximum seconds to wait (default: until expiry)
+
+        Returns:
+            Last observed session status data
+
+        Raises:
+            WaitTimeoutError: If the timeout elapses first
+            VeriflyError: If the session cannot be polled (e.g. NotFoundError)
+            Exception: Any other error raised while polling
+        """
+        waiter = _Waiter()
+        with self._cond:
+            self._ensure_started()
+            watch = self._register(session_id, waiter)
+            self._cond.notify()
+
+        if not waiter.event.wait(timeout):
+            with self._cond:
+                if not waiter.event.is_set():
+                    self._unregister(watch, waiter)
+                    raise WaitTimeoutError(
+                        f'Session {session_id} did not complete within {timeout}s'
+                    )
+
+        if waiter.error is not None:
+            raise waiter.error
+        return waiter.result
+
+    def close(self) -> None:
+        """Stop the scheduler thread; pending waits are left to time out"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                due = self._pop_due()
+                while not due and not self._closed:
+                    self._cond.wait(self._next_due_in())
+                    due = self._pop_due()
+                if self._closed:
+                    return
+            for watch in due:
+                try:
+                    self._executor.submit(self._poll, watch)
+                except RuntimeError:
+                    # close() shut the executor down after the check above
+                    return
+
+    def _poll(self, watch: _Watch) -> None:
+        result, error = None, None
+        try:
+            result = self._fetch(watch.session_id)
+        except Exception as e:
+            error = e
+
+        with self._cond:
+            watch.in_flight = False
+            if self._watches.get(watch.session_id) is not watch:
+                return
+
+            delay = self._complete(watch, result, error)
+            if delay is None:
+                del self._watches[watch.session_id]
+                for waiter in watch.waiters:
+                    waiter.result = watch.result
+                    waiter.error = watch.error
+                    waiter.event.set()
+            else:
+                self._push(watch, delay)
+                self._cond.notify()
+
+
+class AsyncStatusPoller(_PollingPolicy):
+    """
+    asyncio shared polling scheduler
+
+    One scheduler task per event loop; polls run as tasks bounded by a
+    semaphore of size ``concurrency``.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Any],
+        concurrency: int = 50,
+        min_interval: float = 1.0,
+        max_interval: float = 15.0,
+        backoff: float = 1.5,
+        expiry_grace: float = 5.0
+    ):
+        """
+        Initialize poller
+
+        Args:
+            fetch: Coroutine function returning session status data
+            concurrency: Maximum polls in flight (default: 50)
+            min_interval: Interval after a status change in seconds (default: 1.0)
+            max_interval: Longest interval between polls in seconds (default: 15.0)
+            backoff: Interval growth factor while nothing changes (default: 1.5)
+            expiry_grace: Seconds past expiresAt before giving up (default: 5.0)
+        """
+        super().__init__(fetch, concurrency, min_interval, max_interval, backoff, expiry_grace)
+        self._task = None
+        self._wakeup = None
+        self._semaphore = None
+        self._polls = set()  # type: Set[asyncio.Future]
+
+    def _ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._task = asyncio.ensure_future(self._run())
+
+    async def wait(self, session_id: str, timeout: Optional[float] = None) -> Any:
+        """
+        Wait until a session reaches a terminal status or expires
+
+        Args:
+            session_id: Session ID
+            timeout: Maximum seconds to wait (default: until expiry)
+
+        Returns:
+            Last observed session status data
+
+        Raises:
+            WaitTimeoutError: If the timeout elapses first
+            VeriflyError: If the session cannot be polled (e.g. NotFoundError)
+            Exception: Any other error raised while polling
+        """
+        self._ensure_started()
+        future = asyncio.get_event_loop().create_future()
+        watch = self._register(session_id, future)
+        self._wakeup.set()
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise WaitTimeoutError(
+                f'Session {session_id} did not complete within {timeout}s'
+            )
+        finally:
+            self._unregister(watch, future)
+
+    async def close(self) -> None:
+        """Cancel the scheduler task and any polls in flight"""
+        tasks = list(self._polls)
+        if self._task is not None and not self._task.done():
+            tasks.append(self._task)
+        for task in tasks:
+            task.cancel()
+        # Wait for cancellation so no poll touches a closed session
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._polls.clear()
+
+    async def _run(self) -> None:
+        while True:
+            for watch in self._pop_due():
+                task = asyncio.ensure_future(self._poll(watch))
+                self._polls.add(task)
+                task.add_done_callback(self._polls.discard)
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._next_due_in())
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll(self, watch: _Watch) -> None:
+        result, error = None, None
+        async with self._semaphore:
+            try:
+                result = await self._fetch(watch.session_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                error = e
+
+        watch.in_flight = False
+        if self._watches.get(watch.session_id) is not watch:
+            return
+
+        delay = self._complete(watch, result, error)
+        if delay is None:
+            del self._watches[watch.session_id]
+            for future in watch.waiters:
+                if not future.done():
+                    if watch.error is not None:
+                        future.set_exception(watch.error)
+                    else:
+                        future.set_result(watch.result)
+        else:
+            self._push(watch, delay)
+            self._wakeup.set()
@@ -0,0 +1,261 @@
+"""
+Client-side token-bucket rate limiting
+"""
+
+import asyncio
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+from ..errors import ClientRateLimitError
+
+
+class BucketBackend:
+    """
+    Storage for token-bucket state
+
+    Implementations must make ``acquire`` atomic for their sharing scope
+    (threads for the in-memory backend, processes for the file backend).
+    Backends whose ``acquire`` blocks on I/O override ``acquire_async``
+    so the async client never runs it on the event loop.
+    """
+
+    def acquire(self, key: str, rate: float, capacity: float, tokens: float = 1.0) -> float:
+        """
+        Try to take tokens from a bucket
+
+        Args:
+            key: Bucket name
+            rate: Refill rate in tokens per second
+            capacity: Maximum bucket size (burst)
+            tokens: Tokens to take
+
+        Returns:
+            0.0 if the tokens were taken, otherwise seconds until they
+            will be available (nothing is taken in that case)
+        """
+        raise NotImplementedError
+
+    async def acquire_async(
+        self,
+        key: str,
+        rate: float,
+        capacity: float,
+        tokens: float = 1.0
+    ) -> float:
+        """
+        Async variant of ``acquire``
+
+        The default calls ``acquire`` directly, which suits backends that
+        never block.
+        """
+        return self.acquire(key, rate, capacity, tokens)
+
+
+def _refill(level: float, updated: float, now: float, rate: float, capacity: float) -> float:
+    return min(capacity, level + (now - updated) * rate)
+
+
+class InMemoryBucketBackend(BucketBackend):
+    """Thread-safe token buckets shared within one process"""
+
+    def __init__(self):
+        self._buckets = {}  # type: Dict[str, list]
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, rate: float, capacity: float, tokens: float = 1.0) -> float:
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [capacity, now]
+
+            level = _refill(bucket[0], bucket[1], now, rate, capacity)
+            bucket[1] = now
+            if level >= tokens:
+                bucket[0] = level - tokens
+                return 0.0
+
+            bucket[0] = level
+            return (tokens - level) / rate
+
+
+class FileLockBucketBackend(BucketBackend):
+    """
+    Token buckets shared between processes on one host
+
+    Each bucket is a small file holding its level and last refill time,
+    guarded by an exclusive ``flock``. Use it to coordinate gunicorn or
+    multiprocessing workers that share one account's rate limit.
+
+    Example:
+        backend = FileLockBucketBackend('/var/run/verifly')
+    """
+
+    _STATE = struct.Struct('<dd')
+
+    def __init__(self, directory: Optional[str] = None, prefix: str = 'verifly'):
+        """
+        Initialize file-lock backend
+
+        Args:
+            directory: Directory for bucket files (default: system temp dir)
+            prefix: File name prefix, to separate independent limiters
+
+        Raises:
+            RuntimeError: If file locking is not supported on this platform
+        """
+        if fcntl is None:
+            raise RuntimeError('FileLockBucketBackend requires fcntl (POSIX only)')
+
+        self.directory = directory or tempfile.gettempdir()
+        self.prefix = prefix
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        safe_key = re.sub(r'[^A-Za-z0-9_.-]', '_', key)
+        return os.path.join(self.directory, f'{self.prefix}-{safe_key}.bucket')
+
+    def acquire(self, key: str, rate: float, capacity: float, tokens: float = 1.0) -> float:
+        # Opened per call so forked workers never share a lock description
+        fd = os.open(self._path(key), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            now = time.time()
+            raw = os.pread(fd, self._STATE.size, 0)
+            if len(raw) == self._STATE.size:
+                level, updated = self._STATE.unpack(raw)
+                level = _refill(level, updated, now, rate, capacity)
+            else:
+                level = capacity
+
+            if level >= tokens:
+                wait = 0.0
+                level -= tokens
+            else:
+                wait = (tokens - level) / rate
+
+            os.pwrite(fd, self._STATE.pack(level, now), 0)
+            return wait
+        finally:
+            os.close(fd)
+
+    async def acquire_async(
+        self,
+        key: str,
+        rate: float,
+        capacity: float,
+        tokens: float = 1.0
+    ) -> float:
+        # flock waits for other processes; keep it off the event loop
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.acquire, key, rate, capacity, tokens)
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter applied per endpoint class
+
+    Endpoint classes are 'create', 'status', 'balance' and 'action'.
+    Classes without a configured limit are not throttled.
+
+    Example:
+        limiter = RateLimiter(
+            limits={'create': (5, 10), 'status': (50, 100)},
+            backend=FileLockBucketBackend(),
+            block=True
+        )
+        verifly = Verifly(api_key='...', secret_key='...', rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, Tuple[float, float]],
+        backend: Optional[BucketBackend] = None,
+        block: bool = True,
+        max_wait: Optional[float] = None
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            limits: Mapping of endpoint class to (requests per second, burst size)
+            backend: Bucket storage (default: InMemoryBucketBackend())
+            block: Wait for a token (True) or fail fast with ClientRateLimitError (False)
+            max_wait: Longest time to block before failing (default: unbounded)
+        """
+        for endpoint, (rate, burst) in limits.items():
+            if rate <= 0 or burst < 1:
+                raise ValueError(f'Invalid rate limit for {endpoint!r}: {(rate, burst)}')
+
+        self.limits = dict(limits)
+        self.backend = backend or InMemoryBucketBackend()
+        self.block = block
+        self.max_wait = max_wait
+
+    def _check(self, endpoint: str, block: bool, waited: float, wait: float) -> None:
+        if not block or (self.max_wait is not None and waited + wait > self.max_wait):
+            error = ClientRateLimitError(f'Client-side rate limit exceeded for {endpoint!r}')
+            error.retry_after = wait
+            raise error
+
+    def acquire(self, endpoint: str, block: Optional[bool] = None) -> None:
+        """
+        Take a token for an endpoint class, blocking if configured
+
+        Args:
+            endpoint: Endpoint class
+            block: Override the limiter's blocking mode
+
+        Raises:
+            ClientRateLimitError: If no token is available and not blocking
+        """
+        limit = self.limits.get(endpoint)
+        if limit is None:
+            return
+
+        block = self.block if block is None else block
+        rate, burst = limit
+        waited = 0.0
+        while True:
+            wait = self.backend.acquire(endpoint, rate, burst)
+            if not wait:
+                return
+            self._check(endpoint, block, waited, wait)
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(self, endpoint: str, block: Optional[bool] = None) -> None:
+        """
+        Take a token for an endpoint class without blocking the event loop
+
+        Args:
+            endpoint: Endpoint class
+            block: Override the limiter's blocking mode
+
+        Raises:
+            ClientRateLimitError: If no token is available and not blocking
+        """
+        limit = self.limits.get(endpoint)
+        if limit is None:
+            return
+
+        block = self.block if block is None else block
+        rate, burst = limit
+        waited = 0.0
+        while True:
+            wait = await self.backend.acquire_async(endpoint, rate, burst)
+            if not wait:
+                return
+            self._check(endpoint, block, waited, wait)
+            await asyncio.sleep(wait)
+            waited += wait
@@ -0,0 +1,68 @@
+"""
+Seen-signature stores for webhook replay protection
+"""
+
+from .cache import TTLCache
+
+
+class ReplayStore:
+    """
+    Interface for recording webhook signatures that have been processed
+
+    Implement ``add`` and ``discard`` on top of a shared backend (for
+    example Redis ``SET key 1 NX EX ttl`` and ``DEL key``) to deduplicate
+    across processes or hosts.
+    """
+
+    def add(self, key: str, ttl: float) -> bool:
+        """
+        Record a key if it has not been seen
+
+        Must be atomic: of several concurrent calls with the same key,
+        exactly one returns True.
+
+        Args:
+            key: Delivery key (the webhook signature)
+            ttl: Seconds to remember the key
+
+        Returns:
+            True if the key is new, False if it is a duplicate
+        """
+        raise NotImplementedError
+
+    def discard(self, key: str) -> None:
+        """
+        Forget a key, so a redelivery of a refused webhook is accepted
+
+        Args:
+            key: Delivery key (the webhook signature)
+        """
+        raise NotImplementedError
+
+
+class InMemoryReplayStore(ReplayStore):
+    """
+    Bounded in-process replay store
+
+    Remembers up to ``max_entries`` signatures, evicting the least
+    recently seen first. Keep ``max_entries`` above the number of
+    deliveries expected within the tolerance window.
+    """
+
+    def __init__(self, max_entries: int = 100000):
+        """
+        Initialize store
+
+        Args:
+            max_entries: Maximum signatures remembered (default: 100000)
+        """
+        self._cache = TTLCache(maxsize=max_entries)
+
+    def add(self, key: str, ttl: float) -> bool:
+        return self._cache.add(key, ttl=ttl)
+
+    def discard(self, key: str) -> None:
+        self._cache.pop(key)
+
+    def __len__(self) -> int:
+        return len(self._cache)
@@ -2,11 +2,14 @@
 HTTP Request Handler with HMAC-SHA256 Authentication
 """
 
-import hashlib
-import hmac
+import logging
+import threading
 import time
-from typing import Dict, Any, Optional
+import weakref
+from concurrent import futures
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..errors import (
     VeriflyError,
@@ -15,14 +18,61 @@ from ..errors import (
     InsufficientBalanceError,
     NotFoundError,
     RateLimitError,
-    ServerError
+    ServerError,
+    NetworkError,
+    RequestTimeoutError
 )
+from .circuit import CircuitBreaker
+from .endpoints import endpoint_class
+from .failover import EndpointPool, HedgePolicy
+from .hooks import RequestEvent, RequestHooks, emit
+from .log import Redacted, Truncated, debug_logger, enable_debug_logging, logger, next_request_id
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, IDEMPOTENT_METHODS, parse_retry_after
+from .serializer import Serializer, get_default_serializer
+from .signer import Signer
+from .singleflight import SingleFlight
 
 
-class RequestHandler:
-    """Handles HTTP requests with HMAC-SHA256 authentication"""
+BASE_URL = 'https://www.verifly.net'
+USER_AGENT = 'Verifly-Python-SDK/1.0.0'
+
+# Signed in place of a body for requests that carry no data
+EMPTY_PAYLOAD = b'{}'
+
+ERROR_MAP = {
+    400: ValidationError,
+    401: AuthenticationError,
+    402: InsufficientBalanceError,
+    404: NotFoundError,
+    429: RateLimitError,
+    500: ServerError,
+    502: ServerError,
+    503: ServerError,
+    504: ServerError
+}
+
+
+class BaseRequestHandler:
+    """Transport-independent HMAC signing and error mapping"""
     
-    def __init__(self, api_key: str, secret_key: str, timeout: int = 30, debug: bool = False):
+    def __init__(
+        self,
+        api_key: str,
+        secret_key: str,
+        timeout: int = 30,
+        debug: bool = False,
+        serializer: Optional[Serializer] = None,
+        signer: Optional[Signer] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        hooks: Optional[Sequence[RequestHooks]] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        base_urls: Optional[Union[Sequence[str], EndpointPool]] = None,
+        hedge: Optional[HedgePolicy] = None
+    ):
         """
         Initialize request handler
         
@@ -31,64 +81,434 @@ class RequestHandler:
             secret_key: Application secret key for HMAC signature
             timeout: Request timeout in seconds
             debug: Enable debug logging
+            serializer: Callable encoding request data to JSON bytes
+                (default: orjson if installed, else the json module)
+            signer: Pre-keyed signer to share (default: built from secret_key)
+            retry_policy: Retry policy for failed requests (default: RetryPolicy())
+            rate_limiter: Optional client-side rate limiter
+            connect_timeout: Connection timeout in seconds (default: timeout)
+            read_timeout: Read timeout in seconds (default: timeout)
+            hooks: Lifecycle hooks notified of every attempt
+            circuit_breaker: Breaker failing requests fast during outages
+            base_urls: API base URLs in order of preference, or an
+                EndpointPool (default: the production API)
+            hedge: Hedging policy for GETs (default: no hedging)
         """
-        self.api_key = api_key
-        self.secret_key = secret_key
-        self.base_url = 'https://www.verifly.net'
+        # API key and signer are swapped together so a request never
+        # pairs one key with the other's signature
+        self._credentials = (
+            api_key, signer if signer is not None else Signer(secret_key)
+        )
+        if isinstance(base_urls, EndpointPool):
+            self.endpoints = base_urls
+        else:
+            self.endpoints = EndpointPool(base_urls or [BASE_URL])
+        self.hedge = hedge
         self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._debug = False
+        self._debug_release = None  # type: Optional[weakref.finalize]
         self.debug = debug
+        self.serializer = serializer or get_default_serializer()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.hooks = list(hooks or ())
+        self.circuit_breaker = circuit_breaker
+        if circuit_breaker is not None:
+            circuit_breaker.add_listener(self._circuit_changed)
+    
+    @property
+    def debug(self) -> bool:
+        """Whether debug logging to stderr is enabled"""
+        return self._debug
+    
+    @debug.setter
+    def debug(self, enabled: bool) -> None:
+        enabled = bool(enabled)
+        if enabled and self._debug_release is None:
+            enable_debug_logging(True)
+            # Counts the client out even if it is discarded without close()
+            self._debug_release = weakref.finalize(self, enable_debug_logging, False)
+        elif not enabled and self._debug_release is not None:
+            self._debug_release()
+            self._debug_release = None
+        self._debug = enabled
+    
+    @property
+    def logger(self) -> logging.Logger:
+        """Logger for this client's records; DEBUG is always on in debug mode"""
+        return debug_logger if self._debug else logger
+    
+    @property
+    def base_url(self) -> str:
+        """Preferred API base URL"""
+        return self.endpoints.urls[0]
+    
+    @base_url.setter
+    def base_url(self, base_url: str) -> None:
+        self.endpoints = EndpointPool([base_url])
+    
+    @property
+    def api_key(self) -> str:
+        """API key sent with every request"""
+        return self._credentials[0]
+    
+    @api_key.setter
+    def api_key(self, api_key: str) -> None:
+        self._credentials = (api_key, self._credentials[1])
+    
+    @property
+    def signer(self) -> Signer:
+        """Signer used for request signatures"""
+        return self._credentials[1]
+    
+    @signer.setter
+    def signer(self, signer: Signer) -> None:
+        self._credentials = (self._credentials[0], signer)
+    
+    @property
+    def secret_key(self) -> str:
+        """Secret key used for request signatures"""
+        return self.signer.secret_key
+    
+    @secret_key.setter
+    def secret_key(self, secret_key: str) -> None:
+        self.signer = Signer(secret_key)
+    
+    def set_credentials(self, api_key: str, signer: Signer) -> None:
+        """
+        Atomically replace the API key and signer
         
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': 'Verifly-Python-SDK/1.0.0'
-        })
+        In-flight requests keep the credentials they started with.
+        
+        Args:
+            api_key: New API key
+            signer: Signer for the new secret key
+        """
+        self._credentials = (api_key, signer)
     
-    def _generate_signature(self, payload: str, timestamp: str) -> str:
+    def _generate_signature(
+        self,
+        payload: Union[str, bytes],
+        timestamp: str,
+        signer: Optional[Signer] = None,
+        idempotency_key: Optional[str] = None
+    ) -> str:
         """
         Generate HMAC-SHA256 signature
         
         Args:
-            payload: Request payload as JSON string
+            payload: Request payload as serialized JSON bytes (or str)
             timestamp: Current timestamp
+            signer: Signer to use (default: the current signer)
+            idempotency_key: Idempotency key to cover with the signature
             
         Returns:
             HMAC signature in hexadecimal
         """
-        message = f"{payload}{timestamp}"
-        signature = hmac.new(
-            self.secret_key.encode('utf-8'),
-            message.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        
-        if self.debug:
-            print(f"[Verifly Debug] Generating signature:")
-            print(f"  Payload: {payload}")
-            print(f"  Timestamp: {timestamp}")
-            print(f"  Message: {message}")
-            print(f"  Signature: {signature}")
+        if isinstance(payload, str):
+            payload = payload.encode('utf-8')
+        return (signer or self.signer).sign(payload, timestamp, idempotency_key)
+    
+    def _encode_body(self, data: Optional[Any]) -> Tuple[Optional[bytes], bytes]:
+        """
+        Serialize request data once
         
-        return signature
+        Args:
+            data: Request body data
+            
+        Returns:
+            Tuple of (body bytes to send or None, bytes to sign)
+        """
+        if data is None:
+            return None, EMPTY_PAYLOAD
+        body = self.serializer(data)
+        return body, body
     
-    def _get_headers(self, payload: str) -> Dict[str, str]:
+    def _get_headers(
+        self,
+        payload: Union[str, bytes],
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, str]:
         """
         Generate request headers with HMAC signature
         
         Args:
-            payload: Request payload as JSON string
+            payload: Serialized request payload that will be signed
+            idempotency_key: Optional Idempotency-Key header value, also
+                covered by the signature
             
         Returns:
             Headers dict with authentication
         """
+        api_key, signer = self._credentials
         timestamp = str(int(time.time()))
-        signature = self._generate_signature(payload, timestamp)
+        signature = self._generate_signature(payload, timestamp, signer, idempotency_key)
         
-        return {
-            'X-API-Key': self.api_key,
+        headers = {
+            'X-API-Key': api_key,
             'X-Signature': signature,
             'X-Timestamp': timestamp
         }
+        if idempotency_key:
+            headers['Idempotency-Key'] = idempotency_key
+        return headers
+    
+    def _circuit_changed(self, endpoint: str, old: str, new: str) -> None:
+        emit(self.hooks, 'on_circuit_state_change', endpoint, old, new)
+    
+    def _start_event(
+        self,
+        request_id: int,
+        method: str,
+        path: str,
+        endpoint: str,
+        attempt: int,
+        body: Optional[bytes],
+        serialize: float
+    ) -> RequestEvent:
+        """Build the event for an attempt and notify on_request_start"""
+        event = RequestEvent(
+            request_id, method, path, endpoint, attempt,
+            len(body) if body is not None else 0, serialize
+        )
+        emit(self.hooks, 'on_request_start', event)
+        return event
+    
+    def _end_event(
+        self,
+        event: RequestEvent,
+        error: Optional[BaseException] = None,
+        retry_delay: Optional[float] = None
+    ) -> None:
+        """Notify on_request_end, then on_retry or on_error for failures"""
+        event.timings['total'] = time.perf_counter() - event.started
+        if error is not None:
+            event.error = error
+            if event.status is None:
+                event.status = getattr(error, 'status_code', None)
+        emit(self.hooks, 'on_request_end', event)
+        if error is None:
+            return
+        if retry_delay is not None:
+            event.retry_delay = retry_delay
+            emit(self.hooks, 'on_retry', event)
+        else:
+            emit(self.hooks, 'on_error', event)
+    
+    @staticmethod
+    def _leg_event(event: Optional[RequestEvent]) -> Optional[RequestEvent]:
+        """Event recording one leg of a hedged attempt"""
+        if event is None:
+            return None
+        return RequestEvent(
+            event.request_id, event.method, event.path, event.endpoint_class,
+            event.attempt, event.request_size, event.timings['serialize']
+        )
+    
+    @staticmethod
+    def _adopt(event: Optional[RequestEvent], leg: Optional[RequestEvent]) -> None:
+        """Copy the deciding leg's response details onto the attempt's event"""
+        if event is None or leg is None:
+            return
+        event.status = leg.status
+        event.response_size = leg.response_size
+        for phase in ('sign', 'connect', 'ttfb', 'decode'):
+            event.timings[phase] = leg.timings[phase]
+    
+    def _hedged(
+        self,
+        event: Optional[RequestEvent],
+        request_id: int,
+        method: str,
+        path: str,
+        delay: float
+    ) -> None:
+        """Note that a hedge request was sent for an attempt"""
+        self.logger.debug('[%d] Hedging %s %s after %.1fms', request_id, method, path, delay * 1000)
+        if event is not None:
+            event.hedged = True
+            emit(self.hooks, 'on_hedge', event)
+    
+    def _log_request(
+        self,
+        request_id: int,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[bytes],
+        params: Optional[Dict[str, Any]]
+    ) -> None:
+        """Log an outgoing attempt with credentials redacted"""
+        self.logger.debug(
+            '[%d] %s %s params=%s key=%s signature=%s body=%s',
+            request_id, method, url, params,
+            Redacted(headers.get('X-API-Key')), Redacted(headers.get('X-Signature')),
+            Truncated(body)
+        )
+    
+    def _log_response(self, request_id: int, status: int, content: bytes, started: float) -> None:
+        """Log a response with its elapsed time"""
+        self.logger.debug(
+            '[%d] %d in %.1fms body=%s',
+            request_id, status, (time.perf_counter() - started) * 1000, Truncated(content)
+        )
+    
+    @staticmethod
+    def _flight_key(method: str, path: str, params: Optional[Dict[str, Any]]) -> Tuple:
+        """Identity of a request for coalescing"""
+        if not params:
+            return method, path
+        return method, path, tuple(sorted((k, str(v)) for k, v in params.items()))
+    
+    @staticmethod
+    def _is_idempotent(method: str, idempotency_key: Optional[str]) -> bool:
+        """Whether a request may be safely retried"""
+        return bool(idempotency_key) or method.upper() in IDEMPOTENT_METHODS
+    
+    def _error_for_status(
+        self,
+        status: int,
+        data: Any,
+        headers: Optional[Any] = None
+    ) -> VeriflyError:
+        """
+        Convert HTTP error status and decoded body to appropriate exception
+        
+        Args:
+            status: HTTP status code
+            data: Decoded JSON error body
+            headers: Response headers (used for Retry-After)
+            
+        Returns:
+            Appropriate VeriflyError subclass
+        """
+        if not isinstance(data, dict):
+            data = {}
+        
+        message = data.get('message') or data.get('error') or 'Unknown error'
+        error_class = ERROR_MAP.get(status, VeriflyError)
+        error = error_class(message, status, data)
+        if headers is not None:
+            error.retry_after = parse_retry_after(headers.get('Retry-After'))
+        return error
+
+
+class RequestHandler(BaseRequestHandler):
+    """Handles HTTP requests with HMAC-SHA256 authentication"""
+    
+    def __init__(
+        self,
+        api_key: str,
+        secret_key: str,
+        timeout: int = 30,
+        debug: bool = False,
+        serializer: Optional[Serializer] = None,
+        signer: Optional[Signer] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        hooks: Optional[Sequence[RequestHooks]] = None,
+        coalesce_requests: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        base_urls: Optional[Union[Sequence[str], EndpointPool]] = None,
+        hedge: Optional[HedgePolicy] = None
+    ):
+        """
+        Initialize request handler
+        
+        Args:
+            api_key: Verifly API key
+            secret_key: Application secret key for HMAC signature
+            timeout: Request timeout in seconds
+            debug: Enable debug logging
+            serializer: Callable encoding request data to JSON bytes
+            signer: Pre-keyed signer to share
+            retry_policy: Retry policy for failed requests
+            rate_limiter: Optional client-side rate limiter
+            connect_timeout: Connection timeout in seconds (default: timeout)
+            read_timeout: Read timeout in seconds (default: timeout)
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Keep-alive connections retained per host
+            pool_block: Treat pool_maxsize as a hard cap on concurrent
+                connections instead of opening (and discarding) extras
+            hooks: Lifecycle hooks notified of every attempt
+            coalesce_requests: Share one in-flight request between
+                concurrent identical GETs
+            circuit_breaker: Breaker failing requests fast during outages
+            base_urls: API base URLs in order of preference, or an EndpointPool
+            hedge: Hedging policy for GETs; hedged GETs run on a pool of
+                ``2 * pool_maxsize`` threads
+        """
+        super().__init__(
+            api_key=api_key,
+            secret_key=secret_key,
+            timeout=timeout,
+            debug=debug,
+            serializer=serializer,
+            signer=signer,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            hooks=hooks,
+            circuit_breaker=circuit_breaker,
+            base_urls=base_urls,
+            hedge=hedge
+        )
+        
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'User-Agent': USER_AGENT
+        })
+        
+        # Retries are handled by RetryPolicy, not urllib3
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=0
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        self._flights = SingleFlight() if coalesce_requests else None
+        self._hedge_workers = 2 * pool_maxsize
+        self._hedge_executor = None  # type: Optional[futures.ThreadPoolExecutor]
+        self._hedge_lock = threading.Lock()
+    
+    def close(self) -> None:
+        """Close pooled connections and leave debug mode"""
+        self.debug = False
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+            self._hedge_executor = None
+        self.session.close()
+    
+    def _hedge_pool(self) -> futures.ThreadPoolExecutor:
+        if self._hedge_executor is None:
+            with self._hedge_lock:
+                if self._hedge_executor is None:
+                    self._hedge_executor = futures.ThreadPoolExecutor(
+                        max_workers=self._hedge_workers,
+                        thread_name_prefix='verifly-hedge'
+                    )
+        return self._hedge_executor
+    
+    def _requests_timeout(self, timeout: float) -> Union[float, Tuple[float, float]]:
+        """Split an attempt timeout into requests' (connect, read) form"""
+        if self.connect_timeout is None and self.read_timeout is None:
+            return timeout
+        return (
+            min(timeout, self.connect_timeout or timeout),
+            min(timeout, self.read_timeout or timeout)
+        )
     
     def _handle_error(self, response: requests.Response) -> VeriflyError:
         """
@@ -102,41 +522,31 @@ class RequestHandler:
         """
         try:
             data = response.json()
-        except:
+        except ValueError:
             data = {}
         
-        message = data.get('message') or data.get('error') or 'Unknown error'
-        status = response.status_code
-        
-        error_map = {
-            400: ValidationError,
-            401: AuthenticationError,
-            402: InsufficientBalanceError,
-            404: NotFoundError,
-            429: RateLimitError,
-            500: ServerError,
-            502: ServerError,
-            503: ServerError
-        }
-        
-        error_class = error_map.get(status, VeriflyError)
-        return error_class(message, status, data)
+        return self._error_for_status(response.status_code, data, response.headers)
     
     def request(
         self,
         method: str,
         path: str,
         data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Make authenticated HTTP request
         
+        Transient failures are retried according to the retry policy when
+        the request is idempotent (GET, or sent with an idempotency key).
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             path: API endpoint path
             data: Request body data
             params: URL query parameters
+            idempotency_key: Idempotency-Key header; makes the request retryable
             
         Returns:
             Response data as dict
@@ -144,56 +554,260 @@ class RequestHandler:
         Raises:
             VeriflyError: On API errors
         """
-        url = f"{self.base_url}{path}"
+        hooks = self.hooks
+        hedge = self.hedge if method == 'GET' else None
+        
+        # Encode once: the signed bytes are the bytes sent
+        if hooks:
+            started = time.perf_counter()
+        body, payload = self._encode_body(data)
+        serialize = time.perf_counter() - started if hooks else None
         
-        # Prepare payload
-        import json
-        payload = json.dumps(data or {}, separators=(',', ':'))
+        idempotent = self._is_idempotent(method, idempotency_key)
+        endpoint = endpoint_class(method, path)
+        retry = self.retry_policy.start()
+        request_id = next_request_id()
+        breaker = self.circuit_breaker
+        avoid = None
         
+        while True:
+            base_url = self.endpoints.pick(avoid)
+            event = None
+            if hooks:
+                event = self._start_event(
+                    request_id, method, path, endpoint, retry.attempt, body, serialize
+                )
+            admitted = False
+            try:
+                # Breaker first: rejected requests must not spend rate budget
+                if breaker is not None:
+                    probe = breaker.allow(endpoint)
+                    admitted = True
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(endpoint)
+                timeout = retry.attempt_timeout(self.timeout)
+                if hedge is None:
+                    result = self._send_to(
+                        base_url, method, path, body, payload, params, idempotency_key,
+                        timeout, request_id, event
+                    )
+                else:
+                    result = self._send_hedged(
+                        base_url, hedge, endpoint, method, path, body, payload, params,
+                        timeout, request_id, event
+                    )
+                if admitted:
+                    breaker.record(endpoint, None, probe)
+                if event is not None:
+                    self._end_event(event)
+                return result
+            except VeriflyError as e:
+                if admitted:
+                    breaker.record(endpoint, e, probe)
+                delay = retry.next_delay(e, idempotent)
+                if event is not None:
+                    self._end_event(event, e, delay)
+                if delay is None:
+                    self.logger.debug('[%d] %s %s failed: %r', request_id, method, path, e)
+                    raise
+                if CircuitBreaker.is_failure(e):
+                    # Fail over to another base URL at once; back off
+                    # only when retrying the same one
+                    avoid = base_url
+                    if self.endpoints.pick(avoid) != base_url:
+                        delay = 0.0
+                self.logger.info(
+                    '[%d] Retrying %s %s in %.2fs (attempt %d): %s',
+                    request_id, method, path, delay, retry.attempt, e
+                )
+                time.sleep(delay)
+            except BaseException as e:
+                # Cancellation or an unexpected error still ends the attempt
+                if admitted:
+                    breaker.record(endpoint, e, probe)
+                if event is not None:
+                    self._end_event(event, e)
+                raise
+    
+    def _send_to(
+        self,
+        base_url: str,
+        method: str,
+        path: str,
+        body: Optional[bytes],
+        payload: bytes,
+        params: Optional[Dict[str, Any]],
+        idempotency_key: Optional[str],
+        timeout: float,
+        request_id: int,
+        event: Optional[RequestEvent]
+    ) -> Dict[str, Any]:
+        """Send one attempt to a base URL and record the URL's health"""
+        try:
+            result = self._send(
+                method, base_url + path, body, payload, params, idempotency_key,
+                timeout, request_id, event
+            )
+        except VeriflyError as e:
+            self.endpoints.record(base_url, e)
+            raise
+        self.endpoints.record(base_url)
+        return result
+    
+    def _send_hedged(
+        self,
+        base_url: str,
+        hedge: HedgePolicy,
+        endpoint: str,
+        method: str,
+        path: str,
+        body: Optional[bytes],
+        payload: bytes,
+        params: Optional[Dict[str, Any]],
+        timeout: float,
+        request_id: int,
+        event: Optional[RequestEvent]
+    ) -> Dict[str, Any]:
+        """
+        Send an attempt, hedging it with a second request if it is slow
+        
+        Both requests run on the hedge thread pool; the first successful
+        response wins. The losing request cannot be interrupted once it
+        is on the wire: it finishes in the background, its result is
+        discarded and its connection goes back to the pool.
+        
+        Returns:
+            Response data as dict
+        
+        Raises:
+            VeriflyError: The first error, if both requests fail
+        """
+        executor = self._hedge_pool()
+        legs = []  # type: List[Tuple[futures.Future, Optional[RequestEvent], float]]
+        
+        def start(url: str) -> futures.Future:
+            leg = self._leg_event(event)
+            future = executor.submit(
+                self._send_to, url, method, path, body, payload, params, None,
+                timeout, request_id, leg
+            )
+            legs.append((future, leg, time.perf_counter()))
+            return future
+        
+        delay = hedge.delay(endpoint)
+        first = start(base_url)
+        if not futures.wait([first], timeout=delay).done:
+            start(self.endpoints.pick(base_url))
+            self._hedged(event, request_id, method, path, delay)
+        
+        by_future = {future: (leg, started) for future, leg, started in legs}
+        error = None  # type: Optional[VeriflyError]
+        error_leg = None
+        for future in futures.as_completed(by_future):
+            leg, started = by_future[future]
+            try:
+                result = future.result()
+            except VeriflyError as e:
+                if error is None:
+                    error, error_leg = e, leg
+                continue
+            for other in by_future:
+                other.cancel()
+            hedge.observe(endpoint, time.perf_counter() - started)
+            self._adopt(event, leg)
+            return result
+        
+        self._adopt(event, error_leg)
+        raise error
+    
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        payload: bytes,
+        params: Optional[Dict[str, Any]],
+        idempotency_key: Optional[str],
+        timeout: float,
+        request_id: int = 0,
+        event: Optional[RequestEvent] = None
+    ) -> Dict[str, Any]:
+        """
+        Perform a single signed HTTP attempt
+        
+        Each attempt is signed with a fresh timestamp. When an event is
+        given, its status, sizes and phase timings are filled in.
+        
+        Returns:
+            Response data as dict
+            
+        Raises:
+            VeriflyError: On API or network errors
+        """
         # Generate headers with signature
-        headers = self._get_headers(payload)
+        if event is not None:
+            signing = time.perf_counter()
+        headers = self._get_headers(payload, idempotency_key)
+        if event is not None:
+            event.timings['sign'] = time.perf_counter() - signing
         
-        if self.debug:
-            print(f"[Verifly Debug] Request:")
-            print(f"  Method: {method}")
-            print(f"  URL: {url}")
-            print(f"  Headers: {headers}")
-            print(f"  Data: {data}")
-            print(f"  Params: {params}")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self._log_request(request_id, method, url, headers, body, params)
+            started = time.perf_counter()
         
         try:
             response = self.session.request(
                 method=method,
                 url=url,
-                json=data,
+                data=body,
                 params=params,
                 headers=headers,
-                timeout=self.timeout
+                timeout=self._requests_timeout(timeout)
             )
             
-            if self.debug:
-                print(f"[Verifly Debug] Response:")
-                print(f"  Status: {response.status_code}")
-                print(f"  Body: {response.text}")
+            if debug:
+                self._log_response(request_id, response.status_code, response.content, started)
+            
+            if event is not None:
+                event.status = response.status_code
+                event.response_size = len(response.content)
+                # Time from sending the request until the headers arrived
+                event.timings['ttfb'] = response.elapsed.total_seconds()
             
             # Check for errors
             if not response.ok:
                 raise self._handle_error(response)
             
-            return response.json()
+            if event is None:
+                return response.json()
+            decoding = time.perf_counter()
+            result = response.json()
+            event.timings['decode'] = time.perf_counter() - decoding
+            return result
             
+        except requests.Timeout:
+            raise RequestTimeoutError(f"Request timeout after {timeout:g}s")
         except requests.RequestException as e:
-            if isinstance(e, requests.Timeout):
-                raise VeriflyError(f"Request timeout after {self.timeout}s")
-            raise VeriflyError(str(e))
+            raise NetworkError(str(e))
     
     def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Make GET request"""
-        return self.request('GET', path, params=params)
+        """Make GET request, joining an identical one in flight if coalescing"""
+        if self._flights is None:
+            return self.request('GET', path, params=params)
+        return self._flights.do(
+            self._flight_key('GET', path, params),
+            lambda: self.request('GET', path, params=params)
+        )
     
-    def post(self, path: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def post(
+        self,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Make POST request"""
-        return self.request('POST', path, data=data)
+        return self.request('POST', path, data=data, idempotency_key=idempotency_key)
     
     def put(self, path: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make PUT request"""
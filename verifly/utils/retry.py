@@ -0,0 +1,188 @@
+"""
+Retry Policy with exponential backoff, jitter and Retry-After support
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+from ..errors import VeriflyError, NetworkError
+
+# HTTP methods that are safe to repeat without an idempotency key
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+# Status codes that indicate a transient condition worth retrying
+RETRYABLE_STATUSES = (429, 502, 503, 504)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if missing or malformed
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Configurable retry policy for API requests
+
+    Delays follow "decorrelated jitter" backoff: each delay is drawn
+    uniformly between ``backoff_base`` and three times the previous delay,
+    capped at ``backoff_max``. A server-provided Retry-After overrides the
+    computed delay; one longer than ``max_retry_after`` ends retrying.
+    Only idempotent requests are retried: GETs, and POSTs sent with an
+    idempotency key.
+
+    Example:
+        verifly = Verifly(
+            api_key='your-api-key',
+            secret_key='your-secret-key',
+            retry=RetryPolicy(max_attempts=5, deadline=10)
+        )
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        retry_statuses: Iterable[int] = RETRYABLE_STATUSES,
+        respect_retry_after: bool = True,
+        deadline: Optional[float] = None,
+        max_retry_after: Optional[float] = 60.0
+    ):
+        """
+        Initialize retry policy
+
+        Args:
+            max_attempts: Total attempts per request, including the first (default: 3)
+            backoff_base: Minimum delay between attempts in seconds (default: 0.5)
+            backoff_max: Maximum computed delay in seconds (default: 8.0)
+            retry_statuses: HTTP status codes to retry (default: 429, 502, 503, 504)
+            respect_retry_after: Honor the Retry-After response header (default: True)
+            deadline: Total time budget per request in seconds, including
+                all attempts and delays (default: no deadline)
+            max_retry_after: Longest Retry-After in seconds the caller will
+                wait; when the server asks for more, the error is raised
+                instead (default: 60; None for no limit)
+        """
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1')
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.deadline = deadline
+        self.max_retry_after = max_retry_after
+
+    @classmethod
+    def disabled(cls) -> 'RetryPolicy':
+        """Return a policy that never retries"""
+        return cls(max_attempts=1)
+
+    def is_retryable(self, error: VeriflyError) -> bool:
+        """
+        Check whether an error represents a transient failure
+
+        Args:
+            error: Error raised by an attempt
+
+        Returns:
+            True for network failures and retryable status codes
+        """
+        if isinstance(error, NetworkError):
+            return True
+        return error.status_code in self.retry_statuses
+
+    def start(self) -> 'RetryState':
+        """Begin tracking a new request"""
+        return RetryState(self)
+
+
+class RetryState:
+    """Retry bookkeeping for a single logical request"""
+
+    def __init__(self, policy: RetryPolicy):
+        self.policy = policy
+        self.attempt = 1
+        self.started_at = time.monotonic()
+        self._delay = policy.backoff_base
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left in the deadline budget, or None without a deadline"""
+        if self.policy.deadline is None:
+            return None
+        return self.policy.deadline - (time.monotonic() - self.started_at)
+
+    def attempt_timeout(self, timeout: float) -> float:
+        """
+        Clamp a per-attempt timeout to the remaining deadline budget
+
+        Args:
+            timeout: Configured request timeout in seconds
+
+        Returns:
+            Timeout to use for the next attempt
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        return max(0.001, min(timeout, remaining))
+
+    def next_delay(self, error: VeriflyError, idempotent: bool) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt
+
+        Args:
+            error: Error raised by the attempt
+            idempotent: Whether the request is safe to repeat
+
+        Returns:
+            Seconds to sleep before the next attempt, or None to give up
+        """
+        policy = self.policy
+        if not idempotent or self.attempt >= policy.max_attempts:
+            return None
+        if not policy.is_retryable(error):
+            return None
+
+        self._delay = min(
+            policy.backoff_max,
+            random.uniform(policy.backoff_base, self._delay * 3)
+        )
+        delay = self._delay
+        if policy.respect_retry_after and error.retry_after is not None:
+            delay = error.retry_after
+            if policy.max_retry_after is not None and delay > policy.max_retry_after:
+                return None
+
+        remaining = self.remaining()
+        if remaining is not None and delay >= remaining:
+            return None
+
+        self.attempt += 1
+        return delay
@@ -0,0 +1,60 @@
+"""
+Request Body Serializers
+
+A serializer turns request data into the exact bytes that are both signed
+and sent over the wire, so the body is encoded only once per request.
+"""
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+Serializer = Callable[[Any], bytes]
+
+
+def json_serializer(data: Any) -> bytes:
+    """
+    Serialize data with the standard library json module
+
+    Args:
+        data: JSON-serializable request data
+
+    Returns:
+        Compact UTF-8 encoded JSON
+    """
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def orjson_serializer(data: Any) -> bytes:
+    """
+    Serialize data with orjson
+
+    Args:
+        data: JSON-serializable request data
+
+    Returns:
+        Compact UTF-8 encoded JSON
+
+    Raises:
+        ImportError: If orjson is not installed
+    """
+    if orjson is None:
+        raise ImportError('orjson is not installed. Install it with: pip install orjson')
+    return orjson.dumps(data)
+
+
+def get_default_serializer() -> Serializer:
+    """
+    Return the fastest serializer available in this environment
+
+    Returns:
+        ``orjson_serializer`` if orjson is installed, else ``json_serializer``
+    """
+    if orjson is not None:
+        return orjson_serializer
+    return json_serializer
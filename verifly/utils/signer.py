@@ -0,0 +1,143 @@
+"""
+HMAC-SHA256 Signer with precomputed key state
+"""
+
+import hashlib
+import hmac
+from typing import Iterable, List, Optional, Tuple, Union
+
+BytesLike = Union[bytes, bytearray, memoryview, str]
+
+
+def _to_bytes(value: BytesLike) -> bytes:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return value
+    return str(value).encode('utf-8')
+
+
+def _signature_bytes(signature: Union[str, bytes]) -> bytes:
+    # Signatures come from request headers; encode rather than compare
+    # str, which raises TypeError for non-ASCII input
+    if isinstance(signature, str):
+        return signature.encode('utf-8', 'surrogatepass')
+    return bytes(signature)
+
+
+class Signer:
+    """
+    Reusable HMAC-SHA256 signer
+
+    The secret key is encoded and the HMAC key schedule computed once.
+    Each signature copies that pre-keyed state and feeds the payload and
+    timestamp incrementally, so no intermediate message is built.
+
+    A request's idempotency key, when present, is appended to the signed
+    message after a newline, so it cannot be changed in transit. Messages
+    without a key are signed exactly as before.
+
+    Example:
+        signer = Signer('your-secret-key')
+        signature = signer.sign(b'{"phone":"5551234567"}', '1700000000')
+    """
+
+    def __init__(self, secret_key: str):
+        """
+        Initialize signer
+
+        Args:
+            secret_key: Application secret key
+        """
+        self.secret_key = secret_key
+        self._mac = hmac.new(secret_key.encode('utf-8'), digestmod=hashlib.sha256)
+
+    def sign(
+        self,
+        payload: BytesLike,
+        timestamp: BytesLike,
+        idempotency_key: Optional[str] = None
+    ) -> str:
+        """
+        Sign payload, timestamp and optional idempotency key
+
+        Args:
+            payload: Payload bytes (str is UTF-8 encoded)
+            timestamp: Timestamp string or bytes
+            idempotency_key: Idempotency-Key header value, if any
+
+        Returns:
+            HMAC signature in hexadecimal
+        """
+        mac = self._mac.copy()
+        mac.update(_to_bytes(payload))
+        mac.update(_to_bytes(timestamp))
+        if idempotency_key:
+            mac.update(b'\n')
+            mac.update(_to_bytes(idempotency_key))
+        return mac.hexdigest()
+
+    def verify(
+        self,
+        payload: BytesLike,
+        timestamp: BytesLike,
+        signature: str,
+        idempotency_key: Optional[str] = None
+    ) -> bool:
+        """
+        Verify a signature in constant time
+
+        Args:
+            payload: Payload bytes (str is UTF-8 encoded)
+            timestamp: Timestamp string or bytes
+            signature: Hexadecimal signature to check
+            idempotency_key: Idempotency-Key header value, if any
+
+        Returns:
+            True if signature is valid; False for malformed input such
+            as non-ASCII characters
+        """
+        if not signature:
+            return False
+        expected = self.sign(payload, timestamp, idempotency_key).encode('ascii')
+        return hmac.compare_digest(expected, _signature_bytes(signature))
+
+    def sign_many(self, items: Iterable[Tuple[BytesLike, BytesLike]]) -> List[str]:
+        """
+        Sign a batch of (payload, timestamp) pairs
+
+        Args:
+            items: Iterable of (payload, timestamp) tuples
+
+        Returns:
+            Signatures in input order
+        """
+        base = self._mac
+        signatures = []
+        for payload, timestamp in items:
+            mac = base.copy()
+            mac.update(_to_bytes(payload))
+            mac.update(_to_bytes(timestamp))
+            signatures.append(mac.hexdigest())
+        return signatures
+
+    def verify_many(self, items: Iterable[Tuple[BytesLike, BytesLike, str]]) -> List[bool]:
+        """
+        Verify a batch of (payload, timestamp, signature) triples
+
+        Args:
+            items: Iterable of (payload, timestamp, signature) tuples
+
+        Returns:
+            Verification results in input order
+        """
+        base = self._mac
+        compare = hmac.compare_digest
+        results = []
+        for payload, timestamp, signature in items:
+            if not signature:
+                results.append(False)
+                continue
+            mac = base.copy()
+            mac.update(_to_bytes(payload))
+            mac.update(_to_bytes(timestamp))
+            results.append(compare(mac.hexdigest().encode('ascii'), _signature_bytes(signature)))
+        return results
@@ -0,0 +1,130 @@
+"""
+Request coalescing
+
+Concurrent calls with the same key share one execution: the first
+caller runs the call, later callers wait for it and receive the same
+result or exception. Nothing is cached once the call completes.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    """One in-flight call and the outcome its waiters receive"""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None  # type: Any
+        self.error = None  # type: Any
+
+
+class SingleFlight:
+    """
+    Thread-safe single-flight group
+
+    Example:
+        flights = SingleFlight()
+        status = flights.do(('GET', path), lambda: fetch(path))
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}  # type: Dict[Hashable, _Call]
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run ``fn`` unless a call with the same key is already in flight
+
+        Args:
+            key: Identity of the call
+            fn: Function to run
+
+        Returns:
+            The result of ``fn``, shared with concurrent callers
+
+        Raises:
+            Exception: Whatever ``fn`` raised, re-raised in every caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    Single-flight group for coroutines on one event loop
+
+    The shared call runs as its own task, so a caller being cancelled
+    does not fail the others; the task is cancelled only when every
+    caller has gone.
+
+    Example:
+        flights = AsyncSingleFlight()
+        status = await flights.do(('GET', path), lambda: fetch(path))
+    """
+
+    def __init__(self):
+        self._calls = {}  # type: Dict[Hashable, Any]
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await ``fn()`` unless a call with the same key is already in flight
+
+        Args:
+            key: Identity of the call
+            fn: Coroutine function to run
+
+        Returns:
+            The result of ``fn()``, shared with concurrent callers
+
+        Raises:
+            Exception: Whatever ``fn()`` raised, re-raised in every caller
+        """
+        entry = self._calls.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(fn())
+            entry = self._calls[key] = [task, 0]
+            task.add_done_callback(lambda _: self._forget(key, entry))
+        task = entry[0]
+        entry[1] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done() and entry[1] == 1:
+                task.cancel()
+            raise
+        finally:
+            entry[1] -= 1
+
+    def _forget(self, key: Hashable, entry: Any) -> None:
+        if self._calls.get(key) is entry:
+            del self._calls[key]
+
+    def __len__(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,168 @@
+"""
+Read-through cache for session status and account balance
+
+Terminal sessions never change, so they are kept for a long time;
+sessions still in progress are kept only briefly, and verified webhook
+events update or drop the cached entry for their session as they
+arrive.
+"""
+
+from typing import Any, Dict, Optional
+
+from .cache import TTLCache
+from .poller import TERMINAL_STATUSES
+
+_BALANCE_KEY = ('balance',)
+
+# Webhook payloads carry no status field; it follows from the event name
+_EVENT_STATUSES = {
+    'verification.completed': 'verified',
+    'verification.failed': 'failed',
+    'verification.expired': 'expired',
+}
+
+
+class StatusCache:
+    """
+    Bounded LRU + TTL cache used by ``verification.get()`` and
+    ``verification.get_balance()``
+
+    Cached values are shared between callers; treat them as read-only.
+
+    Example:
+        verifly = Verifly(
+            api_key, secret_key,
+            cache=StatusCache(maxsize=50000, ttl=2, terminal_ttl=3600, balance_ttl=30)
+        )
+
+        verifly.verification.get(session_id)    # Network
+        verifly.verification.get(session_id)    # Cache, until ttl or a webhook
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        ttl: float = 2.0,
+        terminal_ttl: float = 3600.0,
+        balance_ttl: float = 10.0
+    ):
+        """
+        Initialize cache
+
+        Args:
+            maxsize: Maximum number of cached sessions
+            ttl: Seconds to keep a session that is still in progress (default: 2)
+            terminal_ttl: Seconds to keep a verified, failed, expired or
+                aborted session (default: 3600)
+            balance_ttl: Seconds to keep the account balance (default: 10);
+                0 disables balance caching
+        """
+        self.ttl = ttl
+        self.terminal_ttl = terminal_ttl
+        self.balance_ttl = balance_ttl
+        # One extra slot so the balance entry never evicts a session
+        self._cache = TTLCache(maxsize=maxsize + 1, ttl=ttl)
+
+    def _ttl_for(self, status: Optional[str]) -> float:
+        return self.terminal_ttl if status in TERMINAL_STATUSES else self.ttl
+
+    def get_status(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached session status data
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Status data, or None on a miss
+        """
+        return self._cache.get(session_id)
+
+    def set_status(self, session_id: str, data: Dict[str, Any]) -> None:
+        """
+        Store session status data
+
+        A terminal entry is never replaced by a non-terminal one, so a
+        slow poll that started before a webhook arrived cannot roll the
+        session back.
+
+        Args:
+            session_id: Session ID
+            data: Status data as returned by the API
+        """
+        status = data.get('status')
+        if status not in TERMINAL_STATUSES:
+            current = self._cache.get(session_id)
+            if current is not None and current.get('status') in TERMINAL_STATUSES:
+                return
+        self._cache.set(session_id, data, self._ttl_for(status))
+
+    def invalidate(self, session_id: str) -> None:
+        """
+        Drop a cached session
+
+        Args:
+            session_id: Session ID
+        """
+        self._cache.pop(session_id)
+
+    def get_balance(self) -> Optional[Dict[str, Any]]:
+        """Get cached balance data, or None on a miss"""
+        return self._cache.get(_BALANCE_KEY)
+
+    def set_balance(self, data: Dict[str, Any]) -> None:
+        """
+        Store balance data
+
+        Args:
+            data: Balance data as returned by the API
+        """
+        if self.balance_ttl > 0:
+            self._cache.set(_BALANCE_KEY, data, self.balance_ttl)
+
+    def invalidate_balance(self) -> None:
+        """Drop the cached balance"""
+        self._cache.pop(_BALANCE_KEY)
+
+    def apply_event(self, event: Dict[str, Any]) -> None:
+        """
+        Update the cache from a verified webhook event
+
+        For completed, failed and expired events whose session is
+        cached, the event's fields and the status implied by the event
+        name are merged into the cached entry; for any other event the
+        entry is dropped so the next read fetches it. Registered as a
+        ``Webhook`` listener by the client.
+
+        Args:
+            event: Verified webhook event
+        """
+        if not isinstance(event, dict):
+            return
+        data = event.get('data')
+        if not isinstance(data, dict):
+            data = event
+        session_id = data.get('sessionId')
+        if not session_id:
+            return
+
+        status = _EVENT_STATUSES.get(event.get('event'))
+        current = self._cache.get(session_id)
+        if status is None or current is None:
+            self._cache.pop(session_id)
+            return
+
+        updated = dict(current)
+        updated.update((k, v) for k, v in data.items() if k != 'customData')
+        updated['status'] = status
+        if not isinstance(current, dict):
+            # Typed responses: keep caching the same model class
+            updated = type(current)(updated)
+        self._cache.set(session_id, updated, self._ttl_for(status))
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
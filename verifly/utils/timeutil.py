@@ -0,0 +1,62 @@
+"""
+Timestamp helpers
+"""
+
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+_FORMATS = ('%Y-%m-%dT%H:%M:%S.%f%z', '%Y-%m-%dT%H:%M:%S%z')
+
+
+def parse_datetime(value: Union[str, datetime, None]) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 timestamp as returned by the API
+
+    Args:
+        value: Timestamp such as '2025-01-14T20:00:00.000Z'
+
+    Returns:
+        Timezone-aware datetime (UTC when no offset is given), or None if
+        the value is empty or malformed
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+
+    # Python 3.6's %z only accepts offsets without a colon, e.g. +0000
+    text = value.strip()
+    if text.endswith('Z'):
+        text = text[:-1] + '+0000'
+    elif len(text) > 6 and text[-6] in '+-' and text[-3] == ':':
+        text = text[:-3] + text[-2:]
+
+    for fmt in _FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+
+    for fmt in ('%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S'):
+        try:
+            return datetime.strptime(text, fmt).replace(tzinfo=timezone.utc)
+        except ValueError:
+            continue
+
+    return None
+
+
+def to_epoch(value: Union[str, datetime, None]) -> Optional[float]:
+    """
+    Convert an ISO 8601 timestamp to seconds since the epoch
+
+    Args:
+        value: Timestamp string or datetime
+
+    Returns:
+        POSIX timestamp, or None if the value cannot be parsed
+    """
+    parsed = parse_datetime(value)
+    if parsed is None:
+        return None
+    return parsed.timestamp()